@@ -0,0 +1,78 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+Construction PyInstaller optimisée pour le démarrage
+
+    pyinstaller --noconfirm Gestionnaire_de_tache.spec
+
+Produit dist/Gestionnaire_de_tache/ (mode onedir) : l'exécutable démarre
+sans extraire d'archive dans un dossier temporaire, contrairement au mode
+onefile. Les modules Python sont précompilés (optimize=2) dans le PYZ et
+le graphe de modules est réduit aux dépendances de main.py : les
+bibliothèques optionnelles de requirements.txt ne sont embarquées que si
+une fonctionnalité les utilise (voir HIDDENIMPORTS), et restent importées
+à la demande (core.optional_modules).
+
+Temps jusqu'à la première fenêtre : python benchmarks/startup.py
+"""
+
+# Modules jamais importés par l'application mais tirés par le graphe
+# (imports conditionnels de la bibliothèque standard, outils de packaging)
+EXCLUDES = [
+    # Bibliothèques de requirements.txt non utilisées
+    "reportlab", "plyer", "tkcalendar", "PIL", "babel",
+    # Dépendances facultatives d'openpyxl
+    "numpy", "pandas", "lxml", "defusedxml",
+    # Bibliothèque standard : tests, documentation, réseau, outils
+    "unittest", "doctest", "pydoc", "pydoc_data", "tkinter.test", "test",
+    "lib2to3", "distutils", "setuptools", "pkg_resources", "pip",
+    "email", "http", "xmlrpc", "urllib.request", "ftplib", "smtplib",
+    "multiprocessing", "asyncio", "concurrent", "html",
+    "tarfile", "bz2", "lzma", "pickletools",
+]
+
+# Modules importés dynamiquement, invisibles pour l'analyse de PyInstaller :
+# noms chargés au premier accès par core/__init__ (_LAZY), stockage SQLite
+# choisi à l'exécution (GESTIONNAIRE_STOCKAGE) et bibliothèques chargées
+# par core.optional_modules (export Excel)
+HIDDENIMPORTS = [
+    "core.sqlite_store", "core.profiler", "core.export", "core.reader",
+    "openpyxl", "openpyxl.cell.cell", "openpyxl.utils",
+]
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    hiddenimports=HIDDENIMPORTS,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=EXCLUDES,
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='Gestionnaire_de_tache',
+    icon=['icone.ico'],
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    # UPX réduit la taille mais décompresse chaque DLL au lancement
+    upx=False,
+    console=False,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='Gestionnaire_de_tache',
+)
@@ -0,0 +1,335 @@
+"""
+Banc d'essai
+Mesure le chargement, la sauvegarde, la recherche, le tri, la bascule et
+l'affichage sur des données synthétiques (1k, 10k, 100k éléments)
+
+Usage (depuis la racine du projet):
+    python benchmarks/bench.py                      # 1k, 10k, 100k
+    python benchmarks/bench.py --sizes 1000 10000 --repeat 3
+    xvfb-run python benchmarks/bench.py --render    # avec l'affichage Tk
+    python benchmarks/bench.py --compare benchmarks/results/ancien.json
+
+Les résultats sont écrits en JSON dans benchmarks/results/ (un fichier par
+exécution, nommé d'après le commit) : chaque mesure donne la médiane et le
+minimum de plusieurs passages. --compare signale les mesures plus lentes
+que le seuil par rapport à un résultat précédent (code de sortie 1).
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+from core import (SCHEMA_VERSION, JsonNoteBackend, NoteStore, TaskJournal,  # noqa: E402
+                  TaskStore, atomic_write_json, week_range)
+
+TAILLES = [1000, 10000, 100000]
+DOSSIER_RESULTATS = os.path.join(RACINE, "benchmarks", "results")
+
+MOTS = ("projet rapport réunion courses appel facture révision examen cours "
+        "livre sport médecin voiture banque jardin cuisine voyage école "
+        "présentation budget client équipe code test déploiement").split()
+
+
+# ----------------------------------------------------------------------
+# Données synthétiques
+# ----------------------------------------------------------------------
+
+def phrase(rng, minimum, maximum):
+    """Suite de mots aléatoires"""
+    return " ".join(rng.choice(MOTS) for _ in range(rng.randint(minimum, maximum)))
+
+
+def generate_tasks(chemin, size, seed=1):
+    """Écrit un taches.json au format courant"""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=365)
+    tasks = []
+    for i in range(size):
+        date = start + timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+        tasks.append({
+            "id": i,
+            "text": phrase(rng, 2, 8).capitalize(),
+            "completed": rng.random() < 0.4,
+            "date": date.strftime("%Y-%m-%d %H:%M"),
+            "ts": int(date.timestamp())
+        })
+    atomic_write_json(chemin, {"version": SCHEMA_VERSION, "next_id": size, "tasks": tasks},
+                      backups=0)
+
+
+def generate_notes(chemin, size, seed=2):
+    """Écrit un notes.json à l'ancien format (contenu intégré, découpé au premier chargement)"""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=365)
+    notes = []
+    for i in range(size):
+        created = start + timedelta(seconds=rng.randint(0, 365 * 86400))
+        modified = created + timedelta(seconds=rng.randint(0, 30 * 86400))
+        notes.append({
+            "id": i,
+            "title": phrase(rng, 1, 5).capitalize(),
+            "content": "\n".join(phrase(rng, 5, 15) for _ in range(rng.randint(1, 20))),
+            "date_created": created.strftime("%Y-%m-%d %H:%M:%S"),
+            "date_modified": modified.strftime("%Y-%m-%d %H:%M:%S")
+        })
+    atomic_write_json(chemin, notes, backups=0)
+
+
+# ----------------------------------------------------------------------
+# Mesures
+# ----------------------------------------------------------------------
+
+class Bench:
+    """Collecte des mesures : médiane et minimum de `repeat` passages"""
+
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.results = []
+
+    def measure(self, name, size, run, setup=None, repeat=None, per=1):
+        """
+        Chronomètre run() (setup() non compté, appelé avant chaque passage)
+
+        `per` divise chaque durée, pour une mesure par opération.
+        """
+        durations = []
+        for _ in range(repeat or self.repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            run()
+            durations.append((time.perf_counter() - start) / per)
+
+        result = {
+            "name": name,
+            "size": size,
+            "median_s": statistics.median(durations),
+            "min_s": min(durations),
+            "runs": len(durations),
+        }
+        self.results.append(result)
+        print(f"  {name:<28} {size:>7}  {result['median_s'] * 1000:10.3f} ms")
+        return result
+
+
+def bench_tasks(bench, dossier, size):
+    """Mesures du magasin de tâches (journal JSON)"""
+    chemin = os.path.join(dossier, "taches.json")
+    generate_tasks(chemin, size)
+
+    def open_store():
+        return TaskStore(TaskJournal(chemin))
+
+    bench.measure("tasks.load", size, lambda: open_store().load())
+
+    store = open_store()
+    store.load()
+
+    def save():
+        store.save_all()
+        store.backend.wait()
+    bench.measure("tasks.save", size, save)
+
+    queries = ["rap", "réunion", "cours examen", "xyz"]
+    bench.measure("tasks.search", size,
+                  lambda: [store.view(search=q) for q in queries], per=len(queries))
+    bench.measure("tasks.filter_week", size, lambda: store.view(date_range=week_range()))
+
+    spec = [("completed", False), ("date", True), ("alpha", False)]
+    bench.measure("tasks.sort", size, lambda: store.view(),
+                  setup=lambda: store.set_sort(spec))
+    bench.measure("tasks.view_cached", size, lambda: store.view())
+
+    ids = store.tasks.ids()[:200]
+    bench.measure("tasks.toggle", size,
+                  lambda: [store.toggle(task_id) for task_id in ids], per=len(ids))
+    bench.measure("tasks.add", size,
+                  lambda: [store.add(f"Nouvelle tâche {i}") for i in range(100)], per=100)
+    store.close()
+
+
+def bench_notes(bench, dossier, size):
+    """Mesures du magasin de notes (index JSON et un fichier par note)"""
+    chemin = os.path.join(dossier, "notes.json")
+    generate_notes(chemin, size)
+
+    # Découpage unique de l'ancien format (une seule fois : il réécrit les fichiers)
+    bench.measure("notes.migrate", size, lambda: NoteStore(JsonNoteBackend(chemin)).load(),
+                  repeat=1)
+
+    bench.measure("notes.load", size, lambda: NoteStore(JsonNoteBackend(chemin)).load())
+
+    store = NoteStore(JsonNoteBackend(chemin))
+    store.load()
+
+    bench.measure("notes.search_titles", size, lambda: store.search("réunion"))
+    bench.measure("notes.index_build", size,
+                  lambda: store.install_search_index(store.prepare_search_index()()))
+    queries = ["réunion", "cou", "budget client", "xyz"]
+    bench.measure("notes.search", size,
+                  lambda: [store.search(q) for q in queries], per=len(queries))
+
+    ids = list(store.order)[:50]
+    bench.measure("notes.open", size,
+                  lambda: [store.get_content(store.get(i)) for i in ids], per=len(ids),
+                  setup=lambda: [store.get(i).pop("content", None) for i in ids])
+
+    def save():
+        for i in ids:
+            store.save(i, f"Note {i}", "Contenu modifié")
+        store.flush()
+    bench.measure("notes.save", size, save, per=len(ids))
+    store.close()
+
+
+def bench_render(bench, dossier, size):
+    """Affichage Tk complet (nécessite un écran, ex. xvfb-run)"""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as e:
+        print(f"  rendu ignoré: {e}")
+        return
+    root.geometry("900x700")
+
+    from config import AppConfig
+    from notepad import Notepad
+    from tasks import TaskManager
+
+    cwd = os.getcwd()
+    os.chdir(dossier)
+    try:
+        config = AppConfig()
+
+        def pump(done):
+            while not done():
+                root.update()
+
+        frame = tk.Frame(root)
+        frame.pack(fill="both", expand=True)
+        managers = []
+
+        def open_tasks():
+            managers.append(TaskManager(frame, config))
+            pump(lambda: not managers[-1].loading)
+            root.update_idletasks()
+        bench.measure("render.tasks_open", size, open_tasks, repeat=1)
+        manager = managers[-1]
+
+        def display():
+            manager.update_display()
+            root.update_idletasks()
+        bench.measure("render.tasks_display", size, display)
+        manager.close()
+        frame.destroy()
+
+        frame = tk.Frame(root)
+        frame.pack(fill="both", expand=True)
+        notepad = Notepad(frame, config)
+        pump(lambda: not notepad.loading)
+
+        def fill():
+            notepad.update_notes_list()
+            pump(lambda: notepad._fill_job is None)
+        bench.measure("render.notes_list", size, fill)
+        notepad.close()
+        frame.destroy()
+    finally:
+        os.chdir(cwd)
+        root.destroy()
+
+
+# ----------------------------------------------------------------------
+# Résultats
+# ----------------------------------------------------------------------
+
+def git_commit():
+    """Commit courant (None hors d'un dépôt git)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RACINE,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, previous_path, threshold):
+    """Affiche les écarts avec un résultat précédent ; retourne les régressions"""
+    with open(previous_path, 'r', encoding='utf-8') as f:
+        previous = {(r["name"], r["size"]): r for r in json.load(f)["results"]}
+
+    regressions = []
+    print(f"\nComparaison avec {previous_path} (seuil {threshold:.0%})")
+    for result in results:
+        old = previous.get((result["name"], result["size"]))
+        if old is None or not old["median_s"]:
+            continue
+        ratio = result["median_s"] / old["median_s"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  ⚠ régression"
+            regressions.append(result)
+        print(f"  {result['name']:<28} {result['size']:>7}  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai du gestionnaire")
+    parser.add_argument("--sizes", type=int, nargs="+", default=TAILLES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--render", action="store_true",
+                        help="mesure aussi l'affichage Tk (écran ou xvfb-run requis)")
+    parser.add_argument("--output", help="fichier de résultats (défaut: benchmarks/results/)")
+    parser.add_argument("--compare", help="résultat précédent à comparer")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="ralentissement toléré avant de signaler une régression")
+    args = parser.parse_args(argv)
+
+    bench = Bench(args.repeat)
+    for size in args.sizes:
+        dossier = tempfile.mkdtemp(prefix=f"bench-{size}-")
+        try:
+            print(f"\n{size} éléments ({dossier})")
+            bench_tasks(bench, dossier, size)
+            bench_notes(bench, dossier, size)
+            if args.render:
+                bench_render(bench, dossier, size)
+        finally:
+            shutil.rmtree(dossier, ignore_errors=True)
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": bench.results,
+    }
+    output = args.output or os.path.join(
+        DOSSIER_RESULTATS, f"{datetime.now():%Y%m%d-%H%M%S}-{commit or 'local'}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    atomic_write_json(output, report, backups=0)
+    print(f"\nRésultats: {output}")
+
+    if args.compare and compare(bench.results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Temps de démarrage
+Mesure le temps entre le lancement et l'affichage de la première fenêtre,
+pour `python main.py` et pour l'exécutable PyInstaller s'il a été construit
+
+Usage (depuis la racine du projet, écran ou xvfb-run requis):
+    pyinstaller --noconfirm Gestionnaire_de_tache.spec   # optionnel
+    python benchmarks/startup.py --repeat 10
+
+L'application est lancée avec --mesure-demarrage FICHIER : elle y écrit
+l'heure d'affichage de sa fenêtre puis se ferme. Chaque lancement se fait
+dans un dossier vide (aucune donnée à charger). Les résultats sont écrits
+dans benchmarks/results/ au même format que bench.py.
+"""
+
+import argparse
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from bench import DOSSIER_RESULTATS, RACINE, git_commit
+
+from core import atomic_write_json
+
+NOM_EXE = "Gestionnaire_de_tache"
+
+
+def executable_path():
+    """Chemin de l'exécutable onedir construit (None s'il n'existe pas)"""
+    name = NOM_EXE + (".exe" if sys.platform == "win32" else "")
+    path = os.path.join(RACINE, "dist", NOM_EXE, name)
+    return path if os.path.exists(path) else None
+
+
+def time_to_first_window(command, timeout):
+    """Lance `command` et retourne le délai (s) jusqu'à la première fenêtre"""
+    dossier = tempfile.mkdtemp(prefix="startup-")
+    marker = os.path.join(dossier, "premiere_fenetre.txt")
+    try:
+        start = time.time()
+        process = subprocess.Popen(command + ["--mesure-demarrage", marker], cwd=dossier)
+        try:
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise RuntimeError(f"pas de fenêtre après {timeout} s: {' '.join(command)}")
+        if not os.path.exists(marker):
+            raise RuntimeError(f"code de sortie {process.returncode}: {' '.join(command)}")
+        with open(marker, 'r', encoding='utf-8') as f:
+            return float(f.read()) - start
+    finally:
+        shutil.rmtree(dossier, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temps jusqu'à la première fenêtre")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--output", help="fichier de résultats (défaut: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    commands = {"startup.python": [sys.executable, os.path.join(RACINE, "main.py")]}
+    exe = executable_path()
+    if exe is not None:
+        commands["startup.exe"] = [exe]
+    else:
+        print("Exécutable absent (pyinstaller --noconfirm Gestionnaire_de_tache.spec)")
+
+    results = []
+    for name, command in commands.items():
+        durations = [time_to_first_window(command, args.timeout) for _ in range(args.repeat)]
+        results.append({
+            "name": name,
+            "size": 0,
+            "median_s": statistics.median(durations),
+            "min_s": min(durations),
+            "runs": len(durations),
+        })
+        print(f"  {name:<28} {statistics.median(durations) * 1000:10.1f} ms")
+
+    commit = git_commit()
+    output = args.output or os.path.join(
+        DOSSIER_RESULTATS, f"{datetime.now():%Y%m%d-%H%M%S}-{commit or 'local'}-startup.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    atomic_write_json(output, {
+        "commit": commit,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }, backups=0)
+    print(f"\nRésultats: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,10 @@ Module de configuration
 Gère les thèmes et les paramètres globaux de l'application
 """
 
+import os
+
+from core import Settings
+
 
 class AppConfig:
     """Classe de configuration de l'application"""
@@ -13,6 +17,25 @@ class AppConfig:
         self.POLICE_TITRE = ("Segoe UI", 14, "bold")
         self.POLICE_GRANDE = ("Segoe UI", 12)
 
+        # Stockage des données : "json" (par défaut) ou "sqlite"
+        # (variable d'environnement GESTIONNAIRE_STOCKAGE)
+        self.STOCKAGE = os.environ.get("GESTIONNAIRE_STOCKAGE", "json").lower()
+        self.FICHIER_BD = "gestionnaire.db"
+
+        # Préférences de l'utilisateur (tri choisi, ...), à part des données
+        self.FICHIER_PARAMETRES = "parametres.json"
+        self.parametres = Settings(self.FICHIER_PARAMETRES)
+
+        # Profilage à la demande (GESTIONNAIRE_PROFIL=1 ou main.py --profil) :
+        # mesures dans un journal JSONL, panneau caché Ctrl+Maj+D
+        self.PROFIL = os.environ.get("GESTIONNAIRE_PROFIL", "0") not in ("", "0")
+        self.FICHIER_PROFIL = "profil.jsonl"
+
+        # Rapport de démarrage (main.py --rapport-demarrage) : durée maximale
+        # visée (s) entre le lancement de main.py et la première fenêtre
+        self.BUDGET_DEMARRAGE = 0.5
+        self.FICHIER_DEMARRAGE = "demarrage.json"
+
         # Thèmes disponibles
         self.themes = {
             "clair": {
@@ -43,6 +66,10 @@ class AppConfig:
         self.theme_actuel = "clair"
         self.style = self.themes[self.theme_actuel].copy()
 
+        # Registre des widgets colorés par le thème : (widget, {option: rôle})
+        self.widgets_themes = []
+        self.theme_listeners = []
+
     def toggle_theme(self):
         """Bascule entre le thème clair et sombre"""
         if self.theme_actuel == "clair":
@@ -52,6 +79,50 @@ class AppConfig:
 
         self.style = self.themes[self.theme_actuel].copy()
 
+    def themed(self, widget, **roles):
+        """
+        Enregistre un widget dont les couleurs suivent le thème
+
+        Args:
+            widget: Widget Tk déjà créé
+            **roles: Option -> clé du thème, ex. bg="fond", fg="texte"
+
+        Returns:
+            Le widget
+        """
+        self.widgets_themes.append((widget, roles))
+        return widget
+
+    def on_theme_change(self, callback):
+        """Ajoute une fonction appelée après chaque changement de thème"""
+        self.theme_listeners.append(callback)
+
+    def remove_theme_listener(self, callback):
+        """Retire une fonction ajoutée avec on_theme_change"""
+        if callback in self.theme_listeners:
+            self.theme_listeners.remove(callback)
+
+    def apply_theme(self):
+        """
+        Recolore sur place tous les widgets enregistrés
+
+        Les widgets détruits entre temps sont retirés du registre.
+        """
+        alive = []
+        for widget, roles in self.widgets_themes:
+            try:
+                exists = widget.winfo_exists()
+            except Exception:
+                exists = False
+            if not exists:
+                continue
+            widget.configure(**{option: self.style[role] for option, role in roles.items()})
+            alive.append((widget, roles))
+        self.widgets_themes = alive
+
+        for callback in list(self.theme_listeners):
+            callback()
+
     def get_style(self):
         """Retourne le dictionnaire de style actuel"""
         return self.style
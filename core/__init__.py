@@ -0,0 +1,92 @@
+"""
+Cœur de l'application
+Stockage et logique des données, sans dépendance à Tkinter : les vues
+(tasks.py, notepad.py) s'appuient sur TaskStore et NoteStore, utilisables
+aussi depuis un script ou un banc d'essai
+
+Seuls les modules utiles au démarrage sont importés ici ; le stockage
+SQLite, l'export Excel, le profilage et la lecture par morceaux sont
+chargés au premier accès (voir _LAZY)
+"""
+
+import importlib
+
+from core.autosave import BackgroundWriter
+from core.backends import JsonNoteBackend, open_note_backend, open_task_backend
+from core.dates import (NOTE_DATE_FORMAT, TASK_DATE_FORMAT, days_range, now_stamp,
+                        to_timestamp, today_range, week_range)
+from core.journal import TaskJournal
+from core.lazy import OPTIONAL_MODULES, MissingDependency, optional_modules
+from core.migrations import migrate_notes, migrate_tasks
+from core.models import SCHEMA_VERSION, Collection, ReadOnlyError, content_digest
+from core.note_store import NoteStore
+from core.persistence import atomic_write_json, read_json
+from core.search import InvertedIndex, NgramIndex, normalize, tokenize
+from core.settings import Settings
+from core.sorting import SortEngine, SortedIndex
+from core.stats import TaskStats
+from core.task_store import TaskStore
+
+# Nom -> module, importé au premier accès (core.SQLiteTaskBackend, ...)
+_LAZY = {
+    "Profiler": "core.profiler",
+    "SQLiteNoteBackend": "core.sqlite_store",
+    "SQLiteTaskBackend": "core.sqlite_store",
+    "export_notes": "core.export",
+    "export_tasks": "core.export",
+    "iter_text_chunks": "core.reader",
+    "note_rows": "core.export",
+    "task_rows": "core.export",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module 'core' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+__all__ = [
+    "NOTE_DATE_FORMAT",
+    "OPTIONAL_MODULES",
+    "SCHEMA_VERSION",
+    "TASK_DATE_FORMAT",
+    "BackgroundWriter",
+    "Collection",
+    "InvertedIndex",
+    "JsonNoteBackend",
+    "MissingDependency",
+    "NgramIndex",
+    "NoteStore",
+    "Profiler",
+    "ReadOnlyError",
+    "SQLiteNoteBackend",
+    "SQLiteTaskBackend",
+    "Settings",
+    "SortEngine",
+    "SortedIndex",
+    "TaskJournal",
+    "TaskStats",
+    "TaskStore",
+    "atomic_write_json",
+    "content_digest",
+    "days_range",
+    "export_notes",
+    "export_tasks",
+    "iter_text_chunks",
+    "migrate_notes",
+    "migrate_tasks",
+    "normalize",
+    "note_rows",
+    "now_stamp",
+    "open_note_backend",
+    "open_task_backend",
+    "optional_modules",
+    "read_json",
+    "task_rows",
+    "to_timestamp",
+    "today_range",
+    "tokenize",
+    "week_range",
+]
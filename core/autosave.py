@@ -0,0 +1,97 @@
+"""
+Module d'écriture en arrière-plan
+Un thread unique exécute les sauvegardes ; les écritures en attente sur
+une même clé sont fusionnées (seule la plus récente est exécutée)
+"""
+
+import threading
+
+
+class BackgroundWriter:
+    """
+    File d'écritures exécutées par un seul thread de fond
+
+    Les écritures sont faites dans l'ordre de soumission. Si une écriture
+    est soumise pour une clé qui attend encore, elle remplace l'ancienne :
+    une rafale de modifications ne produit qu'une écriture.
+
+    Usage:
+        writer = BackgroundWriter()
+        writer.submit("notes", lambda: ecrire(copie))
+        writer.last_error()   # None si les écritures ont réussi
+        writer.close()        # termine les écritures puis arrête le thread
+    """
+
+    def __init__(self):
+        self._pending = {}          # clé -> fonction, dans l'ordre de soumission
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread = None
+        self._errors = {}           # clé -> dernière exception (effacée au succès suivant)
+        self.written = 0
+
+    def submit(self, key, write):
+        """Planifie une écriture (remplace celle en attente pour la même clé)"""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Écriture soumise après la fermeture")
+            self._pending.pop(key, None)
+            self._pending[key] = write
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self):
+        """Boucle du thread d'écriture (s'arrête à la fermeture, file vide)"""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    if self._closed:
+                        return
+                    self._condition.wait()
+                key = next(iter(self._pending))
+                write = self._pending.pop(key)
+                self._busy = True
+
+            error = None
+            try:
+                write()
+            except Exception as e:
+                error = e
+            finally:
+                with self._condition:
+                    if error is None:
+                        self.written += 1
+                        self._errors.pop(key, None)
+                    else:
+                        self._errors[key] = error
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def last_error(self):
+        """Dernière erreur d'écriture pas encore corrigée par un succès (None sinon)"""
+        with self._condition:
+            return next(reversed(self._errors.values()), None)
+
+    def is_idle(self):
+        """Vrai si aucune écriture n'est en attente ni en cours"""
+        with self._condition:
+            return not self._pending and not self._busy
+
+    def flush(self, timeout=None):
+        """Attend que toutes les écritures soient terminées"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def close(self, timeout=None):
+        """Termine les écritures en attente puis arrête le thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
@@ -0,0 +1,172 @@
+"""
+Module des backends de stockage
+Choix entre les fichiers JSON (par défaut) et la base SQLite optionnelle
+"""
+
+import os
+
+from core.journal import TaskJournal
+from core.migrations import migrate_notes
+from core.models import Collection, content_digest
+from core.persistence import atomic_write_json, atomic_write_text, read_json
+
+
+class JsonNoteBackend:
+    """
+    Backend fichiers des notes
+
+    Le fichier JSON ({"version", "next_id", "notes"}) ne contient que
+    l'index léger des notes (id, titre, dates, empreinte du contenu) ; le contenu de chaque note
+    est dans son propre fichier texte (notes/<id>.txt), lu à la demande.
+    Ouvrir le bloc-notes ne lit donc que les titres.
+
+    Un ancien fichier avec le contenu des notes intégré est découpé une
+    seule fois au premier chargement ; les notes sont migrées avant que
+    l'index ne soit réécrit.
+    """
+
+    def __init__(self, chemin):
+        self.chemin = chemin
+        self.dossier = os.path.splitext(chemin)[0]
+
+    def content_path(self, note_id):
+        """Retourne le fichier du contenu d'une note"""
+        return os.path.join(self.dossier, f"{note_id}.txt")
+
+    def load(self):
+        """Retourne une Collection des notes, sans leur contenu"""
+        notes = Collection.from_json(read_json(self.chemin), "notes")
+
+        # Ancien format : contenu intégré dans le fichier JSON
+        inline = [note for note in notes if "content" in note]
+        if inline:
+            for note in inline:
+                content = note.pop("content")
+                note["digest"] = content_digest(content)
+                self._write_content(note["id"], content)
+            # L'index réécrit porte la version des notes : il doit être
+            # migré avant, sinon un arrêt ici laisserait un index "à jour"
+            # sans les horodatages
+            migrate_notes(notes)
+            self._write_index(self._index(notes))
+        return notes
+
+    def load_content(self, note_id):
+        """Lit le contenu d'une note depuis son fichier"""
+        try:
+            with open(self.content_path(note_id), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
+
+    def content_size(self, note_id):
+        """Taille du contenu d'une note (octets)"""
+        try:
+            return os.path.getsize(self.content_path(note_id))
+        except OSError:
+            return 0
+
+    def iter_content(self, note_id, chunk_size=None):
+        """Parcourt le contenu d'une note par morceaux (fichier projeté en mémoire)"""
+        from core.reader import CHUNK_SIZE, iter_text_chunks
+
+        if os.path.exists(self.content_path(note_id)):
+            yield from iter_text_chunks(self.content_path(note_id), chunk_size or CHUNK_SIZE)
+
+    def iter_documents(self, notes):
+        """Parcourt (id, {"title", "content"}) pour l'index de recherche"""
+        for note in list(notes):
+            content = note["content"] if "content" in note else self.load_content(note["id"])
+            yield note["id"], {"title": note["title"], "content": content}
+
+    def save(self, notes, note=None):
+        """
+        Écrit le contenu de la note puis l'index
+
+        Sans `note`, toutes les notes dont le contenu est chargé sont écrites.
+        """
+        targets = [note] if note is not None else [n for n in notes if "content" in n]
+        for n in targets:
+            self._write_content(n["id"], n["content"])
+        self._write_index(self._index(notes))
+
+    def delete(self, notes, note_id):
+        """Réécrit l'index sans la note puis supprime son contenu"""
+        self._write_index(self._index(notes))
+        self._remove_content(note_id)
+
+    def save_jobs(self, notes, note=None):
+        """
+        Prépare les écritures pour le thread de fond (voir core.autosave)
+
+        Les données sont copiées ici, dans le thread Tk : le thread
+        d'écriture ne lit jamais la collection pendant qu'elle est
+        modifiée. Le contenu est écrit sous la clé de la note, l'index
+        sous une clé commune : une rafale de sauvegardes ne réécrit
+        l'index qu'une fois.
+        """
+        targets = [note] if note is not None else [n for n in notes if "content" in n]
+        jobs = [
+            (n["id"], lambda i=n["id"], c=n["content"]: self._write_content(i, c))
+            for n in targets
+        ]
+        index = self._index(notes)
+        jobs.append(("index", lambda: self._write_index(index)))
+        return jobs
+
+    def delete_jobs(self, notes, note_id):
+        """Prépare la suppression d'une note pour le thread de fond"""
+        index = self._index(notes)
+        return [
+            ("index", lambda: self._write_index(index)),
+            (note_id, lambda: self._remove_content(note_id)),
+        ]
+
+    @staticmethod
+    def _index(notes):
+        """Copie de l'index à écrire (les notes sans leur contenu)"""
+        data = notes.to_json("notes")
+        data["notes"] = [
+            {key: value for key, value in n.items() if key != "content"}
+            for n in data["notes"]
+        ]
+        return data
+
+    def _write_index(self, data):
+        """Écrit l'index des notes"""
+        atomic_write_json(self.chemin, data)
+
+    def _write_content(self, note_id, content):
+        """Écrit le contenu d'une note dans son fichier"""
+        os.makedirs(self.dossier, exist_ok=True)
+        atomic_write_text(self.content_path(note_id), content)
+
+    def _remove_content(self, note_id):
+        """Supprime le fichier de contenu d'une note"""
+        try:
+            os.remove(self.content_path(note_id))
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        """Rien à fermer"""
+
+
+def open_task_backend(config, fichier_taches):
+    """Retourne le backend des tâches choisi dans la configuration"""
+    if config.STOCKAGE == "sqlite":
+        # sqlite3 n'est importé que si ce stockage est choisi
+        from core.sqlite_store import SQLiteTaskBackend
+        return SQLiteTaskBackend(config.FICHIER_BD, fichier_json=fichier_taches)
+    return TaskJournal(fichier_taches)
+
+
+def open_note_backend(config, fichier_notes):
+    """Retourne le backend des notes choisi dans la configuration"""
+    if config.STOCKAGE == "sqlite":
+        from core.sqlite_store import SQLiteNoteBackend
+
+        # Le contenu des notes JSON est dans un fichier par note
+        return SQLiteNoteBackend(config.FICHIER_BD, fichier_json=fichier_notes,
+                                 load_content=JsonNoteBackend(fichier_notes).load_content)
+    return JsonNoteBackend(fichier_notes)
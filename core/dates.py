@@ -0,0 +1,65 @@
+"""
+Module des dates
+Horodatages (secondes depuis l'epoch) enregistrés à côté des dates affichées,
+et périodes utilisées par les filtres
+"""
+
+from datetime import datetime, timedelta
+
+# Formats des dates affichées
+TASK_DATE_FORMAT = "%Y-%m-%d %H:%M"
+NOTE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+DAY_FORMAT = "%Y-%m-%d"
+
+
+def to_timestamp(text):
+    """
+    Convertit une date affichée en horodatage (0 si illisible)
+
+    Accepte les formats des tâches et des notes ; sert aux migrations,
+    les nouvelles données sont horodatées à la création (voir now_stamp).
+    """
+    for fmt in (NOTE_DATE_FORMAT, TASK_DATE_FORMAT, DAY_FORMAT):
+        try:
+            return int(datetime.strptime(text, fmt).timestamp())
+        except (TypeError, ValueError):
+            continue
+    return 0
+
+
+def now_stamp(fmt):
+    """Retourne (date affichée, horodatage) pour maintenant"""
+    now = datetime.now()
+    return now.strftime(fmt), int(now.timestamp())
+
+
+def _day_start(day):
+    """Minuit du jour donné"""
+    return datetime(day.year, day.month, day.day)
+
+
+def today_range(now=None):
+    """Période [début, fin[ d'aujourd'hui"""
+    start = _day_start(now or datetime.now())
+    return int(start.timestamp()), int((start + timedelta(days=1)).timestamp())
+
+
+def week_range(now=None):
+    """Période [début, fin[ de la semaine en cours (du lundi au dimanche)"""
+    now = now or datetime.now()
+    start = _day_start(now) - timedelta(days=now.weekday())
+    return int(start.timestamp()), int((start + timedelta(days=7)).timestamp())
+
+
+def days_range(first, last):
+    """
+    Période [début, fin[ couvrant deux jours inclus ("AAAA-MM-JJ")
+
+    Raises:
+        ValueError: Si une date est invalide ou si la fin précède le début
+    """
+    start = datetime.strptime(first.strip(), DAY_FORMAT)
+    end = datetime.strptime(last.strip(), DAY_FORMAT) + timedelta(days=1)
+    if end <= start:
+        raise ValueError("la date de fin précède la date de début")
+    return int(start.timestamp()), int(end.timestamp())
@@ -0,0 +1,119 @@
+"""
+Module d'export Excel
+Classeur openpyxl en écriture seule : les lignes sont écrites au fil de
+l'eau (fichiers temporaires d'openpyxl), la mémoire ne dépend pas du
+nombre de lignes. openpyxl n'est importé qu'au premier export.
+"""
+
+import os
+import tempfile
+from datetime import datetime
+
+from core.lazy import optional_modules
+
+# Nombre de lignes entre deux signalements de progression
+PROGRESS_STEP = 500
+
+# Taille maximale d'une cellule Excel (caractères)
+MAX_CELL_LENGTH = 32767
+
+TASK_HEADERS = ["Tâche", "Terminée", "Créée le", "Terminée le"]
+NOTE_HEADERS = ["Titre", "Créée le", "Modifiée le", "Contenu"]
+
+
+def task_rows(tasks):
+    """
+    Instantané des tâches à exporter (à prendre dans le thread Tk)
+
+    Des tuples et non les dictionnaires : les tâches peuvent être modifiées
+    pendant que le thread d'export écrit le fichier.
+    """
+    return [(task["text"], task["completed"], task["ts"], task.get("completed_ts", 0))
+            for task in tasks]
+
+
+def note_rows(notes):
+    """Instantané des notes à exporter : (id, titre, créée, modifiée, contenu en mémoire ou None)"""
+    return [(note["id"], note["title"], note["created_ts"], note["modified_ts"],
+             note.get("content")) for note in notes]
+
+
+def export_tasks(path, rows, progress=None):
+    """
+    Écrit les tâches dans un classeur Excel (peut tourner hors du thread Tk)
+
+    Args:
+        path: Fichier .xlsx à créer
+        rows: Résultat de task_rows()
+        progress: Fonction progress(faites, total) appelée régulièrement
+    """
+    def cells(row):
+        text, completed, ts, completed_ts = row
+        return [text, "Oui" if completed else "Non", _datetime(ts), _datetime(completed_ts)]
+
+    _write_workbook(path, "Tâches", TASK_HEADERS, [60, 10, 18, 18], rows, cells, progress)
+
+
+def export_notes(path, rows, load_content, progress=None):
+    """
+    Écrit les notes dans un classeur Excel (peut tourner hors du thread Tk)
+
+    Le contenu des notes qui ne sont pas en mémoire est lu une note à la
+    fois avec load_content(id), sans être gardé.
+
+    Args:
+        path: Fichier .xlsx à créer
+        rows: Résultat de note_rows()
+        load_content: Fonction load_content(note_id) -> texte
+        progress: Fonction progress(faites, total) appelée régulièrement
+    """
+    def cells(row):
+        note_id, title, created_ts, modified_ts, content = row
+        if content is None:
+            content = load_content(note_id)
+        return [title, _datetime(created_ts), _datetime(modified_ts), content]
+
+    _write_workbook(path, "Notes", NOTE_HEADERS, [40, 18, 18, 100], rows, cells, progress)
+
+
+def _write_workbook(path, title, headers, widths, rows, cells, progress):
+    """Classeur en écriture seule, enregistré dans un temporaire puis renommé"""
+    openpyxl = optional_modules.load("openpyxl")
+    illegal = optional_modules.load("openpyxl.cell.cell").ILLEGAL_CHARACTERS_RE
+    get_column_letter = optional_modules.load("openpyxl.utils").get_column_letter
+
+    def clean(value):
+        # Caractères de contrôle refusés par le format, cellules limitées
+        if isinstance(value, str):
+            return illegal.sub("", value)[:MAX_CELL_LENGTH]
+        return value
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(title)
+    for column, width in enumerate(widths, start=1):
+        sheet.column_dimensions[get_column_letter(column)].width = width
+    sheet.freeze_panes = "A2"
+    sheet.append(headers)
+
+    total = len(rows)
+    for done, row in enumerate(rows, start=1):
+        sheet.append([clean(value) for value in cells(row)])
+        if progress is not None and (done % PROGRESS_STEP == 0 or done == total):
+            progress(done, total)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                dir=directory)
+    os.close(fd)
+    try:
+        workbook.save(temp)
+        os.replace(temp, path)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+
+
+def _datetime(ts):
+    """Horodatage -> date Excel (vide si absent)"""
+    return datetime.fromtimestamp(ts) if ts else None
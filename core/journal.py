@@ -0,0 +1,274 @@
+"""
+Module du journal des tâches
+Stockage en ajout seul : chaque modification est une ligne JSON ajoutée
+au journal, l'instantané complet est compacté en arrière-plan
+"""
+
+import json
+import os
+import threading
+
+from core.models import Collection
+from core.persistence import atomic_write_json, read_json
+
+
+class TaskJournal:
+    """
+    Moteur de stockage des tâches par journal
+
+    Fichiers utilisés (pour chemin = "taches.json") :
+        taches.json             instantané complet ({"version", "next_id", "tasks"} ;
+                                l'ancienne liste simple reste lisible)
+        taches.json.1, .2, ...  instantanés précédents (voir core.persistence)
+        taches.json.journal     modifications ajoutées depuis l'instantané
+        taches.json.journal.old journal en cours de compactage
+
+    Les enregistrements sont idempotents ("add" ignoré si l'id existe,
+    "toggle" fixe l'état, "delete" et "reorder" sont absolus) : rejouer un
+    journal déjà compacté après un arrêt brutal ne modifie pas les données.
+
+    Usage:
+        journal = TaskJournal("taches.json")
+        taches = journal.load()          # core.Collection
+        journal.add(tache)
+        if journal.needs_compaction():
+            journal.compact(taches)
+    """
+
+    # Nombre d'enregistrements avant compactage automatique
+    SEUIL_COMPACTAGE = 500
+
+    # Compactages en cours, partagés par toutes les instances (clé : chemin)
+    _compactages = {}
+
+    def __init__(self, chemin, seuil=SEUIL_COMPACTAGE):
+        self.chemin = chemin
+        self.chemin_journal = chemin + ".journal"
+        self.chemin_compactage = chemin + ".journal.old"
+        self.seuil = seuil
+        self.nb_entrees = 0
+        self._fichier = None
+        self._erreur_compactage = None  # exception du compactage de fond
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """Lit l'instantané puis rejoue les journaux, retourne une Collection de tâches"""
+        # Un compactage échoué a laissé journal.old, rejoué ci-dessous
+        self._join()
+
+        tasks = Collection.from_json(read_json(self.chemin), "tasks")
+
+        self.nb_entrees = 0
+        for chemin in (self.chemin_compactage, self.chemin_journal):
+            for record in self._read_records(chemin):
+                self.apply(tasks, record)
+                self.nb_entrees += 1
+
+        return tasks
+
+    def _read_records(self, chemin):
+        """
+        Lit les enregistrements d'un journal
+
+        Une ligne interrompue par un arrêt brutal est coupée du fichier (avec
+        ce qui la suit) : les ajouts suivants repartent d'une ligne valide.
+        """
+        if not os.path.exists(chemin):
+            return
+        valid = 0
+        torn = False
+        with open(chemin, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        torn = True
+                        break
+                    yield record
+                valid += len(line)
+
+        if torn:
+            with open(chemin, 'r+b') as f:
+                f.truncate(valid)
+
+    @staticmethod
+    def apply(tasks, record):
+        """Applique un enregistrement du journal à une Collection de tâches"""
+        op = record.get("op")
+
+        if op == "add":
+            task = record["task"]
+            if task.get("id") not in tasks:
+                tasks.add(dict(task))
+
+        elif op == "toggle":
+            task = tasks.get(record["id"])
+            if task is not None:
+                task["completed"] = record["completed"]
+                task["completed_ts"] = record.get("completed_ts", 0)
+
+        elif op == "delete":
+            tasks.remove_many(record["ids"])
+
+        elif op == "reorder":
+            # N'est plus écrit (le tri est un ordre d'affichage) ; relu
+            # pour les anciens journaux
+            tasks.reorder(record["ids"])
+
+    # ------------------------------------------------------------------
+    # Écriture (coût constant par action)
+    # ------------------------------------------------------------------
+
+    def add(self, task):
+        """Journalise l'ajout d'une tâche"""
+        self._append({"op": "add", "task": task})
+
+    def toggle(self, task):
+        """Journalise le nouvel état d'une tâche"""
+        self._append({"op": "toggle", "id": task["id"], "completed": task["completed"],
+                      "completed_ts": task.get("completed_ts", 0)})
+
+    def delete(self, ids):
+        """Journalise la suppression d'une ou plusieurs tâches"""
+        self._append({"op": "delete", "ids": list(ids)})
+
+    def _append(self, record):
+        """Ajoute une ligne au journal"""
+        if self._fichier is None:
+            fresh_line = not _ends_with_newline(self.chemin_journal)
+            self._fichier = open(self.chemin_journal, 'a', encoding='utf-8')
+            if fresh_line:
+                # Dernière ligne sans fin de ligne : ne pas écrire à sa suite
+                self._fichier.write("\n")
+        self._fichier.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._fichier.flush()
+        self.nb_entrees += 1
+
+    # ------------------------------------------------------------------
+    # Compactage
+    # ------------------------------------------------------------------
+
+    def needs_compaction(self):
+        """Indique si le journal a atteint le seuil de compactage"""
+        return self.nb_entrees >= self.seuil
+
+    def compact(self, tasks, background=True):
+        """
+        Écrit un nouvel instantané et vide le journal
+
+        Le journal courant est mis de côté (journal.old) et les nouvelles
+        modifications repartent dans un journal vide ; l'instantané est
+        ensuite écrit dans un thread séparé ; son erreur éventuelle est
+        levée par wait() ou close().
+
+        Args:
+            tasks: Collection complète des tâches à écrire
+            background: False pour compacter de façon synchrone
+        """
+        thread = self._compactages.get(self._cle())
+        if thread is not None and thread.is_alive():
+            if not background:
+                thread.join()
+            else:
+                # Le prochain enregistrement relancera le compactage
+                return
+
+        self._rotate()
+        snapshot = {
+            "version": tasks.schema_version,
+            "next_id": tasks.next_id,
+            "tasks": [dict(t) for t in tasks]
+        }
+
+        if background:
+            thread = threading.Thread(
+                target=self._write_snapshot_in_background, args=(snapshot,), daemon=True
+            )
+            self._compactages[self._cle()] = thread
+            thread.start()
+        else:
+            self._write_snapshot(snapshot)
+
+    def _cle(self):
+        """Clé identifiant les fichiers de ce journal"""
+        return os.path.abspath(self.chemin)
+
+    def _rotate(self):
+        """Met le journal courant de côté pour le compactage"""
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
+
+        if os.path.exists(self.chemin_journal):
+            if os.path.exists(self.chemin_compactage):
+                # Compactage précédent interrompu : on regroupe les journaux
+                with open(self.chemin_journal, 'r', encoding='utf-8') as src, \
+                        open(self.chemin_compactage, 'a', encoding='utf-8') as dst:
+                    if not _ends_with_newline(self.chemin_compactage):
+                        dst.write("\n")
+                    dst.write(src.read())
+                os.remove(self.chemin_journal)
+            else:
+                os.replace(self.chemin_journal, self.chemin_compactage)
+
+        self.nb_entrees = 0
+
+    def _write_snapshot(self, snapshot):
+        """Écrit l'instantané (atomiquement) puis supprime le journal compacté"""
+        atomic_write_json(self.chemin, snapshot)
+
+        if os.path.exists(self.chemin_compactage):
+            os.remove(self.chemin_compactage)
+
+    def _write_snapshot_in_background(self, snapshot):
+        """Compactage de fond : l'erreur est gardée pour wait() et close()"""
+        try:
+            self._write_snapshot(snapshot)
+        except Exception as e:
+            # journal.old n'est pas supprimé : rien n'est perdu, il sera
+            # rejoué au prochain chargement et fusionné au prochain compactage
+            self._erreur_compactage = e
+
+    def _join(self):
+        """Attend la fin d'un compactage en cours sur ces fichiers"""
+        thread = self._compactages.get(self._cle())
+        if thread is not None:
+            thread.join()
+
+    def wait(self):
+        """
+        Attend la fin d'un compactage en cours sur ces fichiers
+
+        Raises:
+            Exception: L'erreur du dernier compactage de fond, s'il a échoué
+        """
+        self._join()
+        error, self._erreur_compactage = self._erreur_compactage, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        """Ferme le journal (lève l'erreur d'un compactage de fond échoué)"""
+        try:
+            self.wait()
+        finally:
+            if self._fichier is not None:
+                self._fichier.close()
+                self._fichier = None
+
+
+def _ends_with_newline(chemin):
+    """True si le fichier est absent, vide ou se termine par une fin de ligne"""
+    try:
+        with open(chemin, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    except FileNotFoundError:
+        return True
@@ -0,0 +1,111 @@
+"""
+Module des dépendances optionnelles
+Les bibliothèques lourdes de requirements.txt ne sont importées qu'à la
+première utilisation de la fonctionnalité qui en a besoin, jamais au démarrage
+"""
+
+import importlib
+import importlib.util
+import sys
+import time
+
+# Bibliothèque -> fonctionnalité qui l'utilise (pour les messages d'erreur)
+OPTIONAL_MODULES = {
+    "reportlab": "l'export PDF",
+    "openpyxl": "l'export Excel",
+    "plyer": "les notifications",
+    "tkcalendar": "le calendrier",
+}
+
+
+class MissingDependency(ImportError):
+    """Bibliothèque optionnelle absente : la fonctionnalité est indisponible"""
+
+
+class LazyModules:
+    """
+    Registre des bibliothèques optionnelles, importées à la demande
+
+    load() importe un module (ou sous-module) enregistré la première fois
+    qu'une fonctionnalité le demande et note la durée de l'import ;
+    available() vérifie sa présence sans l'importer.
+    """
+
+    def __init__(self, modules=OPTIONAL_MODULES):
+        self.modules = dict(modules)
+        self.import_times = {}  # nom -> durée (s) du premier import
+
+    def register(self, name, feature):
+        """Déclare une bibliothèque optionnelle"""
+        self.modules[name] = feature
+
+    def available(self, name):
+        """True si le module est installé (sans l'importer)"""
+        package = self._package(name)
+        if package in sys.modules:
+            return True
+        try:
+            return importlib.util.find_spec(package) is not None
+        except ValueError:
+            return False
+
+    def require(self, name):
+        """
+        Vérifie qu'un module est installé, sans l'importer
+
+        À appeler avant de lancer une fonctionnalité (ex. avant de demander
+        le fichier de destination) pour prévenir l'utilisateur au plus tôt.
+
+        Raises:
+            MissingDependency: Si la bibliothèque n'est pas installée
+        """
+        if not self.available(name):
+            raise self._missing(self._package(name))
+
+    def load(self, name):
+        """
+        Importe un module optionnel (ou l'un de ses sous-modules)
+
+        Args:
+            name: Nom du module, ex. "openpyxl" ou "openpyxl.styles"
+
+        Returns:
+            module: Le module importé
+
+        Raises:
+            MissingDependency: Si la bibliothèque n'est pas installée
+        """
+        if name in sys.modules:
+            return sys.modules[name]
+
+        package = self._package(name)
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            raise self._missing(package) from e
+        self.import_times[name] = time.perf_counter() - start
+        return module
+
+    def loaded(self):
+        """Bibliothèques optionnelles déjà importées"""
+        return [name for name in self.modules if name in sys.modules]
+
+    def _missing(self, package):
+        """Erreur indiquant la fonctionnalité indisponible et comment l'installer"""
+        feature = self.modules[package]
+        return MissingDependency(
+            f"{feature[0].upper()}{feature[1:]} nécessite le module « {package} » "
+            f"(pip install {package})"
+        )
+
+    def _package(self, name):
+        """Bibliothèque enregistrée à laquelle appartient `name`"""
+        package = name.split(".")[0]
+        if package not in self.modules:
+            raise KeyError(f"Module optionnel non déclaré: {package}")
+        return package
+
+
+# Registre partagé par toute l'application
+optional_modules = LazyModules()
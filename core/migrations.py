@@ -0,0 +1,68 @@
+"""
+Module de migration des données
+Met une seule fois les fichiers anciens au format courant (SCHEMA_VERSION)
+"""
+
+from datetime import datetime
+
+from core.dates import to_timestamp
+from core.models import SCHEMA_VERSION
+
+
+def migrate_tasks(tasks):
+    """
+    Complète les tâches lues dans un ancien format
+
+    Un fichier déjà au format courant n'est pas parcouru : le chargement
+    reste en lecture seule.
+
+    Args:
+        tasks: Collection de tâches
+
+    Returns:
+        True si les tâches ont été modifiées et doivent être réécrites
+    """
+    if not tasks.needs_migration:
+        return False
+
+    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    for task in tasks:
+        task.setdefault("completed", False)
+        task.setdefault("date", now)
+        task.setdefault("text", "Tâche sans titre")
+        # Version 2 : horodatage à côté de la date affichée
+        if "ts" not in task:
+            task["ts"] = to_timestamp(task["date"])
+
+    tasks.schema_version = SCHEMA_VERSION
+    tasks.reassigned = 0
+    return True
+
+
+def migrate_notes(notes):
+    """
+    Complète les notes lues dans un ancien format
+
+    Args:
+        notes: Collection de notes
+
+    Returns:
+        True si les notes ont été modifiées et doivent être réécrites
+    """
+    if not notes.needs_migration:
+        return False
+
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for note in notes:
+        note.setdefault("title", "Note sans titre")
+        note.setdefault("date_created", now)
+        note.setdefault("date_modified", note["date_created"])
+        # Version 2 : horodatages à côté des dates affichées
+        if "created_ts" not in note:
+            note["created_ts"] = to_timestamp(note["date_created"])
+        if "modified_ts" not in note:
+            note["modified_ts"] = to_timestamp(note["date_modified"])
+
+    notes.schema_version = SCHEMA_VERSION
+    notes.reassigned = 0
+    return True
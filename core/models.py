@@ -0,0 +1,158 @@
+"""
+Module des modèles
+Collection d'éléments indexés par id, avec allocation d'id monotone
+"""
+
+import hashlib
+
+# Version du format des fichiers de données (clé "version") ;
+# 2 : horodatages à côté des dates (voir core.migrations)
+SCHEMA_VERSION = 2
+
+
+def content_digest(content):
+    """Empreinte courte d'un contenu, pour savoir s'il a changé sans le relire"""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ReadOnlyError(RuntimeError):
+    """Modification refusée : les données n'ont pas pu être chargées"""
+
+
+class Collection:
+    """
+    Collection ordonnée d'éléments (dictionnaires) indexés par leur "id"
+
+    Le dictionnaire id -> élément conserve l'ordre d'insertion : il sert à
+    la fois d'index (accès, ajout et suppression en O(1)) et de vue
+    ordonnée. Les id sont alloués par un compteur monotone (next_id),
+    enregistré avec les données, et ne sont jamais réutilisés.
+
+    Au chargement, un id manquant ou déjà utilisé est remplacé par un id
+    neuf (`reassigned` compte ces corrections). `schema_version` indique
+    le format lu ; voir core.migrations.
+
+    Usage:
+        taches = Collection(liste_json, next_id=12)
+        tache = taches.add({"text": "Nouvelle tâche"})  # id alloué
+        taches.get(tache["id"])
+    """
+
+    def __init__(self, items=(), next_id=0, schema_version=SCHEMA_VERSION):
+        self.by_id = {}
+        self.next_id = next_id
+        self.reassigned = 0
+        self.schema_version = schema_version
+
+        items = list(items)
+        ids = [item["id"] for item in items if self._valid_id(item.get("id"))]
+        if ids:
+            self.next_id = max(self.next_id, max(ids) + 1)
+
+        for item in items:
+            if not self._valid_id(item.get("id")) or item["id"] in self.by_id:
+                item["id"] = self.allocate_id()
+                self.reassigned += 1
+            self.by_id[item["id"]] = item
+
+    @staticmethod
+    def _valid_id(item_id):
+        """Un id valide est un entier (les booléens sont exclus)"""
+        return type(item_id) is int
+
+    @classmethod
+    def from_json(cls, data, key):
+        """
+        Crée une collection depuis le contenu d'un fichier JSON
+
+        Accepte l'ancien format (liste simple, version 0) et le format
+        {"version": ..., "next_id": ..., key: [...]}. Sans fichier
+        (data à None), la collection est vide et au format courant.
+        """
+        if data is None:
+            return cls()
+        if isinstance(data, dict):
+            return cls(data.get(key, []), next_id=data.get("next_id", 0),
+                       schema_version=data.get("version", 0))
+        return cls(data, schema_version=0)
+
+    def to_json(self, key):
+        """
+        Retourne le contenu à écrire dans le fichier JSON
+
+        La version écrite est celle des éléments (schema_version) : une
+        collection pas encore migrée garde son ancienne version et sera
+        migrée au prochain chargement.
+        """
+        return {
+            "version": self.schema_version,
+            "next_id": self.next_id,
+            key: list(self.by_id.values())
+        }
+
+    @property
+    def needs_migration(self):
+        """Vrai si le format lu est ancien ou si des id ont été corrigés"""
+        return self.schema_version < SCHEMA_VERSION or self.reassigned > 0
+
+    def allocate_id(self):
+        """Réserve un nouvel id unique"""
+        item_id = self.next_id
+        self.next_id += 1
+        return item_id
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def __contains__(self, item_id):
+        return item_id in self.by_id
+
+    def get(self, item_id, default=None):
+        """Retourne l'élément portant cet id"""
+        return self.by_id.get(item_id, default)
+
+    def ids(self):
+        """Retourne les id dans l'ordre de la collection"""
+        return list(self.by_id)
+
+    def add(self, item):
+        """Ajoute un élément en fin de collection (un id est alloué si besoin)"""
+        item_id = item.get("id")
+        if not self._valid_id(item_id) or item_id in self.by_id:
+            item["id"] = self.allocate_id()
+        else:
+            self.next_id = max(self.next_id, item_id + 1)
+        self.by_id[item["id"]] = item
+        return item
+
+    def remove(self, item_id):
+        """Retire et retourne l'élément portant cet id (None s'il n'existe pas)"""
+        return self.by_id.pop(item_id, None)
+
+    def remove_many(self, ids):
+        """Retire plusieurs éléments, retourne ceux qui existaient"""
+        removed = []
+        for item_id in ids:
+            item = self.by_id.pop(item_id, None)
+            if item is not None:
+                removed.append(item)
+        return removed
+
+    def clear(self):
+        """Vide la collection (le compteur d'id est conservé)"""
+        self.by_id.clear()
+
+    def reorder(self, ids):
+        """Réordonne selon une liste d'id (les éléments absents restent à la fin)"""
+        ordered = {}
+        for item_id in ids:
+            item = self.by_id.get(item_id)
+            if item is not None:
+                ordered[item_id] = item
+        for item_id, item in self.by_id.items():
+            if item_id not in ordered:
+                ordered[item_id] = item
+        self.by_id = ordered
@@ -0,0 +1,285 @@
+"""
+Module du magasin de notes
+Logique des notes (création, modification, suppression, recherche,
+chargement et sauvegarde) sans interface
+"""
+
+from core.autosave import BackgroundWriter
+from core.dates import NOTE_DATE_FORMAT, now_stamp
+from core.migrations import migrate_notes
+from core.models import Collection, ReadOnlyError, content_digest
+from core.search import InvertedIndex, normalize
+from core.sorting import SortedIndex
+
+
+class NoteStore:
+    """
+    Notes, index de recherche et ordre d'affichage, tenus à jour ensemble
+
+    Les écritures passent par un thread de fond (core.autosave) ; leur
+    dernière erreur est donnée par last_error(). Le contenu d'une note
+    n'est lu qu'à la demande (get_content) et n'est gardé en mémoire que
+    s'il est petit : une grosse note est relue par morceaux (iter_content).
+
+    L'index de recherche lit le contenu de toutes les notes : il est
+    construit hors du thread Tk (prepare_search_index) puis installé
+    (install_search_index) ; en attendant, la recherche porte sur les titres.
+
+    Usage:
+        store = NoteStore(JsonNoteBackend("notes.json"))
+        store.load()
+        store.install_search_index(store.prepare_search_index()())
+        note, old, new = store.save(None, "Courses", "Pain, lait")
+        store.search("pain")
+        store.flush()
+    """
+
+    # Au-delà de cette taille (octets), la note est lue par morceaux et son
+    # contenu n'est pas gardé en mémoire
+    LARGE_NOTE_SIZE = 1024 * 1024
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.notes = Collection()
+        # Vrai après un échec de chargement : plus aucune écriture
+        self.read_only = False
+
+        # Index de recherche (titre pondéré plus fort que le contenu),
+        # construit en arrière-plan après le chargement puis tenu à jour
+        self.search_index = InvertedIndex({"title": 3.0, "content": 1.0})
+        self.search_index_ready = False
+        self._index_generation = 0
+        self._index_changes = None  # notes modifiées pendant la construction
+
+        # Ordre d'affichage (plus récente en premier), tenu à jour note par note
+        self.order = SortedIndex(lambda note: note["modified_ts"], reverse=True)
+
+        # Écritures dans un thread de fond, fusionnées par note
+        self.writer = BackgroundWriter()
+
+    # ------------------------------------------------------------------
+    # Chargement et écriture
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """Lit les notes et migre une seule fois un ancien format (peut tourner hors du thread Tk)"""
+        # Reprend sur la dernière sauvegarde valide si le fichier est corrompu
+        notes = self.backend.load()
+        if migrate_notes(notes):
+            self.backend.save(notes)
+        order = SortedIndex(self.order.key, reverse=True)
+        order.build(notes)
+
+        self.notes, self.order = notes, order
+        self.read_only = False
+        self._forget_search_index()
+
+    def reset(self):
+        """
+        Repart d'une liste vide en lecture seule (après une erreur de chargement)
+
+        Les notes enregistrées n'ont pas été lues : une note créée
+        recevrait un id déjà utilisé et écraserait son fichier.
+        """
+        self.notes = Collection()
+        self.order.build(self.notes)
+        self.read_only = True
+        self._forget_search_index()
+
+    def _check_writable(self):
+        """Refuse toute modification après un échec de chargement"""
+        if self.read_only:
+            raise ReadOnlyError("Les notes n'ont pas pu être chargées : modifications désactivées")
+
+    def _forget_search_index(self):
+        """L'index ne correspond plus aux notes ; une construction en cours sera ignorée"""
+        self.search_index_ready = False
+        self._index_generation += 1
+        self._index_changes = None
+
+    def _submit(self, jobs):
+        """Confie des écritures au thread de fond"""
+        for job in jobs:
+            self.writer.submit(*job)
+
+    def is_idle(self):
+        """Vrai si aucune écriture n'est en attente"""
+        return self.writer.is_idle()
+
+    def last_error(self):
+        """Dernière erreur d'écriture (None si les écritures ont réussi)"""
+        return self.writer.last_error()
+
+    def flush(self):
+        """Attend la fin des écritures"""
+        self.writer.flush()
+
+    def close(self):
+        """Termine les écritures, arrête leur thread et libère le stockage"""
+        self.writer.close()
+        self.backend.close()
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    def get(self, note_id):
+        """Retourne une note (None si inconnue)"""
+        return self.notes.get(note_id)
+
+    def get_content(self, note):
+        """Retourne le contenu d'une note, lu à la demande (gardé s'il est petit)"""
+        if "content" in note:
+            return note["content"]
+        # Le fichier doit contenir les sauvegardes encore en attente
+        self.writer.flush()
+        content = self.backend.load_content(note["id"])
+        self._cache_content(note, content)
+        return content
+
+    def _cache_content(self, note, content):
+        """Garde le contenu d'une note en mémoire, sauf s'il est gros"""
+        if len(content) > self.LARGE_NOTE_SIZE:
+            note.pop("content", None)
+        else:
+            note["content"] = content
+
+    def note_digest(self, note):
+        """Empreinte du contenu enregistré, calculée une fois si absente de l'index"""
+        if "digest" not in note:
+            note["digest"] = content_digest(self.get_content(note))
+        return note["digest"]
+
+    def is_large(self, note):
+        """Vrai si le contenu enregistré dépasse LARGE_NOTE_SIZE octets (à lire par morceaux)"""
+        self.writer.flush()
+        return self.backend.content_size(note["id"]) > self.LARGE_NOTE_SIZE
+
+    def iter_content(self, note_id):
+        """Parcourt le contenu d'une note par morceaux"""
+        self.writer.flush()
+        return self.backend.iter_content(note_id)
+
+    def search(self, query):
+        """
+        Id des notes correspondantes, par pertinence
+
+        Tant que l'index n'est pas installé, seuls les titres sont comparés
+        (notes les plus récentes d'abord).
+        """
+        if not self.search_index_ready:
+            words = normalize(query).split()
+            return [note_id for note_id in self.order
+                    if all(word in normalize(self.notes.get(note_id)["title"]) for word in words)]
+        return [note_id for note_id in self.search_index.search(query) if note_id in self.notes]
+
+    def prepare_search_index(self):
+        """
+        Prépare la construction de l'index (thread Tk)
+
+        Returns:
+            Fonction sans argument à exécuter hors du thread Tk ; son
+            résultat est à passer à install_search_index()
+        """
+        self._index_generation += 1
+        self._index_changes = set()
+        generation = self._index_generation
+        notes = list(self.notes)
+
+        def build():
+            index = InvertedIndex(self.search_index.weights)
+            index.build(self.backend.iter_documents(notes))
+            return generation, index
+        return build
+
+    def install_search_index(self, result):
+        """
+        Installe l'index construit (thread Tk), après y avoir reporté les
+        notes modifiées ou supprimées pendant sa construction
+
+        Returns:
+            bool: False si l'index est périmé (notes rechargées entre temps)
+        """
+        generation, index = result
+        if generation != self._index_generation or self._index_changes is None:
+            return False
+
+        for note_id in self._index_changes:
+            note = self.notes.get(note_id)
+            if note is None:
+                index.remove(note_id)
+            else:
+                index.add(note_id, title=note["title"], content=self.get_content(note))
+        self.search_index = index
+        self.search_index_ready = True
+        self._index_changes = None
+        return True
+
+    def _index_changed(self, note_id):
+        """Note modifiée ou supprimée pendant la construction de l'index"""
+        if self._index_changes is not None:
+            self._index_changes.add(note_id)
+
+    # ------------------------------------------------------------------
+    # Modifications
+    # ------------------------------------------------------------------
+
+    def save(self, note_id, title, content):
+        """
+        Crée (note_id à None ou inconnu) ou modifie une note, puis planifie l'écriture
+
+        Returns:
+            (note, ancienne position, nouvelle position) dans l'ordre
+            d'affichage ; l'ancienne position vaut None pour une nouvelle note
+
+        Raises:
+            ReadOnlyError: Si le chargement a échoué (voir reset)
+        """
+        self._check_writable()
+        # Date affichée et horodatage (tri, filtres)
+        date, ts = now_stamp(NOTE_DATE_FORMAT)
+
+        note = self.notes.get(note_id) if note_id is not None else None
+        if note is None:
+            note = {
+                "title": title,
+                "content": content,
+                "digest": content_digest(content),
+                "date_created": date,
+                "date_modified": date,
+                "created_ts": ts,
+                "modified_ts": ts
+            }
+            # Un id unique est alloué par la collection
+            self.notes.add(note)
+            old = None
+        else:
+            old = self.order.remove(note["id"])
+            note["title"] = title
+            note["content"] = content
+            note["digest"] = content_digest(content)
+            note["date_modified"] = date
+            note["modified_ts"] = ts
+
+        if self.search_index_ready:
+            self.search_index.add(note["id"], title=note["title"], content=note["content"])
+        else:
+            self._index_changed(note["id"])
+        new = self.order.insert(note)
+        self._submit(self.backend.save_jobs(self.notes, note))
+        # Les écritures ont leur copie : une grosse note n'est pas gardée
+        self._cache_content(note, content)
+        return note, old, new
+
+    def delete(self, note_id):
+        """Supprime une note ; retourne la position qu'elle avait (None si inconnue)"""
+        self._check_writable()
+        if self.notes.remove(note_id) is None:
+            return None
+        if self.search_index_ready:
+            self.search_index.remove(note_id)
+        else:
+            self._index_changed(note_id)
+        position = self.order.remove(note_id)
+        self._submit(self.backend.delete_jobs(self.notes, note_id))
+        return position
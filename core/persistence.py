@@ -0,0 +1,154 @@
+"""
+Module de persistance
+Écritures atomiques (JSON et texte) avec sauvegardes tournantes et reprise au démarrage
+"""
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+
+# Nombre de générations précédentes conservées (fichier.1, fichier.2, ...)
+NB_SAUVEGARDES = 3
+
+# Masque de création des fichiers, lu une fois au démarrage (os.umask ne
+# permet pas de le lire sans le modifier)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def backup_path(path, generation):
+    """Retourne le chemin de la sauvegarde numéro `generation`"""
+    return f"{path}.{generation}"
+
+
+def atomic_write_json(path, data, backups=NB_SAUVEGARDES, indent=2):
+    """
+    Écrit un fichier JSON de façon atomique
+
+    Les données sont écrites dans un fichier temporaire du même dossier,
+    synchronisées sur disque (fsync), puis le fichier temporaire remplace
+    la cible par renommage : la cible existe à tout instant. L'ancienne
+    version devient fichier.1 (lien ou copie, fait avant le renommage),
+    les précédentes sont décalées jusqu'à `backups`. Les droits du
+    fichier remplacé sont conservés.
+
+    Args:
+        path: Fichier cible
+        data: Données sérialisables en JSON
+        backups: Nombre de sauvegardes tournantes à conserver
+        indent: Indentation du JSON (None pour un fichier compact)
+    """
+    _atomic_write(path, lambda f: json.dump(data, f, ensure_ascii=False, indent=indent), backups)
+
+
+def atomic_write_text(path, text, backups=0):
+    """Écrit un fichier texte de façon atomique (voir atomic_write_json)"""
+    _atomic_write(path, lambda f: f.write(text), backups)
+
+
+def _atomic_write(path, write, backups):
+    """Écrit via write(fichier) dans un temporaire puis remplace la cible"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        # newline="" : fins de ligne écrites telles quelles (pas de \r\n sous
+        # Windows) ; core.reader relit les octets sans traduction
+        with os.fdopen(fd, 'w', encoding='utf-8', newline="") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp crée le fichier en 0600 : droits du fichier remplacé,
+        # ou ceux d'un fichier créé normalement
+        _copy_mode(path, temp)
+
+        if backups > 0 and os.path.exists(path):
+            rotate_backups(path, backups)
+            _link_or_copy(path, backup_path(path, 1))
+        os.replace(temp, path)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+    _fsync_directory(directory)
+
+
+def _copy_mode(source, target):
+    """Donne à target les droits de source (s'il existe) ou les droits par défaut"""
+    try:
+        mode = stat.S_IMODE(os.stat(source).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.chmod(target, mode)
+
+
+def _link_or_copy(source, target):
+    """Crée target identique à source, sans toucher à source"""
+    try:
+        os.link(source, target)
+    except (OSError, AttributeError):
+        # Système de fichiers sans liens physiques (FAT, certains partages)
+        shutil.copy2(source, target)
+
+
+def rotate_backups(path, backups):
+    """Décale les sauvegardes : fichier.1 -> fichier.2, ..., la plus ancienne est supprimée"""
+    oldest = backup_path(path, backups)
+    if os.path.exists(oldest):
+        os.remove(oldest)
+    for generation in range(backups - 1, 0, -1):
+        current = backup_path(path, generation)
+        if os.path.exists(current):
+            os.replace(current, backup_path(path, generation + 1))
+
+
+def _fsync_directory(directory):
+    """Synchronise le dossier pour rendre le renommage durable (POSIX uniquement)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_json(path, default=None, backups=NB_SAUVEGARDES):
+    """
+    Lit un fichier JSON en reprenant sur la génération valide la plus récente
+
+    Si le fichier est absent ou illisible (écriture interrompue), les
+    sauvegardes fichier.1, fichier.2, ... sont essayées dans l'ordre.
+
+    Args:
+        path: Fichier à lire
+        default: Valeur retournée si aucun fichier n'existe
+        backups: Nombre de sauvegardes à essayer
+
+    Returns:
+        Les données de la génération valide la plus récente
+
+    Raises:
+        ValueError: Si des fichiers existent mais qu'aucun n'est valide
+    """
+    candidates = [path] + [backup_path(path, g) for g in range(1, backups + 1)]
+    error = None
+    found = False
+
+    for candidate in candidates:
+        if not os.path.exists(candidate):
+            continue
+        found = True
+        try:
+            with open(candidate, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            if error is None:
+                error = e
+
+    if found:
+        raise ValueError(f"Aucune version valide de {path}: {error}")
+    return default
@@ -0,0 +1,153 @@
+"""
+Module de profilage
+Chronomètres et compteurs sur les chemins critiques, journal JSONL tournant
+(activé à la demande : GESTIONNAIRE_PROFIL=1 ou main.py --profil)
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+
+from core.persistence import backup_path, rotate_backups
+
+# Taille maximale du journal avant rotation (profil.jsonl -> profil.jsonl.1)
+TAILLE_MAX_JOURNAL = 1024 * 1024
+
+# Intervalle (s) entre deux lignes de synthèse dans le journal
+INTERVALLE_SYNTHESE = 10.0
+
+# Au-delà de ce seuil (s), un appel est aussi journalisé individuellement
+SEUIL_LENT = 0.1
+
+
+class Profiler:
+    """
+    Agrège durées et compteurs par nom et les écrit dans un journal JSONL
+
+    Chaque nom mesuré garde un total depuis le démarrage (count, total, max,
+    last) et une fenêtre courante. Toutes les `interval` secondes, une ligne
+    {"type": "synthese"} résume la fenêtre ; les appels plus longs que
+    `slow` sont écrits à part ({"type": "lent"}). Utilisable depuis
+    plusieurs threads (chargements en arrière-plan).
+    """
+
+    def __init__(self, chemin, max_bytes=TAILLE_MAX_JOURNAL, backups=2,
+                 interval=INTERVALLE_SYNTHESE, slow=SEUIL_LENT):
+        self.chemin = chemin
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.interval = interval
+        self.slow = slow
+        self.lock = threading.Lock()
+        self.stats = {}     # nom -> {"count", "total", "max", "last"}
+        self.counters = {}  # nom -> nombre
+        self._window = {}   # nom -> [count, total, max] depuis la dernière synthèse
+        self._pending = []  # lignes JSON pas encore écrites
+        self._last_flush = time.monotonic()
+
+    def record(self, name, duration):
+        """Ajoute une durée (secondes) mesurée pour `name`"""
+        with self.lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                stat = self.stats[name] = {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            stat["count"] += 1
+            stat["total"] += duration
+            stat["max"] = max(stat["max"], duration)
+            stat["last"] = duration
+
+            window = self._window.setdefault(name, [0, 0.0, 0.0])
+            window[0] += 1
+            window[1] += duration
+            window[2] = max(window[2], duration)
+
+            if duration >= self.slow:
+                self._pending.append({"type": "lent", "t": round(time.time(), 3),
+                                      "nom": name, "ms": round(duration * 1000, 3)})
+        self._maybe_flush()
+
+    def count(self, name, n=1):
+        """Incrémente un compteur"""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def timed(self, name):
+        """Décorateur : chronomètre chaque appel de la fonction sous `name`"""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            wrapper.__profiled__ = True
+            return wrapper
+        return decorate
+
+    def instrument(self, cls, names, prefix):
+        """
+        Remplace des méthodes de classe par leur version chronométrée
+
+        Fait au niveau de la classe, avant toute instance : les commandes et
+        bindings Tk qui référencent ces méthodes sont mesurés eux aussi.
+        """
+        for name in names:
+            method = getattr(cls, name)
+            if getattr(method, "__profiled__", False):
+                continue
+            setattr(cls, name, self.timed(f"{prefix}.{name}")(method))
+
+    def snapshot(self):
+        """Copie des statistiques : ({nom: stat}, {compteur: n})"""
+        with self.lock:
+            return ({name: dict(stat) for name, stat in self.stats.items()},
+                    dict(self.counters))
+
+    def _maybe_flush(self):
+        """Écrit une synthèse si l'intervalle est écoulé"""
+        if time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Écrit la synthèse de la fenêtre courante et les appels lents en attente
+
+        Le verrou est gardé pendant l'écriture : deux threads ne peuvent ni
+        mêler leurs lignes ni faire tourner le journal en même temps.
+        """
+        with self.lock:
+            self._last_flush = time.monotonic()
+            lines = self._pending
+            self._pending = []
+            if self._window:
+                lines.append({
+                    "type": "synthese",
+                    "t": round(time.time(), 3),
+                    "mesures": {
+                        name: {"n": count, "ms": round(total * 1000, 3),
+                               "max_ms": round(longest * 1000, 3)}
+                        for name, (count, total, longest) in self._window.items()
+                    },
+                    "compteurs": dict(self.counters),
+                })
+            self._window = {}
+            if not lines:
+                return
+
+            try:
+                if os.path.exists(self.chemin) and os.path.getsize(self.chemin) > self.max_bytes:
+                    rotate_backups(self.chemin, self.backups)
+                    os.replace(self.chemin, backup_path(self.chemin, 1))
+                with open(self.chemin, 'a', encoding='utf-8') as f:
+                    f.write("".join(json.dumps(line, ensure_ascii=False) + "\n"
+                                    for line in lines))
+            except OSError:
+                # Le profilage ne doit jamais gêner l'application
+                pass
+
+    def close(self):
+        """Écrit la dernière synthèse"""
+        self.flush()
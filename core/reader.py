@@ -0,0 +1,46 @@
+"""
+Module de lecture par morceaux
+Lit un gros fichier texte via mmap, sans le charger entièrement en mémoire
+"""
+
+import codecs
+import io
+import mmap
+import os
+
+# Taille d'un morceau lu (octets)
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_text_chunks(path, chunk_size=CHUNK_SIZE, encoding="utf-8"):
+    """
+    Parcourt un fichier texte par morceaux décodés
+
+    Le fichier est projeté en mémoire (mmap) : seules les pages lues sont
+    chargées. Le décodage est incrémental, un caractère coupé entre deux
+    morceaux est donc reconstitué. Les fins de ligne \\r\\n et \\r sont
+    converties en \\n, comme à la lecture d'un fichier en mode texte.
+    Fermer le générateur libère le fichier.
+
+    Args:
+        path: Fichier à lire
+        chunk_size: Taille d'un morceau (octets)
+        encoding: Encodage du fichier
+
+    Yields:
+        Morceaux de texte, dans l'ordre
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder(encoding)(), translate=True
+            )
+            for start in range(0, len(data), chunk_size):
+                text = decoder.decode(data[start:start + chunk_size])
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
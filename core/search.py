@@ -0,0 +1,273 @@
+"""
+Module de recherche
+Normalisation du texte (insensible à la casse et aux accents) et index
+inversé avec recherche par préfixe et classement par pertinence
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+
+_MOT = re.compile(r"\w+")
+_DIACRITIQUES = re.compile(r"[\u0300-\u036f]")
+# Plus grand caractère : term + _FIN_PREFIXE borne les mots commençant par term
+_FIN_PREFIXE = chr(0x10FFFF)
+
+
+def normalize(text):
+    """
+    Met un texte sous forme comparable : minuscules et sans accents
+
+    Exemple:
+        normalize("Réunion Été") -> "reunion ete"
+    """
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return _DIACRITIQUES.sub("", decomposed).casefold()
+
+
+def tokenize(text):
+    """Découpe un texte normalisé en mots"""
+    return _MOT.findall(normalize(text))
+
+
+class InvertedIndex:
+    """
+    Index inversé incrémental sur plusieurs champs pondérés
+
+    Chaque mot pointe vers les documents qui le contiennent, avec un poids
+    (fréquence × poids du champ). La recherche exige tous les mots de la
+    requête, chacun pouvant être le préfixe d'un mot indexé ; les résultats
+    sont classés par score TF-IDF.
+
+    Usage:
+        index = InvertedIndex({"title": 3.0, "content": 1.0})
+        index.add(0, title="Réunion", content="ordre du jour")
+        index.search("reu")  -> [0]
+    """
+
+    def __init__(self, weights=None):
+        self.weights = weights or {}
+        self.postings = {}       # mot -> {doc_id: poids}
+        self.doc_terms = {}      # doc_id -> mots indexés (pour la suppression)
+        self.vocabulary = []     # mots triés, pour la recherche par préfixe
+
+    def __len__(self):
+        return len(self.doc_terms)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.doc_terms
+
+    def clear(self):
+        """Vide l'index"""
+        self.postings.clear()
+        self.doc_terms.clear()
+        self.vocabulary = []
+
+    def build(self, documents):
+        """
+        Reconstruit l'index complet en une passe
+
+        Args:
+            documents: Itérable de (doc_id, {champ: texte})
+        """
+        self.clear()
+        for doc_id, fields in documents:
+            self._index(doc_id, fields)
+        self.vocabulary = sorted(self.postings)
+
+    def add(self, doc_id, **fields):
+        """Indexe (ou réindexe) un document"""
+        if doc_id in self.doc_terms:
+            self.remove(doc_id)
+
+        for token in self._index(doc_id, fields):
+            self.vocabulary.insert(bisect_left(self.vocabulary, token), token)
+
+    def _index(self, doc_id, fields):
+        """Ajoute les mots d'un document, retourne les mots nouveaux dans l'index"""
+        weights = {}
+        for field, text in fields.items():
+            field_weight = self.weights.get(field, 1.0)
+            for token, count in Counter(tokenize(text or "")).items():
+                weights[token] = weights.get(token, 0.0) + count * field_weight
+
+        new_tokens = []
+        for token, weight in weights.items():
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = {}
+                new_tokens.append(token)
+            postings[doc_id] = weight
+
+        self.doc_terms[doc_id] = tuple(weights)
+        return new_tokens
+
+    def remove(self, doc_id):
+        """Retire un document de l'index"""
+        for token in self.doc_terms.pop(doc_id, ()):
+            postings = self.postings[token]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.postings[token]
+                i = bisect_left(self.vocabulary, token)
+                if i < len(self.vocabulary) and self.vocabulary[i] == token:
+                    del self.vocabulary[i]
+
+    def _expand(self, term):
+        """
+        Retourne tous les mots indexés commençant par `term`
+
+        Les mots d'un même préfixe sont contigus dans le vocabulaire trié :
+        deux recherches dichotomiques bornent la plage, sans limite de taille
+        (un préfixe court ne doit perdre aucun document).
+        """
+        start = bisect_left(self.vocabulary, term)
+        end = bisect_left(self.vocabulary, term + _FIN_PREFIXE, start)
+        return self.vocabulary[start:end]
+
+    def search(self, query, limit=None):
+        """
+        Recherche les documents contenant tous les mots de la requête
+
+        Args:
+            query: Texte recherché (chaque mot peut être un préfixe)
+            limit: Nombre maximal de résultats (tous par défaut)
+
+        Returns:
+            Liste des doc_id, du plus pertinent au moins pertinent
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        total = len(self.doc_terms)
+        per_term = []
+        for term in set(terms):
+            scores = {}
+            for token in self._expand(term):
+                postings = self.postings[token]
+                idf = math.log(1 + total / len(postings))
+                # Un mot exact compte plus qu'un simple préfixe
+                boost = 1.0 if token == term else 0.5
+                for doc_id, weight in postings.items():
+                    score = weight * idf * boost
+                    if score > scores.get(doc_id, 0.0):
+                        scores[doc_id] = score
+            if not scores:
+                return []
+            per_term.append(scores)
+
+        # Intersection en partant du mot le plus rare
+        per_term.sort(key=len)
+        results = per_term[0]
+        for scores in per_term[1:]:
+            results = {d: s + scores[d] for d, s in results.items() if d in scores}
+
+        if limit is None:
+            ranked = sorted(results.items(), key=lambda item: item[1], reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, results.items(), key=lambda item: item[1])
+        return [doc_id for doc_id, score in ranked]
+
+
+class NgramIndex:
+    """
+    Index de trigrammes pour la recherche de sous-chaînes
+
+    Le texte normalisé de chaque document est découpé en trigrammes ; une
+    requête ne vérifie que les documents qui contiennent tous ses
+    trigrammes. Même résultat qu'un `query in text` sur tous les
+    documents, mais sans les parcourir.
+
+    Usage:
+        index = NgramIndex()
+        index.add(0, "Préparer la réunion")
+        index.search("REUNI")  -> {0}
+    """
+
+    N = 3
+
+    def __init__(self):
+        self.texts = {}      # doc_id -> texte normalisé
+        self.postings = {}   # trigramme -> {doc_id}
+
+    def __len__(self):
+        return len(self.texts)
+
+    def _grams(self, text):
+        """Trigrammes distincts d'un texte normalisé"""
+        return {text[i:i + self.N] for i in range(len(text) - self.N + 1)}
+
+    def clear(self):
+        """Vide l'index"""
+        self.texts.clear()
+        self.postings.clear()
+
+    def build(self, documents):
+        """Reconstruit l'index à partir d'un itérable de (doc_id, texte)"""
+        self.clear()
+        for doc_id, text in documents:
+            self.add(doc_id, text)
+
+    def add(self, doc_id, text):
+        """Indexe (ou réindexe) un document"""
+        if doc_id in self.texts:
+            self.remove(doc_id)
+
+        normalized = normalize(text)
+        self.texts[doc_id] = normalized
+        for gram in self._grams(normalized):
+            postings = self.postings.get(gram)
+            if postings is None:
+                postings = self.postings[gram] = set()
+            postings.add(doc_id)
+
+    def remove(self, doc_id):
+        """Retire un document de l'index"""
+        normalized = self.texts.pop(doc_id, None)
+        if normalized is None:
+            return
+        for gram in self._grams(normalized):
+            postings = self.postings.get(gram)
+            if postings is not None:
+                postings.discard(doc_id)
+                if not postings:
+                    del self.postings[gram]
+
+    def matches(self, doc_id, query):
+        """Indique si un document contient la requête"""
+        return normalize(query) in self.texts.get(doc_id, "")
+
+    def search(self, query):
+        """
+        Retourne l'ensemble des doc_id dont le texte contient la requête
+
+        La comparaison ignore la casse et les accents.
+        """
+        q = normalize(query)
+        if not q:
+            return set(self.texts)
+
+        if len(q) < self.N:
+            return {doc_id for doc_id, text in self.texts.items() if q in text}
+
+        # Intersection des trigrammes, du plus rare au plus fréquent
+        grams = sorted(self._grams(q), key=lambda g: len(self.postings.get(g, ())))
+        candidates = None
+        for gram in grams:
+            postings = self.postings.get(gram)
+            if not postings:
+                return set()
+            if candidates is None:
+                candidates = set(postings)
+            else:
+                candidates &= postings
+            if not candidates:
+                return set()
+
+        return {doc_id for doc_id in candidates if q in self.texts[doc_id]}
@@ -0,0 +1,43 @@
+"""
+Module des paramètres
+Préférences de l'utilisateur enregistrées à part des données
+"""
+
+from core.persistence import atomic_write_json, read_json
+
+
+class Settings:
+    """
+    Paramètres clé -> valeur dans un petit fichier JSON
+
+    Le fichier est lu à la première demande ; un fichier absent ou
+    illisible donne les valeurs par défaut.
+
+    Usage:
+        parametres = Settings("parametres.json")
+        parametres.get("tri_taches", [])
+        parametres.set("tri_taches", [["date", True]])
+    """
+
+    def __init__(self, chemin):
+        self.chemin = chemin
+        self._values = None
+
+    def _load(self):
+        """Lit le fichier une seule fois"""
+        if self._values is None:
+            try:
+                values = read_json(self.chemin, default={})
+            except ValueError:
+                values = {}
+            self._values = values if isinstance(values, dict) else {}
+        return self._values
+
+    def get(self, key, default=None):
+        """Retourne la valeur d'un paramètre"""
+        return self._load().get(key, default)
+
+    def set(self, key, value):
+        """Modifie un paramètre et réécrit le fichier"""
+        self._load()[key] = value
+        atomic_write_json(self.chemin, self._values, backups=1)
@@ -0,0 +1,202 @@
+"""
+Module de tri
+Ordres d'affichage tenus à jour sans retrier ni modifier la collection
+"""
+
+from bisect import bisect_left, insort
+
+
+class SortedIndex:
+    """
+    Id d'éléments triés par une clé, tenus à jour par insertion dichotomique
+
+    Les couples (clé, id) sont gardés en ordre croissant ; avec
+    reverse=True, les positions retournées sont celles de l'ordre
+    décroissant (la plus grande clé en position 0). L'id départage les
+    clés égales.
+
+    Usage:
+        ordre = SortedIndex(lambda n: n["date_modified"], reverse=True)
+        ordre.build(notes)
+        ordre[0]                        # id de la note la plus récente
+        ancienne = ordre.remove(note["id"])
+        nouvelle = ordre.insert(note)   # position d'affichage
+    """
+
+    def __init__(self, key, reverse=False):
+        self.key = key
+        self.reverse = reverse
+        self._entries = []   # (clé, id), croissant
+        self._keys = {}      # id -> clé au moment de l'insertion
+
+    def build(self, items):
+        """Reconstruit l'index (un seul tri)"""
+        self._keys = {item["id"]: self.key(item) for item in items}
+        self._entries = sorted((key, item_id) for item_id, key in self._keys.items())
+
+    def _display(self, position, size):
+        """Convertit une position interne en position d'affichage"""
+        return size - 1 - position if self.reverse else position
+
+    def insert(self, item):
+        """Ajoute un élément et retourne sa position d'affichage"""
+        entry = (self.key(item), item["id"])
+        self._keys[item["id"]] = entry[0]
+        insort(self._entries, entry)
+        return self._display(bisect_left(self._entries, entry), len(self._entries))
+
+    def remove(self, item_id):
+        """Retire un élément et retourne la position d'affichage qu'il avait"""
+        entry = (self._keys.pop(item_id), item_id)
+        position = bisect_left(self._entries, entry)
+        size = len(self._entries)
+        del self._entries[position]
+        return self._display(position, size)
+
+    def index(self, item_id):
+        """Position d'affichage d'un élément"""
+        position = bisect_left(self._entries, (self._keys[item_id], item_id))
+        return self._display(position, len(self._entries))
+
+    def between(self, low, high):
+        """Id dont la clé est dans [low, high[ (par clé croissante)"""
+        start = bisect_left(self._entries, (low,))
+        end = bisect_left(self._entries, (high,))
+        return [item_id for _, item_id in self._entries[start:end]]
+
+    def __getitem__(self, position):
+        """Id à une position d'affichage, en O(1) (ou liste d'id pour une tranche)"""
+        size = len(self._entries)
+        if isinstance(position, slice):
+            start, stop, _ = position.indices(size)
+            if self.reverse:
+                entries = self._entries[size - stop:size - start][::-1]
+            else:
+                entries = self._entries[start:stop]
+            return [item_id for _, item_id in entries]
+        if position < 0 or position >= size:
+            raise IndexError(position)
+        return self._entries[self._display(position, size)][1]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item_id):
+        return item_id in self._keys
+
+    def __iter__(self):
+        """Parcourt les id dans l'ordre d'affichage"""
+        entries = reversed(self._entries) if self.reverse else self._entries
+        return (item_id for _, item_id in entries)
+
+
+class _Descending:
+    """Inverse l'ordre d'une valeur (clé décroissante dans un tri composite)"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class SortEngine:
+    """
+    Ordre d'affichage calculé sans modifier ni réécrire les données
+
+    Le tri est décrit par une liste de (nom de clé, décroissant), appliquée
+    dans l'ordre : [("completed", False), ("date", True)] met les tâches
+    actives d'abord, puis les plus récentes. Le tri est stable : à clés
+    égales, l'ordre de la collection est conservé. Une liste vide donne
+    l'ordre de la collection.
+
+    La permutation est gardée en cache jusqu'à invalidate() ; insert,
+    remove et update la tiennent à jour élément par élément.
+
+    Usage:
+        moteur = SortEngine({"date": lambda t: t["ts"]}, [("date", True)])
+        ids = moteur.order(taches)        # tri calculé une fois
+        position = moteur.insert(tache)   # puis tenu à jour
+    """
+
+    def __init__(self, keys, spec=()):
+        self.keys = keys
+        self.spec = []
+        self._entries = None   # (clé composite, rang, id), croissant
+        self._ranks = {}       # id -> (clé composite, rang)
+        self._next_rank = 0
+        self.set_spec(spec)
+
+    def set_spec(self, spec):
+        """Change le tri (les clés inconnues sont ignorées)"""
+        self.spec = [(name, bool(descending)) for name, descending in spec if name in self.keys]
+        self.invalidate()
+
+    def uses(self, name):
+        """Vrai si la clé fait partie du tri"""
+        return any(key == name for key, _ in self.spec)
+
+    def invalidate(self):
+        """Oublie la permutation (recalculée au prochain order())"""
+        self._entries = None
+        self._ranks = {}
+
+    def composite(self, item):
+        """Clé composite d'un élément"""
+        return tuple(
+            _Descending(self.keys[name](item)) if descending else self.keys[name](item)
+            for name, descending in self.spec
+        )
+
+    def build(self, items):
+        """Calcule la permutation (un seul tri)"""
+        self._ranks = {
+            item["id"]: (self.composite(item), rank) for rank, item in enumerate(items)
+        }
+        self._next_rank = len(self._ranks)
+        self._entries = sorted(
+            (key, rank, item_id) for item_id, (key, rank) in self._ranks.items()
+        )
+
+    def order(self, items):
+        """Id dans l'ordre d'affichage (permutation en cache)"""
+        if self._entries is None:
+            self.build(items)
+        return [item_id for _, _, item_id in self._entries]
+
+    def insert(self, item):
+        """Ajoute un élément (après les autres à clés égales) ; retourne sa position"""
+        if self._entries is None:
+            return None
+        entry = (self.composite(item), self._next_rank, item["id"])
+        self._next_rank += 1
+        self._ranks[item["id"]] = entry[:2]
+        position = bisect_left(self._entries, entry)
+        self._entries.insert(position, entry)
+        return position
+
+    def remove(self, item_id):
+        """Retire un élément ; retourne la position qu'il avait"""
+        if self._entries is None or item_id not in self._ranks:
+            return None
+        key, rank = self._ranks.pop(item_id)
+        position = bisect_left(self._entries, (key, rank, item_id))
+        del self._entries[position]
+        return position
+
+    def update(self, item):
+        """Replace un élément modifié ; retourne (ancienne, nouvelle) position"""
+        if self._entries is None or item["id"] not in self._ranks:
+            return None, None
+        key, rank = self._ranks[item["id"]]
+        old = self.remove(item["id"])
+        entry = (self.composite(item), rank, item["id"])
+        self._ranks[item["id"]] = entry[:2]
+        new = bisect_left(self._entries, entry)
+        self._entries.insert(new, entry)
+        return old, new
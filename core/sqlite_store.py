@@ -0,0 +1,438 @@
+"""
+Module de stockage SQLite
+Backend optionnel pour les tâches et les notes, écrit ligne par ligne,
+avec migration unique depuis les fichiers JSON existants
+
+Les tâches et l'index des notes sont chargés en mémoire (filtres, tri et
+recherche se font dans core) : seuls id et position sont indexés.
+"""
+
+import sqlite3
+import threading
+
+from core.dates import to_timestamp
+from core.journal import TaskJournal
+from core.models import Collection
+from core.persistence import read_json
+from core.reader import CHUNK_SIZE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    date TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_id ON tasks(id);
+CREATE INDEX IF NOT EXISTS idx_tasks_position ON tasks(position);
+
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    date_created TEXT NOT NULL,
+    date_modified TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notes_id ON notes(id);
+
+-- Index jamais interrogés (les filtres se font en mémoire) : retirés des
+-- bases créées par les versions précédentes
+DROP INDEX IF EXISTS idx_tasks_date;
+DROP INDEX IF EXISTS idx_tasks_completed;
+DROP INDEX IF EXISTS idx_tasks_ts;
+DROP INDEX IF EXISTS idx_notes_date_modified;
+"""
+
+# Colonnes d'horodatage ajoutées aux bases existantes : (table, colonne, date source ou None)
+TIMESTAMP_COLUMNS = [
+    ("tasks", "ts", "date"),
+    ("tasks", "completed_ts", None),
+    ("notes", "created_ts", "date_created"),
+    ("notes", "modified_ts", "date_modified"),
+]
+
+
+def connect(chemin):
+    """Ouvre la base et crée le schéma si besoin"""
+    # Ouverte par load(), dans un thread de fond (voir loader.py)
+    connection = sqlite3.connect(chemin, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    _add_timestamp_columns(connection)
+    return connection
+
+
+def _add_timestamp_columns(connection):
+    """Ajoute et remplit une seule fois les colonnes d'horodatage"""
+    for table, column, source in TIMESTAMP_COLUMNS:
+        columns = {row["name"] for row in connection.execute(f"PRAGMA table_info({table})")}
+        if column in columns:
+            continue
+        with connection:
+            connection.execute(
+                f"ALTER TABLE {table} ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+            )
+            if source is None:
+                continue
+            rows = connection.execute(f"SELECT rowid, {source} FROM {table}").fetchall()
+            connection.executemany(
+                f"UPDATE {table} SET {column} = ? WHERE rowid = ?",
+                [(to_timestamp(row[source]), row["rowid"]) for row in rows]
+            )
+
+
+def get_meta(connection, key, default=None):
+    """Lit une valeur de la table meta"""
+    row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else default
+
+
+def set_meta(connection, key, value):
+    """Écrit une valeur dans la table meta"""
+    connection.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value))
+    )
+
+
+def _migrate_once(connection, key, fichier_json, read, insert, next_id_key):
+    """
+    Importe les données JSON une seule fois (marqueur dans la table meta)
+
+    Args:
+        read: Fonction sans argument retournant la Collection à importer
+    """
+    if get_meta(connection, key) is not None:
+        return
+
+    with connection:
+        items = read()
+        insert(connection, items)
+        set_meta(connection, next_id_key, items.next_id)
+        set_meta(connection, key, fichier_json)
+
+
+def _read_task_journal(fichier_json):
+    """Tâches du stockage JSON : instantané et journaux pas encore compactés"""
+    journal = TaskJournal(fichier_json)
+    try:
+        return journal.load()
+    finally:
+        journal.close()
+
+
+class SQLiteTaskBackend:
+    """
+    Backend SQLite des tâches
+
+    Même interface que core.TaskJournal : chaque action écrit une seule
+    ligne, retrouvée par l'index sur id. Le compteur d'id est conservé
+    dans la table meta.
+
+    La base n'est ouverte (schéma, colonnes ajoutées, import du JSON)
+    qu'au premier load(), exécuté hors du thread Tk.
+    """
+
+    def __init__(self, chemin_bd, fichier_json=None):
+        self.chemin = chemin_bd
+        self.fichier_json = fichier_json
+        self.connection = None
+
+    def _open(self):
+        """Ouvre la base et importe les tâches JSON une seule fois"""
+        if self.connection is not None:
+            return
+        connection = connect(self.chemin)
+        try:
+            if self.fichier_json:
+                _migrate_once(connection, "migration_taches", self.fichier_json,
+                              lambda: _read_task_journal(self.fichier_json),
+                              self._insert_all, "next_id_taches")
+        except BaseException:
+            connection.close()
+            raise
+        self.connection = connection
+
+    @staticmethod
+    def _insert_all(connection, tasks):
+        """Insère une collection de tâches en conservant leur ordre"""
+        connection.executemany(
+            "INSERT INTO tasks (id, text, completed, date, ts, completed_ts, position) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (t["id"], t.get("text", "Tâche sans titre"),
+                 int(bool(t.get("completed", False))), t.get("date", ""),
+                 t.get("ts", to_timestamp(t.get("date", ""))), t.get("completed_ts", 0), i)
+                for i, t in enumerate(tasks)
+            ]
+        )
+
+    def load(self):
+        """Retourne une Collection de toutes les tâches, dans l'ordre enregistré"""
+        self._open()
+        rows = self.connection.execute(
+            "SELECT id, text, completed, date, ts, completed_ts FROM tasks ORDER BY position"
+        )
+        tasks = [
+            {"id": row["id"], "text": row["text"],
+             "completed": bool(row["completed"]), "date": row["date"], "ts": row["ts"],
+             "completed_ts": row["completed_ts"]}
+            for row in rows
+        ]
+        next_id = int(get_meta(self.connection, "next_id_taches", 0))
+        return Collection(tasks, next_id=next_id)
+
+    def add(self, task):
+        """Ajoute une tâche en fin de liste"""
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO tasks (id, text, completed, date, ts, position) "
+                "VALUES (?, ?, ?, ?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM tasks))",
+                (task["id"], task["text"], int(task["completed"]), task["date"], task["ts"])
+            )
+            set_meta(self.connection, "next_id_taches", task["id"] + 1)
+
+    def toggle(self, task):
+        """Enregistre le nouvel état d'une tâche"""
+        with self.connection:
+            self.connection.execute(
+                "UPDATE tasks SET completed = ?, completed_ts = ? WHERE id = ?",
+                (int(task["completed"]), task.get("completed_ts", 0), task["id"])
+            )
+
+    def delete(self, ids):
+        """Supprime une ou plusieurs tâches"""
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id in ids]
+            )
+
+    def needs_compaction(self):
+        """Les écritures sont déjà unitaires : aucun compactage automatique"""
+        return False
+
+    def compact(self, tasks, background=True):
+        """Réécrit toutes les tâches (après une correction des données au chargement)"""
+        with self.connection:
+            self.connection.execute("DELETE FROM tasks")
+            self._insert_all(self.connection, tasks)
+            set_meta(self.connection, "next_id_taches", tasks.next_id)
+
+    def wait(self):
+        """Aucune tâche de fond à attendre"""
+
+    def close(self):
+        """Ferme la base (si elle a été ouverte)"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class SQLiteNoteBackend:
+    """
+    Backend SQLite des notes
+
+    Le chargement ne lit que les titres et les dates ; le contenu d'une
+    note est lu à la demande (load_content) lorsqu'elle est ouverte.
+    Comme pour les tâches, la base n'est ouverte qu'au premier load().
+    """
+
+    def __init__(self, chemin_bd, fichier_json=None, load_content=None):
+        """
+        Args:
+            chemin_bd: Fichier de la base
+            fichier_json: Index JSON des notes à importer une seule fois
+            load_content: Lecture du contenu d'une note absente de l'index JSON
+        """
+        self.chemin = chemin_bd
+        self.fichier_json = fichier_json
+        self.json_content = load_content
+        self.connection = None
+        # Les écritures se font dans un thread de fond (voir core.autosave)
+        self.lock = threading.Lock()
+
+    def _open(self):
+        """Ouvre la base et importe les notes JSON une seule fois (sous le verrou)"""
+        if self.connection is not None:
+            return
+        connection = connect(self.chemin)
+        try:
+            if self.fichier_json:
+                _migrate_once(
+                    connection, "migration_notes", self.fichier_json,
+                    lambda: Collection.from_json(read_json(self.fichier_json), "notes"),
+                    lambda c, notes: self._insert_all(c, notes, self.json_content),
+                    "next_id_notes"
+                )
+        except BaseException:
+            connection.close()
+            raise
+        self.connection = connection
+
+    @staticmethod
+    def _insert_all(connection, notes, load_content=None):
+        """Insère une collection de notes"""
+        def content(note):
+            if "content" in note or load_content is None:
+                return note.get("content", "")
+            return load_content(note["id"])
+
+        connection.executemany(
+            "INSERT INTO notes (id, title, content, date_created, date_modified, "
+            "created_ts, modified_ts) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (n["id"], n.get("title", ""), content(n),
+                 n.get("date_created", ""), n.get("date_modified", ""),
+                 n.get("created_ts", to_timestamp(n.get("date_created", ""))),
+                 n.get("modified_ts", to_timestamp(n.get("date_modified", ""))))
+                for n in notes
+            ]
+        )
+
+    def load(self):
+        """Retourne une Collection de notes sans leur contenu (titres et dates)"""
+        # Connexion partagée avec le thread d'écriture (core.autosave)
+        with self.lock:
+            self._open()
+            rows = self.connection.execute(
+                "SELECT rowid, id, title, date_created, date_modified, created_ts, modified_ts "
+                "FROM notes ORDER BY rowid"
+            )
+            notes = []
+            duplicates = []
+            seen = set()
+            for row in rows:
+                note = {"id": row["id"], "title": row["title"],
+                        "date_created": row["date_created"],
+                        "date_modified": row["date_modified"],
+                        "created_ts": row["created_ts"], "modified_ts": row["modified_ts"]}
+                if note["id"] in seen:
+                    duplicates.append((row["rowid"], note))
+                seen.add(note["id"])
+                notes.append(note)
+
+            next_id = int(get_meta(self.connection, "next_id_notes", 0))
+            collection = Collection(notes, next_id=next_id)
+
+            # Les id en double ont été réattribués : on les enregistre
+            if duplicates:
+                with self.connection:
+                    self.connection.executemany(
+                        "UPDATE notes SET id = ? WHERE rowid = ?",
+                        [(note["id"], rowid) for rowid, note in duplicates]
+                    )
+                    set_meta(self.connection, "next_id_notes", collection.next_id)
+                collection.reassigned = 0
+            return collection
+
+    def load_content(self, note_id):
+        """Lit le contenu d'une note"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT content FROM notes WHERE id = ?", (note_id,)
+            ).fetchone()
+        return row["content"] if row else ""
+
+    def content_size(self, note_id):
+        """Taille du contenu d'une note (octets)"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT length(CAST(content AS BLOB)) AS size FROM notes WHERE id = ?",
+                (note_id,)
+            ).fetchone()
+        return (row["size"] or 0) if row else 0
+
+    def iter_content(self, note_id, chunk_size=CHUNK_SIZE):
+        """Parcourt le contenu d'une note par morceaux"""
+        content = self.load_content(note_id)
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+
+    def iter_documents(self, notes, batch=500):
+        """
+        Parcourt (id, {"title", "content"}) depuis la base, sans tout garder en mémoire
+
+        Lu par paquets de `batch` lignes, chacun sous le verrou : le thread
+        d'écriture n'attend pas la fin du parcours (index de recherche).
+        """
+        last = 0
+        while True:
+            with self.lock:
+                rows = self.connection.execute(
+                    "SELECT rowid, id, title, content FROM notes WHERE rowid > ? "
+                    "ORDER BY rowid LIMIT ?", (last, batch)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row["id"], {"title": row["title"], "content": row["content"]}
+            last = rows[-1]["rowid"]
+
+    def save(self, notes, note=None):
+        """
+        Insère ou met à jour une seule note
+
+        Sans `note`, toutes les notes dont le contenu est chargé sont écrites.
+        """
+        targets = [note] if note is not None else [n for n in notes if "content" in n]
+        self._write(targets, notes.next_id)
+
+    def _write(self, targets, next_id):
+        """Écrit des notes et le prochain id dans une transaction"""
+        with self.lock, self.connection:
+            for n in targets:
+                self._upsert(n)
+            set_meta(self.connection, "next_id_notes", next_id)
+
+    def _upsert(self, note):
+        """Met à jour la note ou l'insère"""
+        cursor = self.connection.execute(
+            "UPDATE notes SET title = ?, content = ?, date_modified = ?, modified_ts = ? "
+            "WHERE id = ?",
+            (note["title"], note["content"], note["date_modified"], note["modified_ts"],
+             note["id"])
+        )
+        if cursor.rowcount == 0:
+            self.connection.execute(
+                "INSERT INTO notes (id, title, content, date_created, date_modified, "
+                "created_ts, modified_ts) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (note["id"], note["title"], note["content"], note["date_created"],
+                 note["date_modified"], note["created_ts"], note["modified_ts"])
+            )
+
+    def delete(self, notes, note_id):
+        """Supprime une note"""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+
+    def save_jobs(self, notes, note=None):
+        """
+        Prépare l'écriture d'une seule note pour le thread de fond
+
+        La note est copiée dans le thread Tk ; la clé est son id, donc
+        les sauvegardes successives d'une même note sont fusionnées.
+        """
+        next_id = notes.next_id
+        if note is None:
+            targets = [dict(n) for n in notes if "content" in n]
+            return [("notes", lambda: self._write(targets, next_id))]
+        copie = dict(note)
+        return [(copie["id"], lambda: self._write([copie], next_id))]
+
+    def delete_jobs(self, notes, note_id):
+        """Prépare la suppression d'une note pour le thread de fond"""
+        return [(note_id, lambda: self.delete(notes, note_id))]
+
+    def close(self):
+        """Ferme la base (si elle a été ouverte)"""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
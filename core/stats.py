@@ -0,0 +1,82 @@
+"""
+Module des statistiques
+Compteurs de tâches tenus à jour à chaque modification
+"""
+
+from collections import Counter
+from datetime import datetime
+
+from core.dates import DAY_FORMAT
+
+
+def day_of(ts):
+    """Jour ("AAAA-MM-JJ") d'un horodatage"""
+    return datetime.fromtimestamp(ts).strftime(DAY_FORMAT)
+
+
+def _bump(counter, day, delta):
+    """Modifie un compteur par jour (les jours revenus à zéro sont retirés)"""
+    counter[day] += delta
+    if not counter[day]:
+        del counter[day]
+
+
+class TaskStats:
+    """
+    Compteurs des tâches : total, terminées, créées et terminées par jour
+
+    Chaque modification retire la tâche des compteurs puis l'y remet
+    (remove/add), ce qui coûte O(1) : les statistiques ne reparcourent
+    jamais la liste. Une tâche terminée sans date de fin connue
+    (completed_ts à 0, anciennes données) n'est pas comptée par jour.
+
+    Usage:
+        stats = TaskStats()
+        stats.build(taches)
+        stats.remove(tache); tache["completed"] = True; stats.add(tache)
+        stats.percentage
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.completed = 0
+        self.created_per_day = Counter()
+        self.completed_per_day = Counter()
+
+    def build(self, tasks):
+        """Recompte toutes les tâches (chargement)"""
+        self.__init__()
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task):
+        """Compte une tâche"""
+        self._count(task, 1)
+
+    def remove(self, task):
+        """Retire une tâche des compteurs"""
+        self._count(task, -1)
+
+    def _count(self, task, delta):
+        """Ajoute delta aux compteurs concernés par la tâche"""
+        self.total += delta
+        _bump(self.created_per_day, day_of(task["ts"]), delta)
+        if task["completed"]:
+            self.completed += delta
+            if task.get("completed_ts"):
+                _bump(self.completed_per_day, day_of(task["completed_ts"]), delta)
+
+    def for_day(self, day=None):
+        """(créées, terminées) un jour donné ("AAAA-MM-JJ", aujourd'hui par défaut)"""
+        day = day or datetime.now().strftime(DAY_FORMAT)
+        return self.created_per_day[day], self.completed_per_day[day]
+
+    @property
+    def remaining(self):
+        """Tâches non terminées"""
+        return self.total - self.completed
+
+    @property
+    def percentage(self):
+        """Pourcentage de tâches terminées"""
+        return (self.completed / self.total) * 100 if self.total else 0
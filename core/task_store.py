@@ -0,0 +1,277 @@
+"""
+Module du magasin de tâches
+Logique des tâches (ajout, bascule, suppression, tri, filtres, chargement
+et sauvegarde) sans interface : utilisable par la vue Tk, un script ou un
+banc d'essai
+"""
+
+from core.dates import TASK_DATE_FORMAT, now_stamp
+from core.migrations import migrate_tasks
+from core.models import Collection, ReadOnlyError
+from core.search import NgramIndex, normalize
+from core.sorting import SortEngine, SortedIndex
+from core.stats import TaskStats
+
+
+class TaskStore:
+    """
+    Tâches, index et compteurs, tenus à jour ensemble
+
+    Chaque modification est enregistrée tout de suite dans le backend
+    (journal JSON ou SQLite, voir core.backends). Une erreur d'écriture
+    est transmise à on_error si fourni, sinon levée ; la modification en
+    mémoire est conservée dans les deux cas. Après un échec de chargement
+    (reset), les modifications lèvent ReadOnlyError.
+
+    Usage:
+        store = TaskStore(TaskJournal("taches.json"))
+        store.load()
+        task, position = store.add("Acheter du pain")
+        store.view(search="pain")
+        store.stats.percentage
+    """
+
+    # Clés de tri disponibles (voir core.sorting.SortEngine)
+    SORT_KEYS = {
+        "date": lambda task: task["ts"],
+        "alpha": lambda task: normalize(task["text"]),
+        "completed": lambda task: task["completed"],
+    }
+
+    # Paramètre où le tri choisi est mémorisé
+    SORT_SETTING = "tri_taches"
+
+    def __init__(self, backend, settings=None, on_error=None):
+        """
+        Args:
+            backend: Stockage des tâches (TaskJournal ou SQLiteTaskBackend)
+            settings: Paramètres où mémoriser le tri (core.Settings, optionnel)
+            on_error: Fonction appelée avec l'exception d'une écriture échouée
+        """
+        self.backend = backend
+        self.settings = settings
+        self.on_error = on_error
+
+        self.tasks = Collection()
+        # Vrai après un échec de chargement : plus aucune écriture
+        self.read_only = False
+        self.search_index = NgramIndex()
+        self.time_index = SortedIndex(lambda task: task["ts"])
+        spec = settings.get(self.SORT_SETTING, []) if settings is not None else []
+        self.sort_engine = SortEngine(self.SORT_KEYS, spec)
+        self.stats = TaskStats()
+
+    # ------------------------------------------------------------------
+    # Chargement et sauvegarde
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """
+        Lit, migre et indexe les tâches (peut tourner hors du thread Tk)
+
+        Les index sont construits à part puis installés d'un coup.
+
+        Returns:
+            True si les tâches viennent d'être migrées et doivent être
+            réécrites (voir save_all)
+        """
+        # Reprend sur la dernière sauvegarde valide si le fichier est corrompu
+        tasks = self.backend.load()
+
+        # Mise au format courant, une seule fois (les fichiers à jour ne sont pas parcourus)
+        migrated = migrate_tasks(tasks)
+
+        search_index = NgramIndex()
+        search_index.build((t["id"], t["text"]) for t in tasks)
+        time_index = SortedIndex(lambda task: task["ts"])
+        time_index.build(tasks)
+        sort_engine = SortEngine(self.SORT_KEYS, self.sort_engine.spec)
+        sort_engine.build(tasks)
+        stats = TaskStats()
+        stats.build(tasks)
+
+        self.tasks, self.search_index, self.time_index = tasks, search_index, time_index
+        self.sort_engine, self.stats = sort_engine, stats
+        self.read_only = False
+        return migrated
+
+    def reset(self):
+        """
+        Repart d'une liste vide en lecture seule (après une erreur de chargement)
+
+        Les tâches enregistrées n'ont pas été lues : une tâche ajoutée
+        recevrait un id déjà utilisé.
+        """
+        self.read_only = True
+        self.tasks = Collection()
+        self.search_index = NgramIndex()
+        self.time_index.build(self.tasks)
+        self.sort_engine.invalidate()
+        self.stats.build(self.tasks)
+
+    def _check_writable(self):
+        """Refuse toute modification après un échec de chargement"""
+        if self.read_only:
+            raise ReadOnlyError("Les tâches n'ont pas pu être chargées : modifications désactivées")
+
+    def save_all(self):
+        """Réécrit toutes les tâches (instantané écrit en arrière-plan)"""
+        self._check_writable()
+        self._record(self.backend.compact, self.tasks)
+
+    def _record(self, record, *args):
+        """Enregistre une seule modification, compacte le journal si besoin"""
+        try:
+            record(*args)
+            if self.backend.needs_compaction():
+                self.backend.compact(self.tasks)
+        except Exception as e:
+            self._failed(e)
+
+    def _failed(self, error):
+        """Transmet une erreur d'écriture à on_error, ou la lève"""
+        if self.on_error is None:
+            raise error
+        self.on_error(error)
+
+    def close(self):
+        """Termine les écritures et libère le stockage (erreur transmise à on_error)"""
+        try:
+            self.backend.close()
+        except Exception as e:
+            self._failed(e)
+
+    # ------------------------------------------------------------------
+    # Modifications
+    # ------------------------------------------------------------------
+
+    def add(self, text):
+        """
+        Ajoute une tâche
+
+        Returns:
+            (tâche, position dans l'ordre d'affichage complet)
+        """
+        self._check_writable()
+        date, ts = now_stamp(TASK_DATE_FORMAT)
+        task = {
+            "text": text,
+            "completed": False,
+            "date": date,
+            "ts": ts
+        }
+
+        # Un id unique est alloué par la collection
+        self.tasks.add(task)
+        self.search_index.add(task["id"], task["text"])
+        self.time_index.insert(task)
+        self.stats.add(task)
+        position = self.sort_engine.insert(task)
+        self._record(self.backend.add, task)
+        return task, position
+
+    def toggle(self, task_id):
+        """
+        Change l'état d'une tâche (terminée/non terminée)
+
+        Returns:
+            (tâche, déplacement) : déplacement vaut (ancienne, nouvelle)
+            position si le tri dépend de l'état, sinon None. La tâche vaut
+            None si l'id est inconnu.
+        """
+        self._check_writable()
+        task = self.tasks.get(task_id)
+        if task is None:
+            return None, None
+
+        self.stats.remove(task)
+        task["completed"] = not task["completed"]
+        task["completed_ts"] = now_stamp(TASK_DATE_FORMAT)[1] if task["completed"] else 0
+        self.stats.add(task)
+
+        move = self.sort_engine.update(task) if self.sort_engine.uses("completed") else None
+        self._record(self.backend.toggle, task)
+        return task, move
+
+    def delete(self, task_id):
+        """Supprime une tâche ; retourne la tâche (None si inconnue)"""
+        self._check_writable()
+        task = self.tasks.remove(task_id)
+        if task is None:
+            return None
+        self._forget(task)
+        self.sort_engine.remove(task_id)
+        self._record(self.backend.delete, [task_id])
+        return task
+
+    def completed(self):
+        """Tâches terminées"""
+        return [t for t in self.tasks if t["completed"]]
+
+    def clear_completed(self):
+        """Supprime les tâches terminées ; retourne leur nombre"""
+        self._check_writable()
+        completed = self.completed()
+        if completed:
+            ids = [t["id"] for t in completed]
+            self.tasks.remove_many(ids)
+            for task in completed:
+                self._forget(task)
+            self.sort_engine.invalidate()
+            self._record(self.backend.delete, ids)
+        return len(completed)
+
+    def clear_all(self):
+        """Supprime toutes les tâches ; retourne leur nombre"""
+        self._check_writable()
+        ids = self.tasks.ids()
+        self.tasks.clear()
+        self.search_index.clear()
+        self.time_index.build(self.tasks)
+        self.sort_engine.invalidate()
+        self.stats.build(self.tasks)
+        if ids:
+            self._record(self.backend.delete, ids)
+        return len(ids)
+
+    def _forget(self, task):
+        """Retire une tâche des index et des compteurs"""
+        self.search_index.remove(task["id"])
+        self.time_index.remove(task["id"])
+        self.stats.remove(task)
+
+    # ------------------------------------------------------------------
+    # Tri et filtres
+    # ------------------------------------------------------------------
+
+    def set_sort(self, spec):
+        """Change l'ordre d'affichage (les tâches ne sont ni retriées ni réécrites)"""
+        self.sort_engine.set_spec(spec)
+        if self.settings is not None:
+            try:
+                self.settings.set(self.SORT_SETTING, self.sort_engine.spec)
+            except Exception as e:
+                self._failed(e)
+
+    def matches(self, task, search="", date_range=None):
+        """Indique si une tâche correspond à la recherche et à la période"""
+        if date_range is not None:
+            start, end = date_range
+            if not start <= task["ts"] < end:
+                return False
+        return not search or self.search_index.matches(task["id"], search)
+
+    def view(self, search="", date_range=None):
+        """Tâches à afficher, dans l'ordre choisi (période puis recherche)"""
+        matching = None
+        if date_range is not None:
+            matching = set(self.time_index.between(*date_range))
+        if search:
+            found = self.search_index.search(search)
+            matching = found if matching is None else matching & found
+
+        # Ordre d'affichage en cache : pas de tri tant que les données ne changent pas
+        order = self.sort_engine.order(self.tasks)
+        if matching is None:
+            return [self.tasks.get(task_id) for task_id in order]
+        return [self.tasks.get(task_id) for task_id in order if task_id in matching]
@@ -0,0 +1,151 @@
+"""
+Module de diagnostic
+Profilage à la demande : chronomètres sur les vues, sonde de latence de la
+boucle Tk et panneau caché (Ctrl+Maj+D) affichant les mesures en direct
+"""
+
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from core import NoteStore, Profiler, TaskStore
+from notepad import Notepad
+from tasks import TaskManager
+
+# Méthodes chronométrées : (classe, préfixe, noms)
+INSTRUMENTED = [
+    (TaskManager, "taches", ["update_display", "create_task_widget", "save_tasks",
+                             "load_tasks", "on_tasks_loaded"]),
+    (Notepad, "notes", ["commit_note", "load_notes", "on_notes_loaded",
+                        "update_notes_list"]),
+    (TaskStore, "taches.store", ["load", "save_all", "view"]),
+    (NoteStore, "notes.store", ["load", "save", "search"]),
+]
+
+# Période (ms) de la sonde de latence de la boucle d'événements
+LATENCY_INTERVAL = 250
+
+
+def start_profiling(root, chemin):
+    """
+    Active le profilage : chronomètres, sonde de latence et raccourci du panneau
+
+    À appeler avant la création des vues (les méthodes sont remplacées au
+    niveau des classes).
+
+    Returns:
+        Profiler: À fermer (close) à la sortie de l'application
+    """
+    profiler = Profiler(chemin)
+    for cls, prefix, names in INSTRUMENTED:
+        profiler.instrument(cls, names, prefix)
+
+    LatencyProbe(root, profiler)
+    panel = DebugPanel(root, profiler)
+    root.bind_all("<Control-Shift-D>", lambda e: panel.toggle())
+    return profiler
+
+
+class LatencyProbe:
+    """
+    Mesure le retard de la boucle Tk
+
+    Un after() est planifié toutes les `interval` ms : l'écart entre
+    l'heure prévue et l'heure réelle d'exécution est le temps pendant
+    lequel l'interface n'a pas pu répondre.
+    """
+
+    def __init__(self, root, profiler, interval=LATENCY_INTERVAL):
+        self.root = root
+        self.profiler = profiler
+        self.interval = interval
+        self.schedule()
+
+    def schedule(self):
+        """Planifie le prochain passage"""
+        self.expected = time.perf_counter() + self.interval / 1000
+        self.root.after(self.interval, self.tick)
+
+    def tick(self):
+        """Enregistre le retard puis replanifie"""
+        delay = max(0.0, time.perf_counter() - self.expected)
+        self.profiler.record("tk.latence", delay)
+        if delay >= self.profiler.slow:
+            self.profiler.count("tk.blocages")
+        self.schedule()
+
+
+class DebugPanel:
+    """Fenêtre des mesures (cachée par défaut), rafraîchie chaque seconde"""
+
+    COLUMNS = [
+        ("appels", "Appels"),
+        ("total", "Total (ms)"),
+        ("moyenne", "Moyenne (ms)"),
+        ("max", "Max (ms)"),
+        ("dernier", "Dernier (ms)"),
+    ]
+    REFRESH = 1000
+
+    def __init__(self, root, profiler):
+        self.root = root
+        self.profiler = profiler
+        self.window = None
+        self._refresh_job = None
+
+    def toggle(self):
+        """Affiche ou ferme le panneau"""
+        if self.window is not None:
+            self.close()
+        else:
+            self.open()
+
+    def open(self):
+        """Crée la fenêtre du panneau"""
+        self.window = tk.Toplevel(self.root)
+        self.window.title("Diagnostic")
+        self.window.geometry("640x360")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.tree = ttk.Treeview(
+            self.window,
+            columns=[key for key, _ in self.COLUMNS]
+        )
+        self.tree.heading("#0", text="Mesure")
+        self.tree.column("#0", width=200)
+        for key, label in self.COLUMNS:
+            self.tree.heading(key, text=label)
+            self.tree.column(key, width=85, anchor="e")
+        self.tree.pack(fill="both", expand=True)
+
+        self.counters_label = tk.Label(self.window, anchor="w", justify="left")
+        self.counters_label.pack(fill="x", padx=5, pady=5)
+
+        self.refresh()
+
+    def refresh(self):
+        """Recopie les statistiques du profileur dans le tableau"""
+        stats, counters = self.profiler.snapshot()
+        self.tree.delete(*self.tree.get_children())
+        for name in sorted(stats):
+            stat = stats[name]
+            self.tree.insert("", "end", text=name, values=(
+                stat["count"],
+                f"{stat['total'] * 1000:.1f}",
+                f"{stat['total'] * 1000 / stat['count']:.2f}",
+                f"{stat['max'] * 1000:.1f}",
+                f"{stat['last'] * 1000:.2f}",
+            ))
+        self.counters_label.config(
+            text="  ".join(f"{name}: {n}" for name, n in sorted(counters.items()))
+            or "Aucun compteur"
+        )
+        self._refresh_job = self.window.after(self.REFRESH, self.refresh)
+
+    def close(self):
+        """Ferme le panneau (les mesures continuent)"""
+        if self._refresh_job is not None:
+            self.window.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        self.window.destroy()
+        self.window = None
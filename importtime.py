@@ -0,0 +1,125 @@
+"""
+Module de mesure des imports
+Équivalent intégré de `python -X importtime` (utilisable aussi dans
+l'exécutable PyInstaller) et rapport de démarrage comparé à un budget
+
+Ce module n'importe que la bibliothèque standard : il est chargé en tout
+premier par main.py pour chronométrer tous les imports qui suivent.
+"""
+
+import sys
+import time
+
+
+class ImportTimer:
+    """
+    Chronomètre chaque import (durée propre et cumulée, en secondes)
+
+    Placé en tête de sys.meta_path, il délègue la recherche aux autres
+    chercheurs et enveloppe le chargeur trouvé pour mesurer l'exécution
+    du module, imports imbriqués compris.
+    """
+
+    def __init__(self):
+        self.times = {}    # nom -> (durée propre, durée cumulée)
+        self._stack = []   # [début, durée des imports imbriqués]
+
+    def start(self):
+        """Commence à chronométrer les imports"""
+        sys.meta_path.insert(0, self)
+        return self
+
+    def stop(self):
+        """Arrête le chronométrage"""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path, target=None):
+        """Trouve le module via les autres chercheurs et enveloppe son chargeur"""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self, name)
+                return spec
+        return None
+
+    def enter(self):
+        """Début de l'exécution d'un module"""
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def leave(self, name):
+        """Fin de l'exécution d'un module : durées propre et cumulée"""
+        start, nested = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][1] += cumulative
+        self.times[name] = (cumulative - nested, cumulative)
+
+    def total(self):
+        """Durée totale passée dans les imports (somme des durées propres)"""
+        return sum(self_time for self_time, _ in self.times.values())
+
+    def slowest(self, limit=15):
+        """Les `limit` imports les plus coûteux (durée propre décroissante)"""
+        return sorted(self.times.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+
+    def format(self, limit=15):
+        """Rapport au format de -X importtime (microsecondes)"""
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for name, (self_time, cumulative) in self.slowest(limit):
+            lines.append(f"import time: {self_time * 1e6:9.0f} | {cumulative * 1e6:10.0f} | {name}")
+        return "\n".join(lines)
+
+
+class _TimedLoader:
+    """Chargeur enveloppé : chronomètre exec_module, délègue le reste"""
+
+    def __init__(self, loader, timer, name):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._timer.enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(self._name)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+def startup_report(timer, first_window, budget, deferred=()):
+    """
+    Rapport de démarrage
+
+    Args:
+        timer: ImportTimer arrêté à l'affichage de la première fenêtre
+        first_window: Durée (s) entre le début de main.py et la première fenêtre
+        budget: Durée maximale (s) visée pour la première fenêtre
+        deferred: Modules qui ne doivent pas être importés au démarrage
+
+    Returns:
+        dict: Rapport sérialisable en JSON ("ok" faux en cas de dépassement)
+    """
+    eager = sorted(name for name in deferred if name in sys.modules)
+    return {
+        "premiere_fenetre_s": round(first_window, 4),
+        "budget_s": budget,
+        "imports_s": round(timer.total(), 4),
+        "nb_modules": len(timer.times),
+        "plus_lents": [
+            {"module": name, "propre_ms": round(self_time * 1000, 3),
+             "cumule_ms": round(cumulative * 1000, 3)}
+            for name, (self_time, cumulative) in timer.slowest()
+        ],
+        "differes_importes": eager,
+        "ok": first_window <= budget and not eager,
+    }
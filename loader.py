@@ -0,0 +1,187 @@
+"""
+Module de chargement en arrière-plan
+Exécute un travail hors du thread Tk et rend le résultat via after() ;
+regroupement des frappes et export Excel avec progression, communs aux vues
+"""
+
+import queue
+import threading
+from tkinter import filedialog, messagebox
+
+from core import MissingDependency, optional_modules
+
+
+def load_in_background(widget, work, on_done, on_error=None, poll=30, on_progress=None):
+    """
+    Exécute work() dans un thread puis appelle on_done(résultat) dans le thread Tk
+
+    Le thread ne touche jamais aux widgets : le résultat passe par une
+    file interrogée avec widget.after(). Si le widget a été détruit entre
+    temps (changement de vue), le résultat est ignoré.
+
+    Args:
+        widget: Widget servant à planifier les vérifications
+        work: Fonction sans argument exécutée dans le thread
+        on_done: Fonction appelée avec le résultat
+        on_error: Fonction appelée avec l'exception (optionnel)
+        poll: Intervalle de vérification (ms)
+        on_progress: Si donné, work reçoit une fonction report(fait, total)
+            et on_progress(fait, total) est appelé dans le thread Tk avec
+            la dernière valeur signalée
+    """
+    results = queue.Queue()
+    latest = {}
+
+    def report(done, total):
+        latest["progress"] = (done, total)
+
+    def worker():
+        try:
+            results.put((True, work(report) if on_progress is not None else work()))
+        except Exception as e:
+            results.put((False, e))
+
+    def check():
+        progress = latest.pop("progress", None)
+        if progress is not None and widget.winfo_exists():
+            on_progress(*progress)
+        try:
+            ok, value = results.get_nowait()
+        except queue.Empty:
+            if widget.winfo_exists():
+                widget.after(poll, check)
+            return
+
+        if not widget.winfo_exists():
+            return
+        if ok:
+            on_done(value)
+        elif on_error is not None:
+            on_error(value)
+
+    threading.Thread(target=worker, daemon=True).start()
+    widget.after(poll, check)
+
+
+class Debouncer:
+    """
+    Regroupe des appels rapprochés : action() part après `delay` ms sans
+    nouvel appel à schedule()
+
+    Usage:
+        recherche = Debouncer(widget, 150, self.update_list)
+        entry.bind("<KeyRelease>", lambda e: recherche.schedule())
+        recherche.flush()    # exécute tout de suite l'appel en attente
+        recherche.cancel()   # à la fermeture de la vue
+    """
+
+    def __init__(self, widget, delay, action):
+        self.widget = widget
+        self.delay = delay
+        self.action = action
+        self._job = None
+
+    @property
+    def pending(self):
+        """Vrai si un appel attend"""
+        return self._job is not None
+
+    def schedule(self):
+        """(Re)lance le délai"""
+        self.cancel()
+        self._job = self.widget.after(self.delay, self._run)
+
+    def cancel(self):
+        """Annule l'appel en attente"""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+
+    def flush(self):
+        """Exécute tout de suite l'appel en attente (rien s'il n'y en a pas)"""
+        if self._job is not None:
+            self.cancel()
+            self.action()
+
+    def _run(self):
+        self._job = None
+        self.action()
+
+
+class BackgroundExport:
+    """
+    Export Excel hors du thread Tk, avec sa progression
+
+    La vue fournit le libellé et la barre de progression, ainsi que
+    show() et hide() pour les placer et les retirer ; le texte affiché
+    et les messages de fin sont communs.
+
+    Usage:
+        export = BackgroundExport(label, bar, "tâches", show, hide)
+        filename = export.ask_filename("taches.xlsx")
+        if filename:
+            export.run(lambda report: export_tasks(filename, rows, report),
+                       len(rows), "Tâches exportées avec succès!")
+    """
+
+    def __init__(self, label, bar, noun, show, hide):
+        self.label = label
+        self.bar = bar
+        self.noun = noun
+        self.show = show
+        self.hide = hide
+        self.running = False
+
+    def ask_filename(self, initialfile):
+        """Vérifie openpyxl puis demande le classeur à créer (None si annulé)"""
+        try:
+            optional_modules.require("openpyxl")
+        except MissingDependency as e:
+            messagebox.showerror("Erreur", f"Impossible d'exporter: {e}")
+            return None
+
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Classeur Excel", "*.xlsx"), ("Tous les fichiers", "*.*")],
+            initialfile=initialfile
+        )
+        return filename or None
+
+    def run(self, work, total, success):
+        """
+        Exécute work(report) dans un thread en affichant la progression
+
+        Args:
+            work: Fonction work(report) écrivant le classeur
+            total: Nombre d'éléments exportés
+            success: Message affiché à la fin
+        """
+        self.running = True
+        self.bar.config(value=0)
+        self.label.config(text=f"📊 Export de {total} {self.noun}...")
+        self.show()
+        load_in_background(
+            self.label,
+            work,
+            lambda result: self._end(success),
+            self._failed,
+            on_progress=self._progress
+        )
+
+    def _progress(self, done, total):
+        """Avancement de l'export (thread Tk)"""
+        self.bar.config(value=100 * done / total)
+        self.label.config(text=f"📊 Export: {done} / {total} {self.noun}")
+
+    def _failed(self, error):
+        """Erreur pendant l'export"""
+        self._end()
+        messagebox.showerror("Erreur", f"Impossible d'exporter: {error}")
+
+    def _end(self, message=None):
+        """Masque la progression de l'export"""
+        self.running = False
+        self.hide()
+        self.label.config(text="")
+        if message:
+            messagebox.showinfo("Succès", message)
@@ -3,16 +3,26 @@ Gestionnaire de Tâches et Bloc-notes
 Application principale avec menu de navigation
 """
 
-import tkinter as tk
-from tkinter import ttk
-from config import AppConfig
-from styles import AppStyles
-from tasks import TaskManager
-from notepad import Notepad
+import sys
+import time
+
+# Début du démarrage, référence du rapport --rapport-demarrage
+DEBUT_DEMARRAGE = time.perf_counter()
+
+# Chronométrer tous les imports qui suivent (équivalent de python -X importtime)
+IMPORT_TIMER = None
+if "--rapport-demarrage" in sys.argv[1:]:
+    from importtime import ImportTimer
+    IMPORT_TIMER = ImportTimer().start()
+
+import tkinter as tk  # noqa: E402
+from config import AppConfig  # noqa: E402
+from styles import AppStyles  # noqa: E402
+from tasks import TaskManager  # noqa: E402
 
 
 class MainApplication:
-    def __init__(self):
+    def __init__(self, profil=False):
         self.root = tk.Tk()
         self.root.title("Gestionnaire Personnel")
         self.root.geometry("900x700")
@@ -21,8 +31,15 @@ class MainApplication:
         self.config = AppConfig()
         self.styles = AppStyles(self.root)
 
+        # Profilage (avant la création des vues, dont les méthodes sont chronométrées)
+        self.profiler = None
+        if profil or self.config.PROFIL:
+            from debug import start_profiling
+            self.profiler = start_profiling(self.root, self.config.FICHIER_PROFIL)
+
         # Variables
         self.current_view = None
+        self.views = {}  # nom -> (frame, vue), gardées en vie entre deux affichages
 
         # Interface
         self.setup_ui()
@@ -31,9 +48,11 @@ class MainApplication:
     def setup_ui(self):
         """Configure l'interface principale"""
         self.root.configure(bg=self.config.style["fond"])
+        self.config.themed(self.root, bg="fond")
 
         # Frame principale
         self.main_frame = tk.Frame(self.root, bg=self.config.style["fond"])
+        self.config.themed(self.main_frame, bg="fond")
         self.main_frame.pack(fill="both", expand=True)
 
         # Menu latéral
@@ -44,8 +63,15 @@ class MainApplication:
             self.main_frame,
             bg=self.config.style["fond"]
         )
+        self.config.themed(self.content_frame, bg="fond")
         self.content_frame.pack(side="right", fill="both", expand=True, padx=10, pady=10)
 
+        # F5 : recharger la vue depuis le disque (fichier modifié ailleurs)
+        self.root.bind("<F5>", lambda e: self.reload_current_view())
+
+        # À la fermeture, les écritures en arrière-plan sont terminées
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def setup_sidebar(self):
         """Crée le menu de navigation latéral"""
         sidebar = tk.Frame(
@@ -53,6 +79,7 @@ class MainApplication:
             bg=self.config.style["accent"],
             width=200
         )
+        self.config.themed(sidebar, bg="accent")
         sidebar.pack(side="left", fill="y")
         sidebar.pack_propagate(False)
 
@@ -65,6 +92,7 @@ class MainApplication:
             fg="white",
             pady=20
         )
+        self.config.themed(title, bg="accent")
         title.pack(fill="x")
 
         # Séparateur
@@ -77,6 +105,7 @@ class MainApplication:
 
         # Espacement
         spacer = tk.Frame(sidebar, bg=self.config.style["accent"])
+        self.config.themed(spacer, bg="accent")
         spacer.pack(fill="both", expand=True)
 
         # Bouton thème en bas
@@ -91,6 +120,7 @@ class MainApplication:
             cursor="hand2",
             pady=10
         )
+        self.config.themed(theme_btn, bg="fond", fg="texte")
         theme_btn.pack(fill="x", padx=10, pady=10)
 
     def create_nav_button(self, parent, text, command):
@@ -110,6 +140,7 @@ class MainApplication:
             padx=20,
             pady=15
         )
+        self.config.themed(btn, bg="accent", activeforeground="accent")
         btn.pack(fill="x", pady=2)
 
         # Effet hover
@@ -124,45 +155,141 @@ class MainApplication:
 
         return btn
 
-    def clear_content(self):
-        """Efface le contenu actuel"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def show_view(self, name, view_class):
+        """
+        Affiche une vue en la créant seulement la première fois
+
+        Les vues déjà construites sont masquées (pack_forget) et non
+        détruites : leurs widgets et leurs données en mémoire sont réutilisés.
+        """
+        for frame, view in self.views.values():
+            frame.pack_forget()
+
+        if name not in self.views:
+            frame = tk.Frame(self.content_frame, bg=self.config.style["fond"])
+            self.config.themed(frame, bg="fond")
+            self.views[name] = (frame, view_class(frame, self.config))
+
+        frame, view = self.views[name]
+        frame.pack(fill="both", expand=True)
+        self.current_view = view
+
+    def invalidate_view(self, name=None):
+        """
+        Oublie une vue en cache (ou toutes si name est None)
+
+        À appeler quand le fichier de données a changé en dehors de
+        l'application : la vue sera reconstruite et relue au prochain affichage.
+        """
+        names = [name] if name is not None else list(self.views)
+        for key in names:
+            if key not in self.views:
+                continue
+            frame, view = self.views.pop(key)
+            if view is self.current_view:
+                self.current_view = None
+            view.close()
+            frame.destroy()
+
+    def reload_current_view(self):
+        """Relit depuis le disque la vue affichée"""
+        if "notes" in self.views and self.current_view is self.views["notes"][1]:
+            self.invalidate_view("notes")
+            self.show_notepad()
+        else:
+            self.invalidate_view("taches")
+            self.show_tasks()
 
     def show_tasks(self):
         """Affiche le gestionnaire de tâches"""
-        self.clear_content()
-        self.current_view = TaskManager(self.content_frame, self.config)
+        self.show_view("taches", TaskManager)
 
     def show_notepad(self):
-        """Affiche le bloc-notes"""
-        self.clear_content()
-        self.current_view = Notepad(self.content_frame, self.config)
+        """Affiche le bloc-notes (module importé au premier affichage seulement)"""
+        from notepad import Notepad
+        self.show_view("notes", Notepad)
 
     def toggle_theme(self):
         """Change le thème de l'application"""
         self.config.toggle_theme()
         self.styles.update_theme()
 
-        # Recharger la vue actuelle
-        if isinstance(self.current_view, TaskManager):
-            self.show_tasks()
-        elif isinstance(self.current_view, Notepad):
-            self.show_notepad()
-        else:
-            self.show_tasks()
+        # Recolorer sur place : aucune vue reconstruite, aucun fichier relu
+        self.config.apply_theme()
 
-        # Recréer le sidebar
-        for widget in self.main_frame.winfo_children():
-            if widget != self.content_frame:
-                widget.destroy()
-        self.setup_sidebar()
+    def on_close(self):
+        """Ferme les vues (sauvegardes en attente comprises) puis la fenêtre"""
+        self.invalidate_view()
+        if self.profiler is not None:
+            self.profiler.close()
+        self.root.destroy()
+
+    def report_first_window(self, chemin):
+        """
+        Écrit l'heure d'affichage de la première fenêtre puis quitte
+
+        Utilisé par benchmarks/startup.py (option --mesure-demarrage) pour
+        mesurer le temps de démarrage, y compris celui de l'exécutable
+        PyInstaller qui n'a pas de console.
+        """
+        self.root.wait_visibility()
+        self.root.update_idletasks()
+        with open(chemin, 'w', encoding='utf-8') as f:
+            f.write(repr(time.time()))
+        self.on_close()
 
-    def run(self):
+    def report_startup(self, timer):
+        """
+        Rapport de démarrage : imports les plus lents et première fenêtre
+
+        Comparé au budget de la configuration ; les bibliothèques
+        optionnelles (core.OPTIONAL_MODULES) ne doivent pas avoir été
+        importées. Écrit dans FICHIER_DEMARRAGE et sur la sortie standard.
+        """
+        from core import OPTIONAL_MODULES, atomic_write_json
+        from importtime import startup_report
+
+        self.root.wait_visibility()
+        self.root.update_idletasks()
+        first_window = time.perf_counter() - DEBUT_DEMARRAGE
+        timer.stop()
+
+        report = startup_report(timer, first_window, self.config.BUDGET_DEMARRAGE,
+                                deferred=OPTIONAL_MODULES)
+        try:
+            atomic_write_json(self.config.FICHIER_DEMARRAGE, report, backups=0)
+        except OSError:
+            pass
+        if self.profiler is not None:
+            self.profiler.record("demarrage.premiere_fenetre", first_window)
+
+        # Pas de console dans l'exécutable PyInstaller
+        if sys.stdout is not None:
+            status = "OK" if report["ok"] else "DÉPASSEMENT"
+            print(timer.format())
+            print(f"Première fenêtre: {first_window * 1000:.0f} ms "
+                  f"(budget {self.config.BUDGET_DEMARRAGE * 1000:.0f} ms) - {status}")
+            if report["differes_importes"]:
+                print("Importés au démarrage à tort: " + ", ".join(report["differes_importes"]))
+
+    def run(self, mesure_demarrage=None, import_timer=None):
         """Lance l'application"""
+        if import_timer is not None:
+            self.root.after_idle(self.report_startup, import_timer)
+        if mesure_demarrage:
+            self.root.after_idle(self.report_first_window, mesure_demarrage)
         self.root.mainloop()
 
 
+def option_value(argv, name):
+    """Valeur d'une option « --nom valeur » de la ligne de commande (None si absente)"""
+    if name in argv[:-1]:
+        return argv[argv.index(name) + 1]
+    return None
+
+
 if __name__ == "__main__":
-    app = MainApplication()
-    app.run()
\ No newline at end of file
+    args = sys.argv[1:]
+    app = MainApplication(profil="--profil" in args)
+    app.run(mesure_demarrage=option_value(args, "--mesure-demarrage"),
+            import_timer=IMPORT_TIMER)
\ No newline at end of file
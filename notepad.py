@@ -5,21 +5,45 @@ Module Bloc-notes
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import json
-import os
 from datetime import datetime
+from core import NoteStore, content_digest, open_note_backend
+from styles import add_placeholder
+from loader import BackgroundExport, Debouncer, load_in_background
 
 class Notepad:
+    # Nombre de titres insérés par passage dans la liste (remplissage progressif)
+    LIST_CHUNK = 500
+    # Sauvegarde automatique après une pause de frappe (ms)
+    AUTOSAVE_DELAY = 1000
+    # Intervalle de vérification des écritures en cours (ms)
+    SAVE_POLL = 100
+    # Délai (ms) après la dernière frappe avant de lancer la recherche
+    SEARCH_DELAY = 150
+
     def __init__(self, parent, config):
         self.parent = parent
         self.config = config
-        self.notes = []
         self.current_note = None
         self.fichier_notes = "notes.json"
 
+        # Données, index et écritures de fond (core.NoteStore, sans Tk)
+        self.store = NoteStore(open_note_backend(config, self.fichier_notes))
+
+        # listed_ids donne l'id de chaque ligne de la listbox
+        self.listed_ids = []
+        self.loading = False
+        self._fill_job = None
+        self._status_job = None
+
+        # Grosse note : lue par morceaux, modifications suivies par le
+        # drapeau "modified" du widget plutôt que par comparaison du texte
+        self.large_note = False
+        self._stream = None
+        self._stream_job = None
+
+        # L'interface s'affiche tout de suite, les notes arrivent ensuite
         self.setup_ui()
         self.load_notes()
-        self.update_notes_list()
 
     def setup_ui(self):
         """Configure l'interface utilisateur"""
@@ -31,10 +55,12 @@ class Notepad:
             bg=self.config.style["fond"],
             fg=self.config.style["texte"]
         )
+        self.config.themed(title, bg="fond", fg="texte")
         title.pack(pady=(0, 20))
 
         # Frame principal avec deux colonnes
         main_frame = tk.Frame(self.parent, bg=self.config.style["fond"])
+        self.config.themed(main_frame, bg="fond")
         main_frame.pack(fill="both", expand=True)
 
         # Colonne gauche : Liste des notes
@@ -52,6 +78,7 @@ class Notepad:
             bd=2,
             width=250
         )
+        self.config.themed(list_frame, bg="cadre")
         list_frame.pack(side="left", fill="both", padx=(0, 10))
         list_frame.pack_propagate(False)
 
@@ -64,6 +91,7 @@ class Notepad:
             fg=self.config.style["texte"],
             pady=10
         )
+        self.config.themed(list_title, bg="cadre", fg="texte")
         list_title.pack(fill="x")
 
         # Bouton nouvelle note
@@ -78,10 +106,22 @@ class Notepad:
             cursor="hand2",
             pady=8
         )
+        self.config.themed(btn_new, bg="accent")
         btn_new.pack(fill="x", padx=10, pady=(0, 10))
 
+        # Recherche dans les titres et le contenu
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(
+            list_frame,
+            textvariable=self.search_var,
+            font=self.config.POLICE
+        )
+        search_entry.pack(fill="x", padx=10, pady=(0, 5))
+        add_placeholder(search_entry, "🔍 Rechercher une note...")
+
         # Listbox avec scrollbar
         scroll_frame = tk.Frame(list_frame, bg=self.config.style["cadre"])
+        self.config.themed(scroll_frame, bg="cadre")
         scroll_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
         scrollbar = ttk.Scrollbar(scroll_frame)
@@ -98,6 +138,7 @@ class Notepad:
             activestyle="none",
             yscrollcommand=scrollbar.set
         )
+        self.config.themed(self.notes_listbox, bg="fond", fg="texte", selectbackground="accent")
         self.notes_listbox.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=self.notes_listbox.yview)
 
@@ -115,34 +156,62 @@ class Notepad:
             cursor="hand2",
             pady=8
         )
-        btn_delete.pack(fill="x", padx=10, pady=10)
+        self.config.themed(btn_delete, bg="danger")
+        btn_delete.pack(fill="x", padx=10, pady=(10, 5))
+
+        # Bouton export Excel de toutes les notes
+        btn_export = tk.Button(
+            list_frame,
+            text="📊 Exporter en Excel",
+            command=self.export_excel,
+            font=self.config.POLICE,
+            bg=self.config.style["bouton"],
+            fg=self.config.style["texte"],
+            relief="flat",
+            cursor="hand2",
+            pady=8
+        )
+        self.config.themed(btn_export, bg="bouton", fg="texte")
+        btn_export.pack(fill="x", padx=10, pady=(0, 10))
+
+        # La recherche part après SEARCH_DELAY ms sans frappe ; le trace est
+        # ajouté après le placeholder et la listbox
+        self.search_debounce = Debouncer(self.notes_listbox, self.SEARCH_DELAY,
+                                         self.update_notes_list)
+        self.search_var.trace_add("write", lambda *args: self.search_debounce.schedule())
 
     def setup_editor(self, parent):
         """Frame de l'éditeur"""
         editor_frame = tk.Frame(parent, bg=self.config.style["fond"])
+        self.config.themed(editor_frame, bg="fond")
         editor_frame.pack(side="right", fill="both", expand=True)
 
         # Barre d'outils
         toolbar = tk.Frame(editor_frame, bg=self.config.style["cadre"], relief="groove", bd=2)
+        self.config.themed(toolbar, bg="cadre")
         toolbar.pack(fill="x", pady=(0, 10))
 
         # Titre de la note
         title_frame = tk.Frame(toolbar, bg=self.config.style["cadre"])
+        self.config.themed(title_frame, bg="cadre")
         title_frame.pack(fill="x", padx=10, pady=10)
 
-        tk.Label(
+        title_label = tk.Label(
             title_frame,
             text="Titre:",
             font=self.config.POLICE,
             bg=self.config.style["cadre"],
             fg=self.config.style["texte"]
-        ).pack(side="left", padx=(0, 10))
+        )
+        self.config.themed(title_label, bg="cadre", fg="texte")
+        title_label.pack(side="left", padx=(0, 10))
 
         self.title_entry = ttk.Entry(title_frame, width=40)
         self.title_entry.pack(side="left", fill="x", expand=True)
 
         # Boutons d'action
         btn_frame = tk.Frame(toolbar, bg=self.config.style["cadre"])
+        self.config.themed(btn_frame, bg="cadre")
         btn_frame.pack(fill="x", padx=10, pady=(0, 10))
 
         btn_save = tk.Button(
@@ -157,6 +226,7 @@ class Notepad:
             padx=15,
             pady=5
         )
+        self.config.themed(btn_save, bg="success")
         btn_save.pack(side="left", padx=5)
 
         btn_export = tk.Button(
@@ -171,6 +241,7 @@ class Notepad:
             padx=15,
             pady=5
         )
+        self.config.themed(btn_export, bg="bouton", fg="texte")
         btn_export.pack(side="left", padx=5)
 
         btn_clear = tk.Button(
@@ -185,10 +256,12 @@ class Notepad:
             padx=15,
             pady=5
         )
+        self.config.themed(btn_clear, bg="danger")
         btn_clear.pack(side="left", padx=5)
 
         # Zone de texte avec scrollbar
         text_frame = tk.Frame(editor_frame, bg=self.config.style["fond"])
+        self.config.themed(text_frame, bg="fond")
         text_frame.pack(fill="both", expand=True)
 
         text_scrollbar = ttk.Scrollbar(text_frame)
@@ -208,6 +281,7 @@ class Notepad:
             padx=10,
             pady=10
         )
+        self.config.themed(self.text_editor, bg="cadre", fg="texte", insertbackground="texte")
         self.text_editor.pack(side="left", fill="both", expand=True)
         text_scrollbar.config(command=self.text_editor.yview)
 
@@ -215,25 +289,135 @@ class Notepad:
         self.text_editor.bind('<Control-s>', lambda e: self.save_current_note())
         self.text_editor.bind('<Control-n>', lambda e: self.new_note())
 
-        # Info en bas
+        # Sauvegarde automatique : <<Modified>> signale la première frappe,
+        # chaque touche suivante repousse l'échéance
+        self.autosave_debounce = Debouncer(self.text_editor, self.AUTOSAVE_DELAY, self.autosave)
+        self.text_editor.bind('<<Modified>>', self.on_editor_modified)
+        self.text_editor.bind('<KeyRelease>', self.on_editor_modified)
+        self.title_entry.bind('<KeyRelease>', lambda e: self.autosave_debounce.schedule())
+
+        # Info en bas, avec l'état de la sauvegarde à droite
+        info_frame = tk.Frame(editor_frame, bg=self.config.style["fond"])
+        self.config.themed(info_frame, bg="fond")
+        info_frame.pack(fill="x")
+
         info_label = tk.Label(
-            editor_frame,
+            info_frame,
             text="💡 Ctrl+S: Sauvegarder | Ctrl+N: Nouvelle note",
             font=("Segoe UI", 9),
             bg=self.config.style["fond"],
             fg=self.config.style["hover"],
             pady=5
         )
-        info_label.pack(fill="x")
+        self.config.themed(info_label, bg="fond", fg="hover")
+        info_label.pack(side="left", fill="x", expand=True)
+
+        self.status_label = tk.Label(
+            info_frame,
+            text="",
+            font=("Segoe UI", 9),
+            bg=self.config.style["fond"],
+            fg=self.config.style["hover"],
+            pady=5
+        )
+        self.config.themed(self.status_label, bg="fond", fg="hover")
+        self.status_label.pack(side="right", padx=5)
+
+        # Progression de l'export Excel (affichée seulement pendant un export)
+        export_bar = ttk.Progressbar(
+            info_frame,
+            maximum=100,
+            length=150,
+            mode='determinate'
+        )
+
+        def show_export():
+            self.status_label.config(fg=self.config.style["hover"])
+            export_bar.pack(side="right", padx=5)
+
+        self.export = BackgroundExport(self.status_label, export_bar, "notes",
+                                       show_export, export_bar.pack_forget)
 
     def new_note(self):
         """Crée une nouvelle note"""
         if self.check_unsaved_changes():
-            self.current_note = None
-            self.title_entry.delete(0, 'end')
-            self.text_editor.delete(1.0, 'end')
+            self.reset_editor()
             self.title_entry.focus()
 
+    def reset_editor(self):
+        """Vide l'éditeur sans rien sauvegarder"""
+        self.autosave_debounce.cancel()
+        self.cancel_stream()
+        self.current_note = None
+        self.large_note = False
+        self.title_entry.delete(0, 'end')
+        self.text_editor.delete(1.0, 'end')
+        self.editor_loaded()
+
+    def show_note(self, note):
+        """Affiche une note ; une grosse note est lue par morceaux"""
+        self.reset_editor()
+        self.current_note = note["id"]
+        self.title_entry.insert(0, note["title"])
+
+        if self.store.is_large(note):
+            self.large_note = True
+            self._stream = self.store.iter_content(note["id"])
+            self.text_editor.config(state="disabled")
+            self.status_label.config(text="⏳ Chargement de la note...")
+            self.stream_next()
+        else:
+            self.text_editor.insert(1.0, self.store.get_content(note))
+            self.editor_loaded()
+
+    def stream_next(self):
+        """Insère le morceau suivant de la note, puis laisse la main à Tk"""
+        chunk = next(self._stream, None)
+        if chunk is None:
+            self._stream_job = None
+            self.cancel_stream()
+            self.status_label.config(text="")
+            self.editor_loaded()
+            return
+
+        self.text_editor.config(state="normal")
+        self.text_editor.insert('end-1c', chunk)
+        self.text_editor.config(state="disabled")
+        self._stream_job = self.text_editor.after(1, self.stream_next)
+
+    def cancel_stream(self):
+        """Arrête la lecture par morceaux en cours (libère le fichier)"""
+        if self._stream_job is not None:
+            self.text_editor.after_cancel(self._stream_job)
+            self._stream_job = None
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            self.text_editor.config(state="normal")
+
+    def editor_loaded(self):
+        """Le texte affiché correspond à la note : rien à sauvegarder, rien à annuler"""
+        self.text_editor.edit_modified(False)
+        self.text_editor.edit_reset()
+
+    def has_changes(self, note):
+        """
+        Vrai si l'éditeur diffère de la note enregistrée
+
+        Sans frappe depuis le chargement (drapeau "modified" à faux), la
+        réponse est immédiate. Sinon le texte est comparé par empreinte,
+        ce qui reconnaît une modification annulée (Ctrl+Z).
+        """
+        if note["title"] != self.title_entry.get().strip():
+            return True
+        if not self.text_editor.edit_modified():
+            return False
+        if self.large_note:
+            # Pas de copie du texte : le drapeau suffit
+            return True
+        current = content_digest(self.text_editor.get(1.0, 'end-1c').strip())
+        return current != self.store.note_digest(note)
+
     def save_current_note(self):
         """Sauvegarde la note actuelle"""
         title = self.title_entry.get().strip()
@@ -247,88 +431,122 @@ class Notepad:
             messagebox.showwarning("Attention", "La note est vide")
             return
 
-        if self.current_note is None:
-            # Nouvelle note
-            note = {
-                "id": len(self.notes),
-                "title": title,
-                "content": content,
-                "date_created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "date_modified": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            self.notes.append(note)
-            self.current_note = note["id"]
-        else:
-            # Modification d'une note existante
-            for note in self.notes:
-                if note["id"] == self.current_note:
-                    note["title"] = title
-                    note["content"] = content
-                    note["date_modified"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    break
-
-        self.save_notes()
-        self.update_notes_list()
-        messagebox.showinfo("Succès", "Note sauvegardée avec succès!")
+        if self.loading or self._stream is not None:
+            messagebox.showwarning("Attention", "Chargement des notes en cours, réessayez dans un instant")
+            return
+
+        if self.store.read_only:
+            messagebox.showwarning("Attention", "Les notes n'ont pas pu être chargées : "
+                                                "la sauvegarde est désactivée")
+            return
+
+        self.autosave_debounce.cancel()
+        self.commit_note(title, content)
+
+    def commit_note(self, title, content):
+        """Enregistre l'éditeur dans la note courante et planifie l'écriture"""
+        note, old, new = self.store.save(self.current_note, title, content)
+        self.current_note = note["id"]
+
+        self.text_editor.edit_modified(False)
+        self.show_saving()
+        self.place_note(note, old, new)
+
+    def on_editor_modified(self, event=None):
+        """Repousse la sauvegarde automatique tant que le texte change"""
+        if self._stream is None and self.text_editor.edit_modified():
+            self.autosave_debounce.schedule()
+
+    def autosave(self):
+        """Sauvegarde silencieuse de la note en cours d'édition"""
+        if self.loading or self._stream is not None or self.store.read_only:
+            return
+
+        note = self.store.get(self.current_note) if self.current_note is not None else None
+        if note is not None and not self.has_changes(note):
+            self.text_editor.edit_modified(False)
+            return
+
+        title = self.title_entry.get().strip()
+        content = self.text_editor.get(1.0, 'end-1c').strip()
+        # Une note sans titre ou vide attend la sauvegarde manuelle
+        if not title or not content:
+            return
+
+        self.commit_note(title, content)
 
     def delete_note(self):
         """Supprime la note sélectionnée"""
         selection = self.notes_listbox.curselection()
-        if not selection:
+        if not selection or selection[0] >= len(self.listed_ids):
             messagebox.showwarning("Attention", "Veuillez sélectionner une note à supprimer")
             return
 
         if messagebox.askyesno("Confirmation", "Êtes-vous sûr de vouloir supprimer cette note ?"):
             index = selection[0]
-            note_id = self.notes[index]["id"]
-            self.notes = [n for n in self.notes if n["id"] != note_id]
+            note_id = self.listed_ids[index]
 
+            # Pas de sauvegarde automatique pour une note supprimée
             if self.current_note == note_id:
-                self.new_note()
+                self.reset_editor()
 
-            self.save_notes()
-            self.update_notes_list()
+            position = self.store.delete(note_id)
+            self.show_saving()
+
+            # Une seule ligne retirée (la liste complète est refaite en recherche)
+            if self.listed_ids is self.store.order and self._fill_job is None:
+                self.notes_listbox.delete(position)
+            else:
+                self.update_notes_list()
 
     def on_note_select(self, event):
         """Gère la sélection d'une note"""
         selection = self.notes_listbox.curselection()
-        if not selection:
+        if not selection or selection[0] >= len(self.listed_ids):
             return
 
-        if self.check_unsaved_changes():
-            index = selection[0]
+        # Récupérer la note affichée à cet index (avant qu'une sauvegarde
+        # ne réordonne la liste)
+        note = self.store.get(self.listed_ids[selection[0]])
 
-            # Récupérer la note depuis la liste triée
-            sorted_notes = sorted(self.notes, key=lambda x: x["date_modified"], reverse=True)
-            note = sorted_notes[index]
+        if self.check_unsaved_changes():
+            self.show_note(note)
 
-            self.current_note = note["id"]
-            self.title_entry.delete(0, 'end')
-            self.title_entry.insert(0, note["title"])
+        # La sauvegarde de la note précédente a pu déplacer les lignes
+        self.select_note(self.current_note)
 
-            self.text_editor.delete(1.0, 'end')
-            self.text_editor.insert(1.0, note["content"])
+    def select_note(self, note_id):
+        """Sélectionne la ligne d'une note (si elle est listée)"""
+        self.notes_listbox.selection_clear(0, 'end')
+        if note_id is None or self._fill_job is not None:
+            return
+        if self.listed_ids is self.store.order:
+            position = self.store.order.index(note_id) if note_id in self.store.order else None
+        else:
+            position = self.listed_ids.index(note_id) if note_id in self.listed_ids else None
+        if position is not None:
+            self.notes_listbox.selection_set(position)
+            self.notes_listbox.see(position)
 
     def check_unsaved_changes(self):
         """Vérifie s'il y a des modifications non sauvegardées"""
+        # Une sauvegarde automatique en attente est faite maintenant
+        self.autosave_debounce.flush()
+
         if self.current_note is not None:
-            current_title = self.title_entry.get().strip()
-            current_content = self.text_editor.get(1.0, 'end-1c').strip()
-
-            for note in self.notes:
-                if note["id"] == self.current_note:
-                    if note["title"] != current_title or note["content"] != current_content:
-                        response = messagebox.askyesnocancel(
-                            "Modifications non sauvegardées",
-                            "Voulez-vous sauvegarder les modifications ?"
-                        )
-                        if response is True:
-                            self.save_current_note()
-                            return True
-                        elif response is False:
-                            return True
-                        else:
-                            return False
+            note = self.store.get(self.current_note)
+            if note is not None and self._stream is None and self.has_changes(note):
+                response = messagebox.askyesnocancel(
+                    "Modifications non sauvegardées",
+                    "Voulez-vous sauvegarder les modifications ?"
+                )
+                if response is True:
+                    self.save_current_note()
+                    return True
+                elif response is False:
+                    return True
+                else:
+                    return False
         return True
 
     def clear_editor(self):
@@ -360,33 +578,158 @@ class Notepad:
             except Exception as e:
                 messagebox.showerror("Erreur", f"Impossible d'exporter: {e}")
 
+    def export_excel(self):
+        """Exporte toutes les notes dans un classeur Excel, en arrière-plan"""
+        if self.loading or self.export.running:
+            return
+        if not len(self.store.order):
+            messagebox.showwarning("Attention", "Aucune note à exporter")
+            return
+
+        filename = self.export.ask_filename("notes.xlsx")
+        if filename is None:
+            return
+
+        from core.export import export_notes, note_rows
+
+        # La note en cours d'édition est exportée telle qu'affichée ; le
+        # contenu des autres est relu une note à la fois par le thread
+        self.autosave_debounce.flush()
+        rows = note_rows(self.store.get(note_id) for note_id in self.store.order)
+        self.export.run(
+            lambda report: export_notes(filename, rows, self.store.backend.load_content, report),
+            len(rows), "Notes exportées avec succès!"
+        )
+
+    def get_search(self):
+        """Retourne le texte recherché (vide si placeholder)"""
+        search = self.search_var.get().strip()
+        if search == "🔍 Rechercher une note...":
+            return ""
+        return search
+
     def update_notes_list(self):
         """Met à jour la liste des notes"""
+        if self._fill_job is not None:
+            self.notes_listbox.after_cancel(self._fill_job)
+            self._fill_job = None
         self.notes_listbox.delete(0, 'end')
 
-        # Trier par date de modification (plus récent en premier)
-        sorted_notes = sorted(self.notes, key=lambda x: x["date_modified"], reverse=True)
+        # Squelette affiché pendant le chargement
+        if self.loading:
+            self.listed_ids = []
+            self.notes_listbox.insert('end', "⏳ Chargement des notes...")
+            return
 
-        for note in sorted_notes:
-            display_text = f"{note['title']}"
-            self.notes_listbox.insert('end', display_text)
+        search = self.get_search()
+        if search:
+            # Résultats classés par pertinence
+            self.listed_ids = self.store.search(search)
+        else:
+            # Ordre tenu à jour : aucun tri ici
+            self.listed_ids = self.store.order
 
-    def save_notes(self):
-        """Sauvegarde les notes dans un fichier JSON"""
-        try:
-            with open(self.fichier_notes, 'w', encoding='utf-8') as f:
-                json.dump(self.notes, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Impossible de sauvegarder: {e}")
+        self.fill_notes_list(0)
 
-    def load_notes(self):
-        """Charge les notes depuis le fichier JSON"""
-        if os.path.exists(self.fichier_notes):
-            try:
-                with open(self.fichier_notes, 'r', encoding='utf-8') as f:
-                    self.notes = json.load(f)
-            except Exception as e:
-                messagebox.showerror("Erreur", f"Impossible de charger: {e}")
-                self.notes = []
+    def fill_notes_list(self, start):
+        """Insère les titres par paquets pour ne pas bloquer l'interface"""
+        end = start + self.LIST_CHUNK
+        titles = [self.store.get(note_id)["title"] for note_id in self.listed_ids[start:end]]
+        if titles:
+            self.notes_listbox.insert('end', *titles)
+
+        if end < len(self.listed_ids):
+            self._fill_job = self.notes_listbox.after(1, self.fill_notes_list, end)
+        else:
+            self._fill_job = None
+
+    def place_note(self, note, old, new):
+        """Place la note sauvegardée dans la liste en déplaçant une seule ligne"""
+        if self.listed_ids is not self.store.order or self._fill_job is not None:
+            # Recherche active ou liste en cours de remplissage
+            self.update_notes_list()
+            return
+
+        # La sélection ne suit la note que si sa ligne était sélectionnée (ou
+        # si elle est nouvelle) : une sauvegarde déclenchée par un clic sur
+        # une autre note ne lui vole pas la sélection
+        follow = old is None or old in self.notes_listbox.curselection()
+        if old is not None:
+            self.notes_listbox.delete(old)
+        self.notes_listbox.insert(new, note["title"])
+        if follow:
+            self.select_note(note["id"])
+
+    def close(self):
+        """Termine les écritures et libère le stockage (la vue est retirée du cache)"""
+        self.autosave_debounce.flush()
+        self.search_debounce.cancel()
+        self.cancel_stream()
+        for job in (self._fill_job, self._status_job):
+            if job is not None:
+                self.notes_listbox.after_cancel(job)
+        self._fill_job = self._status_job = None
+        self.store.close()
+
+    def show_saving(self):
+        """Indique une écriture en cours et surveille sa fin"""
+        self.status_label.config(text="💾 Enregistrement...", fg=self.config.style["hover"])
+        if self._status_job is None:
+            self._status_job = self.status_label.after(self.SAVE_POLL, self.check_saved)
+
+    def check_saved(self):
+        """Affiche le résultat des écritures une fois terminées"""
+        if not self.store.is_idle():
+            self._status_job = self.status_label.after(self.SAVE_POLL, self.check_saved)
+            return
+
+        self._status_job = None
+        error = self.store.last_error()
+        if error is not None:
+            self.status_label.config(
+                text=f"⚠️ Impossible de sauvegarder: {error}",
+                fg=self.config.style["danger"]
+            )
         else:
-            self.notes = []
\ No newline at end of file
+            self.status_label.config(
+                text=f"✓ Enregistré à {datetime.now().strftime('%H:%M:%S')}",
+                fg=self.config.style["hover"]
+            )
+
+    def load_notes(self):
+        """Charge les notes en arrière-plan (JSON ou SQLite)"""
+        self.loading = True
+        self.update_notes_list()
+
+        load_in_background(
+            self.notes_listbox,
+            self.store.load,
+            self.on_notes_loaded,
+            self.on_load_error
+        )
+
+    def on_notes_loaded(self, result=None):
+        """Affiche les notes une fois chargées puis indexe leur contenu en arrière-plan"""
+        self.loading = False
+        self.update_notes_list()
+
+        # Lire le contenu de toutes les notes prend du temps : l'index est
+        # construit hors du thread Tk, la recherche porte sur les titres d'ici là
+        load_in_background(
+            self.notes_listbox,
+            self.store.prepare_search_index(),
+            self.on_search_index_ready
+        )
+
+    def on_search_index_ready(self, result):
+        """Installe l'index de recherche et relance la recherche en cours"""
+        if self.store.install_search_index(result) and self.get_search():
+            self.update_notes_list()
+
+    def on_load_error(self, error):
+        """Erreur de chargement : liste vide en lecture seule (les fichiers ne sont pas écrasés)"""
+        messagebox.showerror("Erreur", f"Impossible de charger: {error}\n\n"
+                                       "Les notes sont en lecture seule jusqu'au prochain démarrage.")
+        self.store.reset()
+        self.loading = False
+        self.update_notes_list()
\ No newline at end of file
@@ -147,4 +147,156 @@ def add_placeholder(entry, placeholder_text):
 
     # Lier les événements
     entry.bind('<FocusIn>', on_focus_in)
-    entry.bind('<FocusOut>', on_focus_out)
\ No newline at end of file
+    entry.bind('<FocusOut>', on_focus_out)
+
+class VirtualList:
+    """
+    Liste virtualisée affichée dans un Canvas
+
+    Seules les lignes visibles dans le canvas possèdent des widgets, qui
+    sont recyclés pendant le défilement : le coût d'affichage dépend de la
+    hauteur de la fenêtre et non du nombre d'éléments.
+
+    Usage:
+        liste = VirtualList(canvas, scrollbar, 44, creer_ligne, remplir_ligne)
+        liste.set_items(elements)
+
+    Args:
+        canvas: Canvas qui sert de zone d'affichage
+        scrollbar: Scrollbar verticale associée
+        row_height: Hauteur fixe d'une ligne (en pixels)
+        create_row: Fonction create_row(parent) qui construit un widget de ligne
+        bind_row: Fonction bind_row(widget, element) qui remplit une ligne
+        empty_widget: Widget affiché quand la liste est vide (optionnel)
+    """
+
+    MARGE = 5
+
+    def __init__(self, canvas, scrollbar, row_height, create_row, bind_row,
+                 empty_widget=None):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.items = []
+        self.rows = []       # [(id de la fenêtre canvas, widget)]
+        self.bound = []      # élément actuellement affiché par chaque ligne
+        self.width = 1
+
+        self.empty_window = None
+        if empty_widget is not None:
+            self.empty_window = self.canvas.create_window(
+                0, 0, window=empty_widget, anchor="n", state="hidden"
+            )
+
+        # Une unité de défilement = une ligne
+        self.canvas.configure(
+            yscrollcommand=self._on_scroll,
+            yscrollincrement=row_height
+        )
+        self.scrollbar.configure(command=self.canvas.yview)
+        self.canvas.bind("<Configure>", self._on_configure)
+
+    def set_items(self, items):
+        """Remplace tous les éléments et redessine les lignes visibles"""
+        self.items = items
+        self.bound = [None] * len(self.rows)
+        self._update_scrollregion()
+        self.refresh()
+
+    def insert(self, index, item):
+        """Insère un élément ; seules les lignes visibles décalées sont remplies"""
+        self.items.insert(index, item)
+        self._update_scrollregion()
+        self.refresh()
+
+    def append(self, item):
+        """Ajoute un élément en fin de liste"""
+        self.insert(len(self.items), item)
+
+    def remove(self, item):
+        """Retire un élément de la liste"""
+        try:
+            self.items.remove(item)
+        except ValueError:
+            return
+        self._update_scrollregion()
+        self.refresh()
+
+    def update_item(self, item):
+        """Redessine uniquement la ligne d'un élément modifié, s'il est visible"""
+        for slot, bound in enumerate(self.bound):
+            if bound is item:
+                self.bind_row(self.rows[slot][1], item)
+                return
+
+    def refresh(self):
+        """Place et remplit les lignes visibles dans le canvas"""
+        height = self.canvas.winfo_height()
+        count = height // self.row_height + 2
+        while len(self.rows) < count:
+            self._add_row()
+
+        first = max(0, int(self.canvas.canvasy(0) // self.row_height))
+        last = min(first + len(self.rows), len(self.items))
+        used = set()
+
+        # Chaque index occupe toujours le même emplacement (index % taille),
+        # un défilement d'une ligne ne recycle donc qu'un seul widget
+        for index in range(first, last):
+            slot = index % len(self.rows)
+            used.add(slot)
+            window, widget = self.rows[slot]
+            item = self.items[index]
+            if self.bound[slot] is not item:
+                self.bind_row(widget, item)
+                self.bound[slot] = item
+            self.canvas.coords(
+                window, self.MARGE, index * self.row_height + self.MARGE // 2
+            )
+            self.canvas.itemconfigure(window, state="normal")
+
+        for slot, (window, widget) in enumerate(self.rows):
+            if slot not in used:
+                self.canvas.itemconfigure(window, state="hidden")
+                self.bound[slot] = None
+
+        if self.empty_window is not None:
+            self.canvas.coords(self.empty_window, self.width // 2, 0)
+            self.canvas.itemconfigure(
+                self.empty_window,
+                state="hidden" if self.items else "normal"
+            )
+
+    def _add_row(self):
+        """Ajoute un widget de ligne au réservoir"""
+        widget = self.create_row(self.canvas)
+        window = self.canvas.create_window(
+            self.MARGE, 0,
+            window=widget,
+            anchor="nw",
+            width=max(self.width - 2 * self.MARGE, 1),
+            height=self.row_height - self.MARGE,
+            state="hidden"
+        )
+        self.rows.append((window, widget))
+        self.bound.append(None)
+
+    def _update_scrollregion(self):
+        """Ajuste la zone de défilement à la hauteur virtuelle de la liste"""
+        total = max(len(self.items) * self.row_height, 1)
+        self.canvas.configure(scrollregion=(0, 0, self.width, total))
+
+    def _on_configure(self, event):
+        """Adapte la largeur des lignes et leur nombre à la taille du canvas"""
+        self.width = event.width
+        for window, widget in self.rows:
+            self.canvas.itemconfigure(window, width=max(self.width - 2 * self.MARGE, 1))
+        self._update_scrollregion()
+        self.refresh()
+
+    def _on_scroll(self, first, last):
+        """Synchronise la scrollbar et recycle les lignes après un défilement"""
+        self.scrollbar.set(first, last)
+        self.refresh()
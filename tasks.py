@@ -4,31 +4,70 @@ Gestionnaire de tâches complet avec toutes les fonctionnalités
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-import json
-import os
-from datetime import datetime
-from styles import ToolTip, add_placeholder
+from tkinter import ttk, messagebox, simpledialog
+from styles import ToolTip, VirtualList, add_placeholder
+from core import TaskStore, days_range, open_task_backend, today_range, week_range
+from loader import BackgroundExport, Debouncer, load_in_background
 
 class TaskManager:
     """Classe principale du gestionnaire de tâches"""
 
+    # Hauteur fixe d'une ligne de tâche dans la liste virtualisée
+    ROW_HEIGHT = 44
+
+    # Délai (ms) après la dernière frappe avant de lancer la recherche
+    SEARCH_DELAY = 150
+
+    # Filtres de période proposés (libellé -> fonction retournant [début, fin[)
+    DATE_FILTERS = {
+        "📅 Toutes les dates": None,
+        "📅 Aujourd'hui": today_range,
+        "📅 Cette semaine": week_range,
+        "📅 Période...": "custom",
+    }
+
+    # Tris proposés : libellé -> [(clé, décroissant), ...] appliqués dans l'ordre
+    SORT_CHOICES = [
+        ("↩️ Ordre d'ajout", []),
+        ("📅 Par date (récent → ancien)", [("date", True)]),
+        ("📅 Par date (ancien → récent)", [("date", False)]),
+        ("🔤 Alphabétique (A → Z)", [("alpha", False)]),
+        ("🔤 Alphabétique (Z → A)", [("alpha", True)]),
+        ("✅ Terminées d'abord", [("completed", True)]),
+        ("⭕ Non terminées d'abord", [("completed", False)]),
+        ("⭐ Non terminées, récentes, puis A → Z",
+         [("completed", False), ("date", True), ("alpha", False)]),
+    ]
+
     def __init__(self, parent, config):
         self.parent = parent
         self.config = config
-        self.tasks = []
         self.filtered_tasks = []
         self.fichier_taches = "taches.json"
 
-        # Charger d'abord
-        self.load_tasks()
+        # Données, index, tri et compteurs (core.TaskStore, sans Tk) ;
+        # le tri choisi est mémorisé dans les paramètres
+        self.store = TaskStore(
+            open_task_backend(config, self.fichier_taches),
+            settings=config.parametres,
+            on_error=self.on_save_error
+        )
+        self.date_range = None
+        self.loading = False
+
+        # La recherche part après SEARCH_DELAY ms sans frappe
+        self.filter_debounce = Debouncer(self.parent, self.SEARCH_DELAY, self.update_display)
 
-        # Ensuite créer l'interface
+        # Créer d'abord l'interface (affichée tout de suite)
         self.setup_ui()
 
-        # Enfin afficher
+        # Puis charger les données en arrière-plan
+        self.load_tasks()
         self.update_display()
 
+        # Les lignes recyclées ont des couleurs qui dépendent de l'état
+        self.config.on_theme_change(self.apply_theme)
+
     def setup_ui(self):
         """Configure l'interface utilisateur complète"""
         # Titre principal
@@ -39,6 +78,7 @@ class TaskManager:
             bg=self.config.style["fond"],
             fg=self.config.style["texte"]
         )
+        self.config.themed(title, bg="fond", fg="texte")
         title.pack(pady=(0, 20))
 
         # Frame pour ajouter une tâche
@@ -54,7 +94,7 @@ class TaskManager:
         self.setup_stats_frame()
 
         # Maintenant on peut ajouter le trace pour la recherche
-        self.search_var.trace_add("write", lambda *args: self.filter_tasks())
+        self.search_var.trace_add("write", lambda *args: self.filter_debounce.schedule())
 
     def setup_add_task_frame(self):
         """Frame d'ajout de tâche"""
@@ -64,6 +104,7 @@ class TaskManager:
             relief="groove",
             bd=2
         )
+        self.config.themed(frame, bg="cadre")
         frame.pack(fill="x", pady=(0, 10), padx=5)
 
         # Label
@@ -74,6 +115,7 @@ class TaskManager:
             bg=self.config.style["cadre"],
             fg=self.config.style["texte"]
         )
+        self.config.themed(label, bg="cadre", fg="texte")
         label.pack(side="left", padx=10, pady=10)
 
         # Entry pour saisir la tâche
@@ -94,16 +136,19 @@ class TaskManager:
             padx=15,
             pady=5
         )
+        self.config.themed(btn_add, bg="accent")
         btn_add.pack(side="left", padx=10, pady=10)
         ToolTip(btn_add, "Ajouter une nouvelle tâche (Entrée)")
 
     def setup_filter_frame(self):
         """Frame de recherche et filtres"""
         frame = tk.Frame(self.parent, bg=self.config.style["fond"])
+        self.config.themed(frame, bg="fond")
         frame.pack(fill="x", pady=(0, 10))
 
         # Frame de recherche
         search_frame = tk.Frame(frame, bg=self.config.style["fond"])
+        self.config.themed(search_frame, bg="fond")
         search_frame.pack(side="left", fill="x", expand=True)
 
         # Entry de recherche (sans trace d'abord)
@@ -118,8 +163,23 @@ class TaskManager:
         self.search_entry.pack(side="left", padx=5)
         add_placeholder(self.search_entry, "🔍 Rechercher une tâche...")
 
+        # Filtre par période
+        labels = list(self.DATE_FILTERS)
+        self.date_filter = ttk.Combobox(
+            search_frame,
+            values=labels,
+            state="readonly",
+            width=18,
+            font=self.config.POLICE
+        )
+        self.date_filter.set(labels[0])
+        self.date_filter_label = labels[0]
+        self.date_filter.pack(side="left", padx=5)
+        self.date_filter.bind("<<ComboboxSelected>>", lambda e: self.select_date_filter())
+
         # Boutons d'action
         btn_frame = tk.Frame(frame, bg=self.config.style["fond"])
+        self.config.themed(btn_frame, bg="fond")
         btn_frame.pack(side="right")
 
         # Bouton trier
@@ -135,9 +195,27 @@ class TaskManager:
             padx=10,
             pady=5
         )
+        self.config.themed(btn_sort, bg="bouton", fg="texte")
         btn_sort.pack(side="left", padx=2)
         ToolTip(btn_sort, "Trier les tâches par date, nom ou état")
 
+        # Bouton export Excel
+        btn_export = tk.Button(
+            btn_frame,
+            text="📊 Exporter en Excel",
+            command=self.export_excel,
+            font=self.config.POLICE,
+            bg=self.config.style["bouton"],
+            fg=self.config.style["texte"],
+            relief="flat",
+            cursor="hand2",
+            padx=10,
+            pady=5
+        )
+        self.config.themed(btn_export, bg="bouton", fg="texte")
+        btn_export.pack(side="left", padx=2)
+        ToolTip(btn_export, "Exporter les tâches affichées dans un classeur Excel")
+
         # Bouton supprimer terminées
         btn_clear = tk.Button(
             btn_frame,
@@ -151,6 +229,7 @@ class TaskManager:
             padx=10,
             pady=5
         )
+        self.config.themed(btn_clear, bg="danger")
         btn_clear.pack(side="left", padx=2)
         ToolTip(btn_clear, "Supprimer toutes les tâches terminées")
 
@@ -167,12 +246,14 @@ class TaskManager:
             padx=10,
             pady=5
         )
+        self.config.themed(btn_clear_all, bg="danger")
         btn_clear_all.pack(side="left", padx=2)
         ToolTip(btn_clear_all, "Supprimer TOUTES les tâches")
 
     def setup_tasks_list_frame(self):
-        """Frame avec scrollbar pour les tâches"""
+        """Frame avec scrollbar pour les tâches (liste virtualisée)"""
         container = tk.Frame(self.parent, bg=self.config.style["fond"])
+        self.config.themed(container, bg="fond")
         container.pack(fill="both", expand=True, pady=(0, 10))
 
         # Canvas avec scrollbar
@@ -181,24 +262,30 @@ class TaskManager:
             bg=self.config.style["fond"],
             highlightthickness=0
         )
-        scrollbar = ttk.Scrollbar(
-            container,
-            orient="vertical",
-            command=self.canvas.yview
+        self.config.themed(self.canvas, bg="fond")
+        scrollbar = ttk.Scrollbar(container, orient="vertical")
+
+        # Message affiché quand aucune tâche n'est visible
+        self.no_task_label = tk.Label(
+            self.canvas,
+            text="📭 Aucune tâche à afficher",
+            font=("Segoe UI", 12),
+            bg=self.config.style["fond"],
+            fg=self.config.style["hover"],
+            pady=50
         )
-
-        # Frame interne pour les tâches
-        self.tasks_frame = tk.Frame(self.canvas, bg=self.config.style["fond"])
-
-        # Configurer le scroll
-        self.tasks_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.config.themed(self.no_task_label, bg="fond", fg="hover")
+
+        # Seules les lignes visibles ont des widgets, recyclés au défilement
+        self.task_list = VirtualList(
+            self.canvas,
+            scrollbar,
+            self.ROW_HEIGHT,
+            self.create_task_widget,
+            self.bind_task_widget,
+            empty_widget=self.no_task_label
         )
 
-        self.canvas.create_window((0, 0), window=self.tasks_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-
         # Pack
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -218,6 +305,7 @@ class TaskManager:
             relief="groove",
             bd=2
         )
+        self.config.themed(self.stats_frame, bg="cadre")
         self.stats_frame.pack(fill="x", pady=(0, 5))
 
         # Label des statistiques
@@ -229,6 +317,7 @@ class TaskManager:
             fg=self.config.style["texte"],
             pady=10
         )
+        self.config.themed(self.stats_label, bg="cadre", fg="texte")
         self.stats_label.pack()
 
         # Barre de progression
@@ -242,209 +331,257 @@ class TaskManager:
         )
         self.progress_bar.pack(pady=5)
 
+        # Progression de l'export Excel (affichée seulement pendant un export)
+        export_label = tk.Label(
+            self.stats_frame,
+            text="",
+            font=("Segoe UI", 9),
+            bg=self.config.style["cadre"],
+            fg=self.config.style["hover"]
+        )
+        self.config.themed(export_label, bg="cadre", fg="hover")
+        export_bar = ttk.Progressbar(
+            self.stats_frame,
+            maximum=100,
+            length=400,
+            mode='determinate'
+        )
+
+        def show_export():
+            export_label.pack()
+            export_bar.pack(pady=(0, 5))
+
+        def hide_export():
+            export_label.pack_forget()
+            export_bar.pack_forget()
+
+        self.export = BackgroundExport(export_label, export_bar, "tâches", show_export, hide_export)
+
     def add_task(self):
         """Ajoute une nouvelle tâche"""
         text = self.task_entry.get().strip()
 
         # Vérifier que le texte n'est pas vide ou le placeholder
-        if not text or text == "🔍 Rechercher une tâche...":
+        if not text or text == "🔍 Rechercher une tâche..." or self.loading:
             return
 
-        # Créer la tâche
-        task = {
-            "id": len(self.tasks),
-            "text": text,
-            "completed": False,
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M")
-        }
+        if self.store.read_only:
+            messagebox.showwarning("Attention", "Les tâches n'ont pas pu être chargées : "
+                                                "l'ajout est désactivé")
+            return
 
-        self.tasks.append(task)
         self.task_entry.delete(0, 'end')
-        self.save_tasks()
-        self.update_display()
+        task, position = self.store.add(text)
+
+        # Une seule ligne ajoutée, à sa place dans l'ordre affiché
+        if position is not None and not self.filters_active():
+            self.task_list.insert(position, task)
+        elif position is None or self.matches_filters(task):
+            self.update_display()
+        self.update_stats()
 
     def toggle_task(self, task_id):
         """Change l'état d'une tâche (terminée/non terminée)"""
-        for task in self.tasks:
-            if task["id"] == task_id:
-                task["completed"] = not task["completed"]
-                break
+        task, move = self.store.toggle(task_id)
+        if task is None:
+            return
 
-        self.save_tasks()
-        self.update_display()
+        if move is None or move == (None, None):
+            # Seule la ligne de cette tâche change de style
+            self.task_list.update_item(task)
+        elif self.filters_active():
+            self.update_display()
+        elif move[0] != move[1]:
+            # La tâche change de place dans l'ordre affiché
+            self.task_list.remove(task)
+            self.task_list.insert(move[1], task)
+        else:
+            self.task_list.update_item(task)
+        self.update_stats()
 
     def delete_task(self, task_id):
         """Supprime une tâche spécifique"""
         if messagebox.askyesno("Confirmation", "Supprimer cette tâche ?"):
-            self.tasks = [t for t in self.tasks if t["id"] != task_id]
-            self.save_tasks()
-            self.update_display()
+            task = self.store.delete(task_id)
+            if task is None:
+                return
+
+            # Retirer uniquement la ligne concernée
+            self.task_list.remove(task)
+            self.update_stats()
 
     def clear_completed(self):
         """Supprime toutes les tâches terminées"""
-        completed = [t for t in self.tasks if t["completed"]]
+        if self.loading:
+            return
+
+        count = self.store.stats.completed
 
-        if not completed:
+        if not count:
             messagebox.showinfo("Information", "Aucune tâche terminée à supprimer")
             return
 
         if messagebox.askyesno("Confirmation",
-                               f"Supprimer {len(completed)} tâche(s) terminée(s) ?"):
-            self.tasks = [t for t in self.tasks if not t["completed"]]
-            self.save_tasks()
+                               f"Supprimer {count} tâche(s) terminée(s) ?"):
+            count = self.store.clear_completed()
             self.update_display()
-            messagebox.showinfo("Succès", f"{len(completed)} tâche(s) supprimée(s)")
+            messagebox.showinfo("Succès", f"{count} tâche(s) supprimée(s)")
 
     def clear_all_tasks(self):
         """Supprime TOUTES les tâches"""
-        if not self.tasks:
+        if self.loading:
+            return
+
+        if not self.store.tasks:
             messagebox.showinfo("Information", "Aucune tâche à supprimer")
             return
 
         if messagebox.askyesno("⚠️ ATTENTION",
-                               f"Supprimer TOUTES les {len(self.tasks)} tâches ?\n\nCette action est irréversible !"):
-            count = len(self.tasks)
-            self.tasks = []
-            self.save_tasks()
+                               f"Supprimer TOUTES les {len(self.store.tasks)} tâches ?\n\nCette action est irréversible !"):
+            count = self.store.clear_all()
             self.update_display()
             messagebox.showinfo("Succès", f"{count} tâche(s) supprimée(s)")
 
-    def filter_tasks(self):
-        """Filtre les tâches selon la recherche"""
-        search = self.search_var.get().lower().strip()
-
-        if not search or search == "🔍 rechercher une tâche...":
-            self.filtered_tasks = self.tasks
+    def get_search(self):
+        """Retourne le texte recherché (vide si placeholder)"""
+        search = self.search_var.get().strip()
+        if search == "🔍 Rechercher une tâche...":
+            return ""
+        return search
+
+    def filters_active(self):
+        """Vrai si une recherche ou une période restreint la liste"""
+        return self.date_range is not None or bool(self.get_search())
+
+    def matches_filters(self, task):
+        """Indique si une tâche correspond à la recherche et à la période en cours"""
+        return self.store.matches(task, self.get_search(), self.date_range)
+
+    def select_date_filter(self):
+        """Applique la période choisie dans la liste"""
+        choice = self.DATE_FILTERS[self.date_filter.get()]
+        if choice == "custom":
+            date_range = self.ask_date_range()
+            if date_range is None:
+                # Annulé : on revient au filtre précédent
+                self.date_filter.set(self.date_filter_label)
+                return
+            self.date_range = date_range
         else:
-            self.filtered_tasks = [
-                t for t in self.tasks
-                if search in t["text"].lower()
-            ]
+            self.date_range = choice() if choice else None
 
+        self.date_filter_label = self.date_filter.get()
         self.update_display()
 
+    def ask_date_range(self):
+        """Demande une période personnalisée (jours inclus)"""
+        first = simpledialog.askstring("Période", "Du (AAAA-MM-JJ) :", parent=self.parent)
+        if not first:
+            return None
+        last = simpledialog.askstring("Période", "Au (AAAA-MM-JJ) :",
+                                      initialvalue=first, parent=self.parent)
+        if not last:
+            return None
+        try:
+            return days_range(first, last)
+        except ValueError as e:
+            messagebox.showerror("Erreur", f"Période invalide: {e}")
+            return None
+
     def show_sort_menu(self):
-        """Affiche le menu de tri"""
+        """Affiche le menu de tri (le tri en cours est coché)"""
         menu = tk.Menu(self.parent, tearoff=0)
-        menu.add_command(label="📅 Par date (récent → ancien)",
-                        command=lambda: self.sort_tasks("date_desc"))
-        menu.add_command(label="📅 Par date (ancien → récent)",
-                        command=lambda: self.sort_tasks("date_asc"))
-        menu.add_command(label="🔤 Alphabétique (A → Z)",
-                        command=lambda: self.sort_tasks("alpha_asc"))
-        menu.add_command(label="🔤 Alphabétique (Z → A)",
-                        command=lambda: self.sort_tasks("alpha_desc"))
-        menu.add_command(label="✅ Terminées d'abord",
-                        command=lambda: self.sort_tasks("completed"))
-        menu.add_command(label="⭕ Non terminées d'abord",
-                        command=lambda: self.sort_tasks("active"))
+        for label, spec in self.SORT_CHOICES:
+            if [list(key) for key in spec] == [list(key) for key in self.store.sort_engine.spec]:
+                label = f"✓ {label}"
+            menu.add_command(label=label, command=lambda spec=spec: self.sort_tasks(spec))
 
         try:
             menu.tk_popup(self.parent.winfo_pointerx(), self.parent.winfo_pointery())
         finally:
             menu.grab_release()
 
-    def sort_tasks(self, sort_type):
-        """Trie les tâches selon le type"""
-        if sort_type == "date_desc":
-            self.tasks.sort(key=lambda x: x["date"], reverse=True)
-        elif sort_type == "date_asc":
-            self.tasks.sort(key=lambda x: x["date"])
-        elif sort_type == "alpha_asc":
-            self.tasks.sort(key=lambda x: x["text"].lower())
-        elif sort_type == "alpha_desc":
-            self.tasks.sort(key=lambda x: x["text"].lower(), reverse=True)
-        elif sort_type == "completed":
-            self.tasks.sort(key=lambda x: x["completed"], reverse=True)
-        elif sort_type == "active":
-            self.tasks.sort(key=lambda x: x["completed"])
-
-        self.save_tasks()
+    def sort_tasks(self, spec):
+        """
+        Change l'ordre d'affichage
+
+        Les tâches ne sont ni retriées ni réécrites : seul le tri choisi
+        est mémorisé dans les paramètres.
+        """
+        self.store.set_sort(spec)
         self.update_display()
 
     def update_display(self):
-        """Met à jour l'affichage complet"""
-        # Vider le frame
-        for widget in self.tasks_frame.winfo_children():
-            widget.destroy()
-
-        # Déterminer quelles tâches afficher
-        display_tasks = (self.filtered_tasks if hasattr(self, 'filtered_tasks')
-                        and self.filtered_tasks else self.tasks)
-
-        # Afficher les tâches
-        if not display_tasks:
-            no_task_label = tk.Label(
-                self.tasks_frame,
-                text="📭 Aucune tâche à afficher",
-                font=("Segoe UI", 12),
-                bg=self.config.style["fond"],
-                fg=self.config.style["hover"],
-                pady=50
-            )
-            no_task_label.pack()
-        else:
-            for task in display_tasks:
-                self.create_task_widget(task)
+        """Met à jour l'affichage complet (tri, filtre ou changement de thème)"""
+        # Squelette affiché pendant le chargement
+        if self.loading:
+            self.no_task_label.config(text="⏳ Chargement des tâches...")
+            self.filtered_tasks = []
+            self.task_list.set_items(self.filtered_tasks)
+            self.stats_label.config(text="⏳ Chargement...")
+            return
+        self.no_task_label.config(text="📭 Aucune tâche à afficher")
+
+        # Tâches à afficher (période puis recherche), dans l'ordre choisi
+        self.filtered_tasks = self.store.view(self.get_search(), self.date_range)
+
+        # La liste affichée est ensuite mise à jour ligne par ligne
+        # (ajout, bascule, suppression) sans reconstruction complète
+        self.task_list.set_items(self.filtered_tasks)
 
         # Mettre à jour les statistiques
         self.update_stats()
 
-    def create_task_widget(self, task):
-        """Crée un widget pour une tâche"""
+    def create_task_widget(self, parent):
+        """Crée un widget de ligne réutilisable pour une tâche"""
         frame = tk.Frame(
-            self.tasks_frame,
+            parent,
             bg=self.config.style["cadre"],
             relief="raised",
             bd=1
         )
-        frame.pack(fill="x", padx=5, pady=3)
+        self.config.themed(frame, bg="cadre")
+        frame.task_id = None
 
         # Checkbox
-        var = tk.BooleanVar(value=task["completed"])
+        frame.var = tk.BooleanVar(value=False)
         check = tk.Checkbutton(
             frame,
-            variable=var,
-            command=lambda: self.toggle_task(task["id"]),
+            variable=frame.var,
+            command=lambda: self.toggle_task(frame.task_id),
             bg=self.config.style["cadre"],
             activebackground=self.config.style["cadre"],
             cursor="hand2"
         )
+        self.config.themed(check, bg="cadre", activebackground="cadre")
         check.pack(side="left", padx=5)
 
         # Texte de la tâche
-        if task["completed"]:
-            text_style = ("Segoe UI", 10, "overstrike")
-            text_color = self.config.style["hover"]
-        else:
-            text_style = self.config.POLICE
-            text_color = self.config.style["texte"]
-
-        label = tk.Label(
+        frame.label = tk.Label(
             frame,
-            text=task["text"],
-            font=text_style,
+            text="",
+            font=self.config.POLICE,
             bg=self.config.style["cadre"],
-            fg=text_color,
+            fg=self.config.style["texte"],
             anchor="w"
         )
-        label.pack(side="left", fill="x", expand=True, padx=5, pady=8)
+        self.config.themed(frame.label, bg="cadre", fg="texte")
 
         # Date
-        date_label = tk.Label(
+        frame.date_label = tk.Label(
             frame,
-            text=task["date"],
+            text="",
             font=("Segoe UI", 8),
             bg=self.config.style["cadre"],
             fg=self.config.style["hover"]
         )
-        date_label.pack(side="left", padx=5)
+        self.config.themed(frame.date_label, bg="cadre", fg="hover")
 
         # Bouton supprimer
         btn_delete = tk.Button(
             frame,
             text="❌",
-            command=lambda: self.delete_task(task["id"]),
+            command=lambda: self.delete_task(frame.task_id),
             font=("Segoe UI", 9),
             bg=self.config.style["danger"],
             fg="white",
@@ -453,63 +590,106 @@ class TaskManager:
             padx=8,
             pady=2
         )
+        self.config.themed(btn_delete, bg="danger")
         btn_delete.pack(side="right", padx=5)
         ToolTip(btn_delete, "Supprimer cette tâche")
 
-    def update_stats(self):
-        """Met à jour les statistiques"""
-        total = len(self.tasks)
-        completed = len([t for t in self.tasks if t["completed"]])
-        remaining = total - completed
-
-        # Calculer le pourcentage
-        if total > 0:
-            percentage = (completed / total) * 100
-            self.progress_var.set(percentage)
+        frame.date_label.pack(side="right", padx=5)
+        frame.label.pack(side="left", fill="x", expand=True, padx=5)
+
+        return frame
+
+    def bind_task_widget(self, frame, task):
+        """Remplit une ligne recyclée avec les données d'une tâche"""
+        frame.task_id = task["id"]
+        frame.var.set(task["completed"])
+
+        # Texte de la tâche
+        if task["completed"]:
+            text_style = ("Segoe UI", 10, "overstrike")
+            text_color = self.config.style["hover"]
         else:
-            self.progress_var.set(0)
-            percentage = 0
+            text_style = self.config.POLICE
+            text_color = self.config.style["texte"]
+
+        frame.label.config(text=task["text"], font=text_style, fg=text_color)
+        frame.date_label.config(text=task["date"])
+
+    def update_stats(self):
+        """Met à jour les statistiques (compteurs tenus à jour, sans parcourir la liste)"""
+        stats = self.store.stats
+        self.progress_var.set(stats.percentage)
+        created_today, completed_today = stats.for_day()
 
         # Texte des statistiques
-        stats_text = (f"📊 Total: {total} | "
-                     f"✅ Terminées: {completed} | "
-                     f"⭕ Restantes: {remaining} | "
-                     f"📈 Progression: {percentage:.0f}%")
+        stats_text = (f"📊 Total: {stats.total} | "
+                     f"✅ Terminées: {stats.completed} | "
+                     f"⭕ Restantes: {stats.remaining} | "
+                     f"📈 Progression: {stats.percentage:.0f}% | "
+                     f"📅 Aujourd'hui: +{created_today} / ✓{completed_today}")
 
         self.stats_label.config(text=stats_text)
 
+    def export_excel(self):
+        """Exporte les tâches affichées (filtres et tri compris) en arrière-plan"""
+        if self.loading or self.export.running:
+            return
+        if not self.filtered_tasks:
+            messagebox.showwarning("Attention", "Aucune tâche à exporter")
+            return
+
+        filename = self.export.ask_filename("taches.xlsx")
+        if filename is None:
+            return
+
+        from core.export import export_tasks, task_rows
+
+        # Instantané pris ici : la liste peut changer pendant l'export
+        rows = task_rows(self.filtered_tasks)
+        self.export.run(lambda report: export_tasks(filename, rows, report),
+                        len(rows), "Tâches exportées avec succès!")
+
+    def apply_theme(self):
+        """Redessine les lignes visibles avec les couleurs du nouveau thème"""
+        self.task_list.set_items(self.filtered_tasks)
+
+    def close(self):
+        """Libère le stockage (la vue est retirée du cache)"""
+        self.config.remove_theme_listener(self.apply_theme)
+        self.filter_debounce.cancel()
+        self.store.close()
+
+    def on_save_error(self, error):
+        """Erreur d'écriture signalée par le magasin de tâches"""
+        messagebox.showerror("Erreur", f"Impossible de sauvegarder: {error}")
+
     def save_tasks(self):
-        """Sauvegarde les tâches dans un fichier JSON"""
-        try:
-            with open(self.fichier_taches, 'w', encoding='utf-8') as f:
-                json.dump(self.tasks, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Impossible de sauvegarder: {e}")
+        """Sauvegarde toutes les tâches (instantané écrit en arrière-plan)"""
+        self.store.save_all()
 
     def load_tasks(self):
-        """Charge les tâches depuis le fichier JSON"""
-        if os.path.exists(self.fichier_taches):
-            try:
-                with open(self.fichier_taches, 'r', encoding='utf-8') as f:
-                    self.tasks = json.load(f)
-
-                # Vérifier et corriger le format des tâches
-                for task in self.tasks:
-                    # Ajouter les clés manquantes
-                    if "id" not in task:
-                        task["id"] = self.tasks.index(task)
-                    if "completed" not in task:
-                        task["completed"] = False
-                    if "date" not in task:
-                        task["date"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-                    if "text" not in task:
-                        task["text"] = "Tâche sans titre"
-
-                # Sauvegarder le format corrigé
-                self.save_tasks()
-
-            except Exception as e:
-                messagebox.showerror("Erreur", f"Impossible de charger: {e}")
-                self.tasks = []
-        else:
-            self.tasks = []
\ No newline at end of file
+        """Charge les tâches en arrière-plan ; un squelette est affiché en attendant"""
+        self.loading = True
+        load_in_background(
+            self.canvas,
+            self.store.load,
+            self.on_tasks_loaded,
+            self.on_load_error
+        )
+
+    def on_tasks_loaded(self, migrated):
+        """Affiche les tâches une fois chargées (thread Tk)"""
+        self.loading = False
+
+        # Le fichier n'est réécrit que s'il vient d'être migré
+        if migrated:
+            self.save_tasks()
+        self.update_display()
+
+    def on_load_error(self, error):
+        """Erreur de chargement : liste vide en lecture seule (les fichiers ne sont pas écrasés)"""
+        messagebox.showerror("Erreur", f"Impossible de charger: {error}\n\n"
+                                       "Les tâches sont en lecture seule jusqu'au prochain démarrage.")
+        self.store.reset()
+        self.loading = False
+        self.update_display()
@@ -0,0 +1,138 @@
+"""Tests du journal des tâches : relecture, lignes interrompues, compactage"""
+
+import json
+import os
+
+import pytest
+
+import core.journal
+from core import TaskJournal
+
+
+def add_tasks(journal, tasks, texts):
+    """Ajoute des tâches à la collection et au journal"""
+    for text in texts:
+        task = tasks.add({"text": text, "completed": False, "date": "2024-05-01 10:00", "ts": 0})
+        journal.add(task)
+
+
+def reload(chemin):
+    """Relit les tâches avec un nouveau journal"""
+    journal = TaskJournal(chemin)
+    try:
+        return journal.load()
+    finally:
+        journal.close()
+
+
+def snapshot(tasks):
+    return [(t["id"], t["text"], t["completed"]) for t in tasks]
+
+
+def test_round_trip(tmp_path):
+    chemin = str(tmp_path / "taches.json")
+    journal = TaskJournal(chemin)
+    tasks = journal.load()
+    add_tasks(journal, tasks, ["a", "b", "c"])
+
+    tasks.get(1)["completed"] = True
+    journal.toggle(tasks.get(1))
+    tasks.remove(0)
+    journal.delete([0])
+    journal.close()
+
+    loaded = reload(chemin)
+    assert snapshot(loaded) == [(1, "b", True), (2, "c", False)]
+    assert loaded.next_id == 3
+
+
+def test_torn_line_is_cut(tmp_path):
+    chemin = str(tmp_path / "taches.json")
+    journal = TaskJournal(chemin)
+    tasks = journal.load()
+    add_tasks(journal, tasks, ["a", "b"])
+    journal.close()
+
+    # Arrêt brutal au milieu d'une écriture
+    with open(chemin + ".journal", "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "task": {"id": 2, "te')
+
+    journal = TaskJournal(chemin)
+    tasks = journal.load()
+    assert snapshot(tasks) == [(0, "a", False), (1, "b", False)]
+    with open(chemin + ".journal", "rb") as f:
+        assert f.read().endswith(b"}\n")
+
+    add_tasks(journal, tasks, ["c"])
+    journal.close()
+    assert [t["text"] for t in reload(chemin)] == ["a", "b", "c"]
+
+
+def test_append_after_missing_newline(tmp_path):
+    chemin = str(tmp_path / "taches.json")
+    record = {"op": "add", "task": {"id": 0, "text": "a", "completed": False}}
+    with open(chemin + ".journal", "w", encoding="utf-8") as f:
+        f.write(json.dumps(record))
+
+    journal = TaskJournal(chemin)
+    tasks = journal.load()
+    add_tasks(journal, tasks, ["b"])
+    journal.close()
+    assert [t["text"] for t in reload(chemin)] == ["a", "b"]
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_compaction(tmp_path, background):
+    chemin = str(tmp_path / "taches.json")
+    journal = TaskJournal(chemin, seuil=5)
+    tasks = journal.load()
+    add_tasks(journal, tasks, [f"t{i}" for i in range(6)])
+    assert journal.needs_compaction()
+
+    journal.compact(tasks, background=background)
+    journal.wait()
+    assert not os.path.exists(chemin + ".journal")
+    assert not os.path.exists(chemin + ".journal.old")
+
+    # Les modifications suivantes repartent dans un journal vide
+    add_tasks(journal, tasks, ["après"])
+    journal.close()
+    assert snapshot(reload(chemin)) == snapshot(tasks)
+
+
+def test_interrupted_compaction_is_replayed(tmp_path):
+    chemin = str(tmp_path / "taches.json")
+    journal = TaskJournal(chemin)
+    tasks = journal.load()
+    add_tasks(journal, tasks, ["a", "b"])
+    journal.compact(tasks, background=False)
+
+    # Arrêt après l'instantané mais avant la suppression de journal.old :
+    # les enregistrements rejoués ne changent rien
+    add_tasks(journal, tasks, ["c"])
+    journal.close()
+    os.replace(chemin + ".journal", chemin + ".journal.old")
+    with open(chemin + ".journal.old", "a", encoding="utf-8") as f:
+        f.write(json.dumps({"op": "add", "task": dict(tasks.get(0))}) + "\n")
+
+    assert snapshot(reload(chemin)) == snapshot(tasks)
+
+
+def test_background_compaction_error_is_kept(tmp_path, monkeypatch):
+    chemin = str(tmp_path / "taches.json")
+    journal = TaskJournal(chemin)
+    tasks = journal.load()
+    add_tasks(journal, tasks, ["a", "b"])
+
+    def fail(*args, **kwargs):
+        raise OSError("disque plein")
+
+    monkeypatch.setattr(core.journal, "atomic_write_json", fail)
+    journal.compact(tasks)
+    with pytest.raises(OSError, match="disque plein"):
+        journal.close()
+
+    # Rien n'est perdu : journal.old est rejoué
+    monkeypatch.undo()
+    assert os.path.exists(chemin + ".journal.old")
+    assert snapshot(reload(chemin)) == snapshot(tasks)
@@ -0,0 +1,126 @@
+"""Tests des migrations : anciens fichiers vers le format 2, y compris après un arrêt brutal"""
+
+import json
+import os
+
+import pytest
+
+import core.backends
+from core import (SCHEMA_VERSION, Collection, JsonNoteBackend, NoteStore, ReadOnlyError,
+                  TaskJournal, TaskStore, to_timestamp)
+
+LEGACY_NOTES = [
+    {"id": 0, "title": "Courses", "content": "pain\nlait",
+     "date_created": "2024-01-02 10:00:00", "date_modified": "2024-01-03 11:00:00"},
+    {"title": "Sans id", "content": "texte", "date_created": "2024-02-01 09:30:00"},
+]
+
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_legacy_tasks_are_migrated_once(tmp_path):
+    chemin = str(tmp_path / "taches.json")
+    write_json(chemin, [{"id": 0, "text": "a", "completed": False, "date": "2024-03-04 08:15"},
+                        {"id": 0, "text": "b"}])
+
+    store = TaskStore(TaskJournal(chemin))
+    assert store.load() is True
+    store.save_all()
+    store.close()
+
+    data = read(chemin)
+    assert data["version"] == SCHEMA_VERSION
+    assert [t["id"] for t in data["tasks"]] == [0, 1]
+    assert data["tasks"][0]["ts"] == to_timestamp("2024-03-04 08:15")
+    assert data["tasks"][1]["completed"] is False
+
+    store = TaskStore(TaskJournal(chemin))
+    assert store.load() is False
+    store.close()
+
+
+def test_unmigrated_collection_keeps_its_version():
+    notes = Collection.from_json(LEGACY_NOTES, "notes")
+    assert notes.to_json("notes")["version"] == 0
+
+
+def check_migrated_notes(chemin):
+    """Les notes relues sont au format 2 et leur contenu est intact"""
+    store = NoteStore(JsonNoteBackend(chemin))
+    store.load()
+    notes = {note["title"]: note for note in store.notes}
+    assert notes["Courses"]["modified_ts"] == to_timestamp("2024-01-03 11:00:00")
+    assert notes["Sans id"]["created_ts"] == to_timestamp("2024-02-01 09:30:00")
+    assert store.get_content(notes["Courses"]) == "pain\nlait"
+    assert store.get_content(notes["Sans id"]) == "texte"
+    store.close()
+
+    data = read(chemin)
+    assert data["version"] == SCHEMA_VERSION
+    assert all("content" not in note for note in data["notes"])
+
+
+def test_legacy_notes_are_split_and_migrated(tmp_path):
+    chemin = str(tmp_path / "notes.json")
+    write_json(chemin, LEGACY_NOTES)
+    check_migrated_notes(chemin)
+    assert sorted(os.listdir(tmp_path / "notes")) == ["0.txt", "1.txt"]
+
+
+def test_interrupted_after_split(tmp_path):
+    chemin = str(tmp_path / "notes.json")
+    write_json(chemin, LEGACY_NOTES)
+
+    # Arrêt juste après le découpage, avant la migration de NoteStore.load
+    JsonNoteBackend(chemin).load()
+    check_migrated_notes(chemin)
+
+
+def test_interrupted_before_index(tmp_path, monkeypatch):
+    chemin = str(tmp_path / "notes.json")
+    write_json(chemin, LEGACY_NOTES)
+
+    # Arrêt après l'écriture des contenus, avant celle de l'index
+    def crash(self, data):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(core.backends.JsonNoteBackend, "_write_index", crash)
+    with pytest.raises(KeyboardInterrupt):
+        JsonNoteBackend(chemin).load()
+    monkeypatch.undo()
+
+    assert read(chemin) == LEGACY_NOTES
+    check_migrated_notes(chemin)
+
+
+def test_failed_load_is_read_only(tmp_path):
+    chemin = str(tmp_path / "notes.json")
+    store = NoteStore(JsonNoteBackend(chemin))
+    store.load()
+    store.save(None, "Existante", "à garder")
+    store.close()
+
+    # Index et sauvegardes illisibles
+    for path in [chemin] + [f"{chemin}.{g}" for g in range(1, 4)]:
+        if os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("{")
+
+    store = NoteStore(JsonNoteBackend(chemin))
+    with pytest.raises(ValueError):
+        store.load()
+    store.reset()
+    with pytest.raises(ReadOnlyError):
+        store.save(None, "Nouvelle", "écraserait 0.txt")
+    store.close()
+
+    with open(tmp_path / "notes" / "0.txt", encoding="utf-8") as f:
+        assert f.read() == "à garder"
@@ -0,0 +1,77 @@
+"""Tests des écritures atomiques et de la reprise sur les sauvegardes"""
+
+import os
+import stat
+
+import pytest
+
+import core.persistence
+from core import atomic_write_json, read_json
+
+
+def test_backups_rotate(tmp_path):
+    chemin = str(tmp_path / "data.json")
+    for version in range(5):
+        atomic_write_json(chemin, {"v": version}, backups=3)
+
+    assert read_json(chemin) == {"v": 4}
+    assert [read_json(f"{chemin}.{g}", backups=0) for g in (1, 2, 3)] == [
+        {"v": 3}, {"v": 2}, {"v": 1}]
+    assert not os.path.exists(f"{chemin}.4")
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_read_falls_back_to_backup(tmp_path):
+    chemin = str(tmp_path / "data.json")
+    atomic_write_json(chemin, {"v": 1})
+    atomic_write_json(chemin, {"v": 2})
+    with open(chemin, "w", encoding="utf-8") as f:
+        f.write('{"v": ')
+
+    assert read_json(chemin) == {"v": 1}
+    os.remove(chemin)
+    assert read_json(chemin) == {"v": 1}
+
+
+def test_read_without_valid_version(tmp_path):
+    chemin = str(tmp_path / "data.json")
+    with open(chemin, "w", encoding="utf-8") as f:
+        f.write("{")
+    with pytest.raises(ValueError):
+        read_json(chemin)
+    assert read_json(str(tmp_path / "absent.json"), default=[]) == []
+
+
+def test_crash_before_replace_keeps_target(tmp_path, monkeypatch):
+    chemin = str(tmp_path / "data.json")
+    atomic_write_json(chemin, {"v": 1})
+    replace = os.replace
+
+    def crash(source, target):
+        if target == chemin:
+            raise KeyboardInterrupt
+        replace(source, target)
+
+    monkeypatch.setattr(core.persistence.os, "replace", crash)
+    with pytest.raises(KeyboardInterrupt):
+        atomic_write_json(chemin, {"v": 2})
+    monkeypatch.undo()
+
+    assert read_json(chemin, backups=0) == {"v": 1}
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="droits POSIX")
+def test_permissions_are_kept(tmp_path):
+    chemin = str(tmp_path / "data.json")
+    atomic_write_json(chemin, {"v": 1})
+    os.chmod(chemin, 0o640)
+    atomic_write_json(chemin, {"v": 2})
+    assert stat.S_IMODE(os.stat(chemin).st_mode) == 0o640
+
+
+def test_text_is_written_as_is(tmp_path):
+    chemin = str(tmp_path / "note.txt")
+    core.persistence.atomic_write_text(chemin, "a\nb\n")
+    with open(chemin, "rb") as f:
+        assert f.read() == b"a\nb\n"
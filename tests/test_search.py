@@ -0,0 +1,84 @@
+"""Tests des index de recherche, comparés à une recherche exhaustive"""
+
+import random
+
+import pytest
+
+from core import InvertedIndex, NgramIndex, normalize, tokenize
+
+WORDS = ["réunion", "reunir", "rapport", "budget", "Été", "école", "ecrire",
+         "examen", "cours", "courses", "pain", "lait", "rendez", "revue"]
+
+
+def random_text(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+
+
+def brute_force_prefix(documents, query):
+    """Documents dont chaque mot de la requête est le préfixe d'un de leurs mots"""
+    terms = tokenize(query)
+    return {
+        doc_id for doc_id, fields in documents.items()
+        if terms and all(
+            any(token.startswith(term) for text in fields.values() for token in tokenize(text))
+            for term in terms
+        )
+    }
+
+
+@pytest.mark.parametrize("query", ["re", "reu", "réunion budget", "e", "cours", "ECOLE", "xyz", ""])
+def test_inverted_index_matches_brute_force(query):
+    rng = random.Random(11)
+    documents = {}
+    index = InvertedIndex({"title": 3.0, "content": 1.0})
+    index.build([])
+    for doc_id in range(300):
+        documents[doc_id] = {"title": random_text(rng), "content": random_text(rng)}
+        index.add(doc_id, **documents[doc_id])
+    for doc_id in rng.sample(sorted(documents), 60):
+        index.remove(doc_id)
+        del documents[doc_id]
+    for doc_id in rng.sample(sorted(documents), 60):
+        documents[doc_id] = {"title": random_text(rng), "content": random_text(rng)}
+        index.add(doc_id, **documents[doc_id])
+
+    assert set(index.search(query)) == brute_force_prefix(documents, query)
+
+    rebuilt = InvertedIndex({"title": 3.0, "content": 1.0})
+    rebuilt.build(documents.items())
+    assert set(rebuilt.search(query)) == brute_force_prefix(documents, query)
+
+
+def test_short_prefix_keeps_every_match():
+    index = InvertedIndex()
+    for doc_id in range(100):
+        index.add(doc_id, content=f"rea{doc_id:03d}")
+    index.add(999, content="reunion budget")
+
+    assert len(index.search("re")) == 101
+    assert 999 in index.search("re")
+
+
+def test_exact_word_ranks_first():
+    index = InvertedIndex()
+    index.add(0, content="courses")
+    index.add(1, content="cours")
+    assert index.search("cours") == [1, 0]
+    assert index.search("cours", limit=1) == [1]
+
+
+@pytest.mark.parametrize("query", ["ré", "REUNION", "on bu", "ole", "x", "", "examen cours"])
+def test_ngram_index_matches_substring(query):
+    rng = random.Random(5)
+    texts = {doc_id: random_text(rng) for doc_id in range(300)}
+    index = NgramIndex()
+    index.build(texts.items())
+    for doc_id in rng.sample(sorted(texts), 50):
+        index.remove(doc_id)
+        del texts[doc_id]
+    for doc_id in rng.sample(sorted(texts), 50):
+        texts[doc_id] = random_text(rng)
+        index.add(doc_id, texts[doc_id])
+
+    expected = {doc_id for doc_id, text in texts.items() if normalize(query) in normalize(text)}
+    assert index.search(query) == expected
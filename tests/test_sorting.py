@@ -0,0 +1,86 @@
+"""Tests des ordres d'affichage : mise à jour incrémentale comparée à un tri complet"""
+
+import random
+
+import pytest
+
+from core import Collection, SortedIndex, SortEngine, TaskStore
+
+SPECS = [
+    [],
+    [("date", True)],
+    [("alpha", False)],
+    [("completed", False)],
+    [("completed", True), ("date", True), ("alpha", False)],
+]
+
+
+def random_task(rng):
+    return {"text": rng.choice(["pain", "Lait", "école", "Banque", "zèbre"]),
+            "completed": rng.random() < 0.3, "ts": rng.randint(0, 20)}
+
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_sort_engine_incremental_matches_rebuild(spec):
+    rng = random.Random(7)
+    tasks = Collection()
+    for _ in range(50):
+        tasks.add(random_task(rng))
+
+    engine = SortEngine(TaskStore.SORT_KEYS, spec)
+    engine.order(tasks)
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.4:
+            task = tasks.add(random_task(rng))
+            position = engine.insert(task)
+            assert engine.order(tasks)[position] == task["id"]
+        elif action < 0.7 and len(tasks):
+            task = tasks.get(rng.choice(tasks.ids()))
+            task["completed"] = not task["completed"]
+            old, new = engine.update(task)
+            assert engine.order(tasks)[new] == task["id"]
+        elif len(tasks):
+            task_id = rng.choice(tasks.ids())
+            tasks.remove(task_id)
+            engine.remove(task_id)
+
+        rebuilt = SortEngine(TaskStore.SORT_KEYS, spec)
+        assert engine.order(tasks) == rebuilt.order(tasks)
+
+
+def test_sort_engine_is_stable():
+    tasks = Collection([{"text": "b", "completed": False, "ts": 1},
+                        {"text": "a", "completed": False, "ts": 1},
+                        {"text": "c", "completed": True, "ts": 1}])
+    engine = SortEngine(TaskStore.SORT_KEYS, [("date", True)])
+    assert engine.order(tasks) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sorted_index_matches_sorted(reverse):
+    rng = random.Random(3)
+    items = {}
+    index = SortedIndex(lambda item: item["key"], reverse=reverse)
+    index.build([])
+    for item_id in range(200):
+        if items and rng.random() < 0.3:
+            removed = rng.choice(list(items))
+            position = index.remove(removed)
+            expected = sorted(items, key=lambda i: (items[i]["key"], i), reverse=reverse)
+            assert expected[position] == removed
+            del items[removed]
+        else:
+            item = {"id": item_id, "key": rng.randint(0, 30)}
+            items[item_id] = item
+            position = index.insert(item)
+            assert index[position] == item_id
+
+        expected = sorted(items, key=lambda i: (items[i]["key"], i), reverse=reverse)
+        assert list(index) == expected
+        assert index[:10] == expected[:10]
+
+    low, high = 5, 12
+    assert index.between(low, high) == sorted(
+        (i for i, item in items.items() if low <= item["key"] < high),
+        key=lambda i: (items[i]["key"], i))